@@ -1,10 +1,13 @@
 #!/usr/bin/env python3
 
 import click
+import functools
 import ipaddress
 import json
 import syslog
-import operator
+import time
+import types
+from concurrent.futures import ThreadPoolExecutor
 
 import openconfig_acl
 import tabulate
@@ -13,6 +16,7 @@ from natsort import natsorted
 from sonic_py_common import multi_asic
 from swsscommon.swsscommon import SonicV2Connector, ConfigDBConnector
 from utilities_common.general import load_db_config
+from utilities_common.bulk_db import bulk_set_entries
 
 def info(msg):
     click.echo(click.style("Info: ", fg='cyan') + click.style(str(msg), fg='green'))
@@ -39,6 +43,55 @@ def deep_update(dst, src):
     return dst
 
 
+def rule_to_raw(rule):
+    """ Convert the rule fields to their CONFIG_DB string values, for comparison """
+    return {field: ",".join(map(str, value)) if isinstance(value, list) else str(value)
+            for field, value in rule.items()}
+
+
+class AclRuleDiff(object):
+    """
+    Keyed diff of the ACL rules in CONFIG_DB and the rules to commit.
+    The rules which are unchanged are not written.
+    """
+
+    def __init__(self, current_rules, new_rules):
+        self.current_rules = current_rules
+        self.new_rules = new_rules
+        self.added = []
+        self.modified = []
+        self.removed = [key for key in current_rules if key not in new_rules]
+        self.unchanged = 0
+        for key, rule in new_rules.items():
+            if key not in current_rules:
+                self.added.append(key)
+            elif rule_to_raw(rule) != rule_to_raw(current_rules[key]):
+                self.modified.append(key)
+            else:
+                self.unchanged += 1
+
+    def num_changes(self):
+        return len(self.added) + len(self.modified) + len(self.removed)
+
+    def commit(self, configdb, table):
+        """
+        Write the changes to a CONFIG_DB, removed rules first, then modified and added ones,
+        each group with chunked pipelines
+
+        Returns:
+            time taken in seconds
+        """
+        start = time.time()
+        if self.removed:
+            bulk_set_entries(configdb, table, {key: None for key in self.removed})
+        if self.modified:
+            bulk_set_entries(configdb, table, {key: self.new_rules[key] for key in self.modified},
+                             current=self.current_rules)
+        if self.added:
+            bulk_set_entries(configdb, table, {key: self.new_rules[key] for key in self.added})
+        return time.time() - start
+
+
 class AclAction:
     """ namespace for ACL action keys """
 
@@ -122,6 +175,7 @@ class AclLoader(object):
         self.current_table = None
         self.tables_db_info = {}
         self.rules_db_info = {}
+        self.appl_db_rules = set()
         self.rules_info = {}
         self.tables_state_info = None
         self.rules_state_info = None
@@ -247,6 +301,7 @@ class AclLoader(object):
                 # Shouldn't be hit, table is either programmed to APPL or CONFIG DB
                 continue
             self.rules_db_info[(tid, rid)] = self.appldb.get_all(self.appldb.APPL_DB, app_acl_rule)
+            self.appl_db_rules.add((tid, rid))
 
     def get_rules_db_info(self):
         return self.rules_db_info
@@ -446,13 +501,19 @@ class AclLoader(object):
                 raise AclLoaderException("Invalid input file %s" % filename)
         return yang_acl
 
-    def load_rules_from_file(self, filename, skip_action_validation=False):
+    def load_rules_from_file(self, filename, skip_action_validation=False, fast_convert=False):
         """
         Load file with ACL rules configuration in openconfig ACL format. Convert rules
         to Config DB schema.
         :param filename: File in openconfig ACL format
+        :param fast_convert: parse the file with OcAclJsonParser instead of the pyangbind bindings
         :return:
         """
+        if fast_convert:
+            self.yang_acl = None
+            self.convert_rules(skip_action_validation, OcAclJsonParser.load(filename))
+            return
+
         self.yang_acl = AclLoader.parse_acl_json(filename)
         self.convert_rules(skip_action_validation)
 
@@ -799,14 +860,31 @@ class AclLoader(object):
             return {}  # Don't add default deny rule if table is not [L3, L3V6]
         return rule_data
 
-    def convert_rules(self, skip_aciton_validation=False):
+    def iter_yang_acl_sets(self):
+        """
+        Iterate the ACL sets of the pyangbind ACL object
+        :return: generator of (ACL set name, generator of (ACL entry name, ACL entry object))
+        """
+        def iter_acl_entries(acl_entries):
+            for acl_entry_name in acl_entries:
+                yield acl_entry_name, acl_entries[acl_entry_name]
+
+        for acl_set_name in self.yang_acl.acl.acl_sets.acl_set:
+            acl_set = self.yang_acl.acl.acl_sets.acl_set[acl_set_name]
+            yield acl_set_name, iter_acl_entries(acl_set.acl_entries.acl_entry)
+
+    def convert_rules(self, skip_aciton_validation=False, acl_sets=None):
         """
         Convert rules in openconfig ACL format to Config DB schema
+        :param acl_sets: ACL sets returned by OcAclJsonParser.load(), the ACL sets of
+            the pyangbind ACL object are converted if not given
         :return:
         """
-        for acl_set_name in self.yang_acl.acl.acl_sets.acl_set:
+        if acl_sets is None:
+            acl_sets = self.iter_yang_acl_sets()
+
+        for acl_set_name, acl_entries in acl_sets:
             table_name = acl_set_name.replace(" ", "_").replace("-", "_").upper()
-            acl_set = self.yang_acl.acl.acl_sets.acl_set[acl_set_name]
 
             if not self.is_table_valid(table_name):
                 warning("%s table does not exist" % (table_name))
@@ -815,8 +893,7 @@ class AclLoader(object):
             if self.current_table is not None and self.current_table != table_name:
                 continue
 
-            for acl_entry_name in acl_set.acl_entries.acl_entry:
-                acl_entry = acl_set.acl_entries.acl_entry[acl_entry_name]
+            for acl_entry_name, acl_entry in acl_entries:
                 try:
                     rule = self.convert_rule_to_db_schema(table_name, acl_entry, skip_aciton_validation)
                     deep_update(self.rules_info, rule)
@@ -826,26 +903,67 @@ class AclLoader(object):
             if not self.is_table_egress(table_name):
                 deep_update(self.rules_info, self.deny_rule(table_name))
 
-    def full_update(self):
+    def get_current_rules(self, namespace, configdb, table_name=None):
         """
-        Perform full update of ACL rules configuration. All existing rules
-        will be removed. New rules loaded from file will be installed. If
-        the current_table is not empty, only rules within that table will
-        be removed and new rules in that table will be installed.
+        Get the ACL rules in a config DB to diff the new rules against
+        :param namespace: namespace of the config DB, "" for the host config DB
+        :param configdb: the config DB
+        :param table_name: only the rules of this table are returned if given
+        :return: rules in config DB schema
+        """
+        if namespace:
+            # A front asic config DB is diffed against its own rules, so that it is
+            # repaired if it drifted from the host config DB
+            rules = configdb.get_table(self.ACL_RULE)
+        else:
+            # Rules programmed to APPL_DB are not in config DB
+            rules = {key: rule for key, rule in self.rules_db_info.items() if key not in self.appl_db_rules}
+        return {key: rule for key, rule in rules.items() if table_name is None or table_name == key[0]}
+
+    def commit_rules(self, new_rules, table_name=None):
+        """
+        Commit the rules to ACL_RULE of the config DB and of the per front asic namespace
+        config DBs. The rules in a config DB which are not in new_rules are removed, only the
+        rules which changed in it are written. The namespaces are committed concurrently.
+        :param new_rules: rules in config DB schema
+        :param table_name: only the rules of this table are replaced if given
         :return:
         """
-        for key in self.rules_db_info:
-            if self.current_table is None or self.current_table == key[0]:
-                self.configdb.mod_entry(self.ACL_RULE, key, None)
-                # Program for per front asic namespace also if present
-                for namespace_configdb in self.per_npu_configdb.values():
-                    namespace_configdb.mod_entry(self.ACL_RULE, key, None)
+        configdbs = {"": self.configdb}
+        if self.per_npu_configdb:
+            configdbs.update(self.per_npu_configdb)
+
+        def commit(namespace, configdb):
+            diff = AclRuleDiff(self.get_current_rules(namespace, configdb, table_name), new_rules)
+            return diff, diff.commit(configdb, self.ACL_RULE)
+
+        start = time.time()
+        with ThreadPoolExecutor(max_workers=len(configdbs)) as executor:
+            futures = {namespace: executor.submit(commit, namespace, configdb)
+                       for namespace, configdb in configdbs.items()}
+            results = {namespace: future.result() for namespace, future in futures.items()}
+        total_elapsed = time.time() - start
+
+        num_changes = sum(diff.num_changes() for diff, _ in results.values())
+        if not num_changes:
+            info("ACL rules are up to date, {} rules unchanged".format(results[""][0].unchanged))
+            return
 
+        for namespace, (diff, seconds) in results.items():
+            info("ACL rules of {}: {} added, {} modified, {} removed, {} unchanged, committed in {:.3f}s".format(
+                namespace or "host config DB", len(diff.added), len(diff.modified), len(diff.removed),
+                diff.unchanged, seconds))
+        info("Committed {} rule changes to {} config DB(s) in {:.3f}s, {:.0f} rules/s".format(
+            num_changes, len(configdbs), total_elapsed, num_changes / max(total_elapsed, 1e-6)))
 
-        self.configdb.mod_config({self.ACL_RULE: self.rules_info})
-        # Program for per front asic namespace also if present
-        for namespace_configdb in self.per_npu_configdb.values():
-            namespace_configdb.mod_config({self.ACL_RULE: self.rules_info})
+    def full_update(self):
+        """
+        Perform full update of ACL rules configuration. All existing rules
+        will be replaced by the rules loaded from file. If the current_table
+        is not empty, only rules within that table will be replaced.
+        :return:
+        """
+        self.commit_rules(self.rules_info, self.current_table)
 
     def incremental_update(self):
         """
@@ -854,73 +972,7 @@ class AclLoader(object):
         modifications.
         :return:
         """
-
-        # TODO: Until we test ASIC behavior, we cannot assume that we can insert
-        # dataplane ACLs and shift existing ACLs. Therefore, we perform a full
-        # update on dataplane ACLs, and only perform an incremental update on
-        # control plane ACLs.
-
-        new_rules = set(self.rules_info.keys())
-        new_dataplane_rules = set()
-        new_controlplane_rules = set()
-        current_rules = set(self.rules_db_info.keys())
-        current_dataplane_rules = set()
-        current_controlplane_rules = set()
-
-        for key in new_rules:
-            table_name = key[0]
-            if self.tables_db_info[table_name]['type'].upper() == self.ACL_TABLE_TYPE_CTRLPLANE:
-                new_controlplane_rules.add(key)
-            else:
-                new_dataplane_rules.add(key)
-
-        for key in current_rules:
-            table_name = key[0]
-            if self.tables_db_info[table_name]['type'].upper() == self.ACL_TABLE_TYPE_CTRLPLANE:
-                current_controlplane_rules.add(key)
-            else:
-                current_dataplane_rules.add(key)
-
-        # Remove all existing dataplane rules
-        for key in current_dataplane_rules:
-            self.configdb.mod_entry(self.ACL_RULE, key, None)
-            # Program for per-asic namespace also if present
-            for namespace_configdb in self.per_npu_configdb.values():
-                namespace_configdb.mod_entry(self.ACL_RULE, key, None)
-
-
-        # Add all new dataplane rules
-        for key in new_dataplane_rules:
-            self.configdb.mod_entry(self.ACL_RULE, key, self.rules_info[key])
-            # Program for per-asic namespace corresponding to front asic also if present.
-            for namespace_configdb in self.per_npu_configdb.values():
-                namespace_configdb.mod_entry(self.ACL_RULE, key, self.rules_info[key])
-
-        added_controlplane_rules = new_controlplane_rules.difference(current_controlplane_rules)
-        removed_controlplane_rules = current_controlplane_rules.difference(new_controlplane_rules)
-        existing_controlplane_rules = new_rules.intersection(current_controlplane_rules)
-
-        for key in added_controlplane_rules:
-            self.configdb.mod_entry(self.ACL_RULE, key, self.rules_info[key])
-            # Program for per-asic namespace corresponding to front asic also if present.
-            # For control plane ACL it's not needed but to keep all db in sync program everywhere
-            for namespace_configdb in self.per_npu_configdb.values():
-                namespace_configdb.mod_entry(self.ACL_RULE, key, self.rules_info[key])
-
-        for key in removed_controlplane_rules:
-            self.configdb.mod_entry(self.ACL_RULE, key, None)
-            # Program for per-asic namespace corresponding to front asic also if present.
-            # For control plane ACL it's not needed but to keep all db in sync program everywhere
-            for namespace_configdb in self.per_npu_configdb.values():
-                namespace_configdb.mod_entry(self.ACL_RULE, key, None)
-
-        for key in existing_controlplane_rules:
-            if not operator.eq(self.rules_info[key], self.rules_db_info[key]):
-                self.configdb.set_entry(self.ACL_RULE, key, self.rules_info[key])
-                # Program for per-asic namespace corresponding to front asic also if present.
-                # For control plane ACL it's not needed but to keep all db in sync program everywhere
-                for namespace_configdb in self.per_npu_configdb.values():
-                    namespace_configdb.set_entry(self.ACL_RULE, key, self.rules_info[key])
+        self.commit_rules(self.rules_info)
 
     def delete(self, table=None, rule=None):
         """
@@ -928,13 +980,15 @@ class AclLoader(object):
         :param rule:
         :return:
         """
-        for key in self.rules_db_info:
-            if not table or table == key[0]:
-                if not rule or rule == key[1]:
-                    self.configdb.set_entry(self.ACL_RULE, key, None)
-                    # Program for per-asic namespace corresponding to front asic also if present.
-                    for namespace_configdb in self.per_npu_configdb.values():
-                        namespace_configdb.set_entry(self.ACL_RULE, key, None)
+        # Only the matched rules are deleted, the other rules of a namespace config DB are left as they are
+        entries = {key: None for key in self.rules_db_info
+                   if (not table or table == key[0]) and (not rule or rule == key[1])}
+        if not entries:
+            return
+
+        configdbs = [self.configdb, *self.per_npu_configdb.values()]
+        with ThreadPoolExecutor(max_workers=len(configdbs)) as executor:
+            list(executor.map(lambda configdb: bulk_set_entries(configdb, self.ACL_RULE, entries), configdbs))
 
     def show_table(self, table_name):
         """
@@ -1101,6 +1155,278 @@ class AclLoader(object):
         print(tabulate.tabulate(data, headers=header, tablefmt="simple", missingval=""))
 
 
+def _oc_uint(low, high):
+    def parse(value):
+        value = int(value)
+        if value < low or value > high:
+            raise ValueError("{} is out of range [{}, {}]".format(value, low, high))
+        return value
+    return parse
+
+
+def _oc_identity(identities):
+    def parse(value):
+        # Identities may be prefixed by their module name, as the bindings accept
+        if not isinstance(value, str) or value.split(":")[-1] not in identities:
+            raise ValueError("{} is not one of {}".format(value, ", ".join(sorted(identities))))
+        return value
+    return parse
+
+
+def _oc_union(*member_types):
+    def parse(value):
+        # The first type which accepts the value is used, as the bindings do
+        for parse_type in member_types:
+            try:
+                return parse_type(value)
+            except (TypeError, ValueError):
+                pass
+        raise ValueError("{} does not match any of the union types".format(value))
+    return parse
+
+
+def _oc_leaf_list(parse_type):
+    def parse(value):
+        if not isinstance(value, list):
+            raise ValueError("{} is not a list".format(value))
+        return [parse_type(item) for item in value]
+    return parse
+
+
+def _oc_port_range(value):
+    if not isinstance(value, str) or ".." not in value:
+        raise ValueError("{} is not a port range".format(value))
+    low, _, high = value.partition("..")
+    _oc_uint(0, 65535)(low)
+    _oc_uint(0, 65535)(high)
+    return value
+
+
+_oc_port = _oc_union(_oc_port_range, _oc_uint(0, 65535), _oc_identity(["ANY"]))
+
+
+@functools.lru_cache(maxsize=4096)
+def _oc_ip_prefix(value):
+    if "/" not in value:
+        raise ValueError("{} is not an IP prefix".format(value))
+    ipaddress.ip_network(value, strict=False)
+    return value
+
+
+def _oc_unconverted(*names):
+    """ Container of leaves of the model which are not converted """
+    return {name: None for name in names}
+
+
+def _oc_safe_name(name):
+    # JSON names are matched to the model as the bindings do, "-" and "." are equivalent to "_"
+    return name.replace("-", "_").replace(".", "_")
+
+
+class OcAclJsonParser(object):
+    """
+    Parser of openconfig ACL files which doesn't build the pyangbind binding objects.
+
+    pyangbind builds and validates an object for every container and leaf of the
+    model, which dominates the load time of files with tens of thousands of rules.
+    This parser walks the JSON one ACL entry at a time, validates and types the
+    leaves read by the rule conversion as the bindings do and returns each entry
+    as a lightweight object with the attributes of the binding object
+    (e.g. rule.ip.config.protocol), so AclLoader converts it unchanged.
+    Names which are not in the model are rejected as by the bindings, the values
+    of the leaves which are not converted are not validated.
+    """
+
+    FORWARDING_ACTIONS = ["ACCEPT", "DROP", "REJECT"]
+    TCP_FLAGS = ["TCP_FIN", "TCP_SYN", "TCP_RST", "TCP_PSH", "TCP_ACK", "TCP_URG", "TCP_ECE", "TCP_CWR"]
+
+    # Containers and leaves of the model by yang name. A container is a dict, a converted
+    # leaf is (type, value of the unset leaf) and a leaf or subtree which is not converted is None.
+    ACL_SCHEMA = {
+        "acl": {
+            "config": {},
+            "state": _oc_unconverted("counter-capability"),
+            "acl-sets": {
+                "acl-set": None
+            },
+            "interfaces": None
+        }
+    }
+
+    ACL_SET_SCHEMA = {
+        "name": None,
+        "type": None,
+        "config": _oc_unconverted("name", "type", "description"),
+        "state": _oc_unconverted("name", "type", "description"),
+        "acl-entries": {
+            "acl-entry": None
+        }
+    }
+
+    ACL_ENTRY_SCHEMA = {
+        "sequence-id": None,
+        "config": {
+            "sequence-id": (_oc_uint(0, 4294967295), 0),
+            "description": None
+        },
+        "state": _oc_unconverted("sequence-id", "description", "matched-packets", "matched-octets"),
+        "actions": {
+            "config": {
+                "forwarding-action": (_oc_identity(FORWARDING_ACTIONS), ""),
+                "log-action": None
+            },
+            "state": _oc_unconverted("forwarding-action", "log-action")
+        },
+        "l2": {
+            "config": {
+                "source-mac": None,
+                "source-mac-mask": None,
+                "destination-mac": None,
+                "destination-mac-mask": None,
+                "ethertype": (_oc_union(_oc_uint(1536, 65535), _oc_identity(AclLoader.ethertype_map)), 0),
+                "vlan-id": (_oc_uint(1, 4094), "")
+            },
+            "state": _oc_unconverted("source-mac", "source-mac-mask", "destination-mac", "destination-mac-mask",
+                                     "ethertype", "vlan-id")
+        },
+        "ip": {
+            "config": {
+                "ip-version": None,
+                "protocol": (_oc_union(_oc_uint(0, 254), _oc_identity(AclLoader.ip_protocol_map)), 0),
+                "source-ip-address": (_oc_ip_prefix, ""),
+                "source-ip-flow-label": None,
+                "destination-ip-address": (_oc_ip_prefix, ""),
+                "destination-ip-flow-label": None,
+                "dscp": (_oc_uint(0, 63), 0),
+                "hop-limit": None
+            },
+            "state": _oc_unconverted("ip-version", "protocol", "source-ip-address", "source-ip-flow-label",
+                                     "destination-ip-address", "destination-ip-flow-label", "dscp", "hop-limit")
+        },
+        "icmp": {
+            "config": {
+                "type": (_oc_uint(0, 255), ""),
+                "code": (_oc_uint(0, 255), "")
+            },
+            "state": _oc_unconverted("type", "code")
+        },
+        "transport": {
+            "config": {
+                "source-port": (_oc_port, ""),
+                "destination-port": (_oc_port, ""),
+                "tcp-flags": (_oc_leaf_list(_oc_identity(TCP_FLAGS)), ())
+            },
+            "state": _oc_unconverted("source-port", "destination-port", "tcp-flags")
+        },
+        "input_interface": {
+            "config": {},
+            "state": {},
+            "interface_ref": {
+                "config": {
+                    "interface": (str, ""),
+                    "subinterface": None
+                },
+                "state": _oc_unconverted("interface", "subinterface")
+            }
+        }
+    }
+
+    # Objects of the containers missing in the JSON, shared by the ACL entries
+    default_containers = {}
+
+    # Yang names of the children of the containers by their safe name
+    schema_names = {}
+
+    @staticmethod
+    def build(schema, data, path):
+        """
+        Build the object of a container from its JSON data
+        :param schema: schema of the container
+        :param data: JSON data of the container
+        :param path: path of the container, for the error messages
+        :return: types.SimpleNamespace with an attribute per converted child
+        """
+        if not isinstance(data, dict):
+            raise ValueError("{} of {} is not a container".format(data, path))
+
+        if id(schema) not in OcAclJsonParser.schema_names:
+            OcAclJsonParser.schema_names[id(schema)] = {_oc_safe_name(name): name for name in schema}
+        names = OcAclJsonParser.schema_names[id(schema)]
+
+        values = {}
+        for key, value in data.items():
+            name = names.get(_oc_safe_name(key))
+            if name is None:
+                # The bindings raise AttributeError as well
+                raise AttributeError("{}/{} does not exist in the model".format(path, key))
+            values[name] = value
+
+        children = {}
+        for name, child_schema in schema.items():
+            value = values.get(name)
+            if child_schema is None:
+                continue
+            elif isinstance(child_schema, dict):
+                if value is None:
+                    child = OcAclJsonParser.default_container(child_schema)
+                else:
+                    child = OcAclJsonParser.build(child_schema, value, path + "/" + name)
+            elif value is None:
+                child = child_schema[1]
+            else:
+                try:
+                    child = child_schema[0](value)
+                except (TypeError, ValueError) as e:
+                    raise ValueError("Invalid value {} of {}/{}: {}".format(value, path, name, e))
+            children[_oc_safe_name(name)] = child
+        return types.SimpleNamespace(**children)
+
+    @staticmethod
+    def default_container(schema):
+        """ Object of a container which is not in the JSON, all its leaves are unset """
+        if id(schema) not in OcAclJsonParser.default_containers:
+            OcAclJsonParser.default_containers[id(schema)] = OcAclJsonParser.build(schema, {}, "")
+        return OcAclJsonParser.default_containers[id(schema)]
+
+    @staticmethod
+    def iter_entries(acl_set_name, acl_entries):
+        """
+        Build the ACL entries of an ACL set as they are iterated
+        :return: generator of (ACL entry name, ACL entry object)
+        """
+        for acl_entry_name, acl_entry in acl_entries.items():
+            path = "{}/{}".format(acl_set_name, acl_entry_name)
+            yield acl_entry_name, OcAclJsonParser.build(OcAclJsonParser.ACL_ENTRY_SCHEMA, acl_entry, path)
+
+    @staticmethod
+    def load(filename):
+        """
+        Parse file in openconfig ACL format. ACL entries are built and validated
+        when they are iterated, so a ValueError of an invalid leaf or an AttributeError
+        of an unknown name is raised by the iteration.
+        :param filename: File in openconfig ACL format
+        :return: list of (ACL set name, generator of (ACL entry name, ACL entry object))
+        """
+        with open(filename, 'r') as f:
+            plain_json = json.load(f)
+
+        try:
+            acl_sets = plain_json["acl"]["acl-sets"]["acl-set"]
+            acl_entries = {name: acl_set.get("acl-entries", {}).get("acl-entry", {})
+                           for name, acl_set in acl_sets.items()}
+        except (AttributeError, KeyError, TypeError):
+            raise AclLoaderException("Invalid input file %s" % filename)
+
+        if not all(isinstance(entries, dict) for entries in acl_entries.values()):
+            raise AclLoaderException("Invalid input file %s" % filename)
+
+        OcAclJsonParser.build(OcAclJsonParser.ACL_SCHEMA, plain_json, "")
+        for name, acl_set in acl_sets.items():
+            OcAclJsonParser.build(OcAclJsonParser.ACL_SET_SCHEMA, acl_set, name)
+
+        return [(name, OcAclJsonParser.iter_entries(name, entries)) for name, entries in acl_entries.items()]
+
+
 @click.group()
 @click.pass_context
 def cli(ctx):
@@ -1188,8 +1514,10 @@ def update(ctx):
 @click.option('--mirror_stage', type=click.Choice(["ingress", "egress"]), default="ingress")
 @click.option('--max_priority', type=click.INT, required=False)
 @click.option('--skip_action_validation', is_flag=True, default=False, help="Skip action validation")
+@click.option('--fast_convert', is_flag=True, default=False,
+              help="Validate and convert the rules without building the OpenConfig binding objects")
 @click.pass_context
-def full(ctx, filename, table_name, session_name, mirror_stage, max_priority, skip_action_validation):
+def full(ctx, filename, table_name, session_name, mirror_stage, max_priority, skip_action_validation, fast_convert):
     """
     Full update of ACL rules configuration.
     If a table_name is provided, the operation will be restricted in the specified table.
@@ -1207,7 +1535,7 @@ def full(ctx, filename, table_name, session_name, mirror_stage, max_priority, sk
     if max_priority:
         acl_loader.set_max_priority(max_priority)
 
-    acl_loader.load_rules_from_file(filename, skip_action_validation)
+    acl_loader.load_rules_from_file(filename, skip_action_validation, fast_convert)
     acl_loader.full_update()
 
 
@@ -1216,8 +1544,10 @@ def full(ctx, filename, table_name, session_name, mirror_stage, max_priority, sk
 @click.option('--session_name', type=click.STRING, required=False)
 @click.option('--mirror_stage', type=click.Choice(["ingress", "egress"]), default="ingress")
 @click.option('--max_priority', type=click.INT, required=False)
+@click.option('--fast_convert', is_flag=True, default=False,
+              help="Validate and convert the rules without building the OpenConfig binding objects")
 @click.pass_context
-def incremental(ctx, filename, session_name, mirror_stage, max_priority):
+def incremental(ctx, filename, session_name, mirror_stage, max_priority, fast_convert):
     """
     Incremental update of ACL rule configuration.
     """
@@ -1231,7 +1561,7 @@ def incremental(ctx, filename, session_name, mirror_stage, max_priority):
     if max_priority:
         acl_loader.set_max_priority(max_priority)
 
-    acl_loader.load_rules_from_file(filename)
+    acl_loader.load_rules_from_file(filename, fast_convert=fast_convert)
     acl_loader.incremental_update()
 
 
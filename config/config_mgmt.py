@@ -4,19 +4,19 @@ Port Breakout.
 '''
 
 import os
-import re
 import shutil
 import syslog
 import tempfile
 import yang as ly
 from json import load
 from sys import flags
-from time import sleep as tsleep
+from time import monotonic, sleep as tsleep
 
 import sonic_yang
 from jsondiff import diff
 from sonic_py_common import port_util
-from swsscommon.swsscommon import SonicV2Connector, ConfigDBConnector
+from swsscommon.swsscommon import SonicV2Connector, ConfigDBConnector, ConfigDBPipeConnector
+from utilities_common.bulk_db import get_redis_client
 from utilities_common.general import load_module_from_source
 
 
@@ -28,6 +28,8 @@ YANG_DIR = "/usr/local/yang-models"
 CONFIG_DB_JSON_FILE = '/etc/sonic/confib_db.json'
 # TODO: Find a place for it on sonic switch.
 DEFAULT_CONFIG_DB_JSON_FILE = '/etc/sonic/port_breakout_config_db.json'
+# Max time to wait for a keyspace notification before checking ASIC DB again
+ASIC_DB_POLL_INTERVAL = 1
 
 class ConfigMgmt():
     '''
@@ -222,7 +224,8 @@ class ConfigMgmt():
         self.sysLog(doPrint=True, msg='Writing in Config DB')
         data = dict()
         if self.configdb is None:
-            configdb = ConfigDBConnector()
+            # Pipe connector writes all the entries in one pipeline
+            configdb = ConfigDBPipeConnector()
             configdb.connect(False)
         else:
             configdb = self.configdb
@@ -330,58 +333,74 @@ class ConfigMgmtDPB(ConfigMgmt):
     def __del__(self):
         pass
 
-    def _checkKeyinAsicDB(self, key, db):
+    def _keysInAsicDB(self, client, keys):
+        '''
+        Check which of the keys exist in ASIC DB, with one pipelined EXISTS
+        per key.
+
+        Parameters:
+            client: redis client of ASIC DB.
+            keys (list): keys in ASIC DB, with table Seperator if applicable.
+
+        Returns:
+            (list): keys which are present.
+        '''
+        self.sysLog(msg='Check Keys in Asic DB: {}'.format(keys))
+        pipe = client.pipeline(transaction=False)
+        for key in keys:
+            pipe.exists(key)
+        return [key for key, exists in zip(keys, pipe.execute()) if exists]
+
+    def _subscribeAsicDBKeys(self, db, client, keys):
         '''
-        Check if a key exists in ASIC DB or not.
+        Subscribe to the keyspace notifications of the keys in ASIC DB.
 
         Parameters:
             db (SonicV2Connector): database.
-            key (str): key in ASIC DB, with table Seperator if applicable.
+            client: redis client of ASIC DB.
+            keys (list): keys in ASIC DB.
 
         Returns:
-            (bool): True, if given key is present.
+            pubsub, None if notifications can not be subscribed.
         '''
-        self.sysLog(msg='Check Key in Asic DB: {}'.format(key))
+        if not keys:
+            return None
         try:
-            # chk key in ASIC DB
-            if db.exists('ASIC_DB', key):
-                return True
+            pubsub = client.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(*['__keyspace@{}__:{}'.format(db.get_dbid(db.ASIC_DB), key)
+                               for key in keys])
         except Exception as e:
-            self.sysLog(doPrint=True, logLevel=syslog.LOG_ERR, msg=str(e))
-            raise(e)
+            # check the keys every ASIC_DB_POLL_INTERVAL secs instead
+            self.sysLog(logLevel=syslog.LOG_DEBUG,
+                        msg='Asic DB keyspace notifications not available: {}'.format(str(e)))
+            return None
 
-        return False
+        return pubsub
 
-    def _checkNoPortsInAsicDb(self, db, ports, portMap):
+    def _waitAsicDBEvent(self, pubsub, timeout):
         '''
-        Check ASIC DB for PORTs in port List
+        Wait till a keyspace notification is received or till timeout.
 
         Parameters:
-            db (SonicV2Connector): database.
-            ports (list): List of ports
-            portMap (dict): port to OID map.
+            pubsub: subscription to the keys, None to sleep till timeout.
+            timeout (float): max wait time in secs.
 
         Returns:
-            (bool): True, if all ports are not present.
+            void
         '''
-        try:
-            # connect to ASIC DB,
-            db.connect(db.ASIC_DB)
-            for port in ports:
-                key = self.oidKey + portMap[port]
-                if self._checkKeyinAsicDB(key, db) == True:
-                    return False
-
-        except Exception as e:
-            self.sysLog(doPrint=True, logLevel=syslog.LOG_ERR, msg=str(e))
-            return False
+        if pubsub is None:
+            tsleep(timeout)
+        else:
+            pubsub.get_message(timeout=timeout)
 
-        return True
+        return
 
     def _verifyAsicDB(self, db, ports, portMap, timeout):
         '''
         Verify in the Asic DB that port are deleted, Keep on trying till timeout
-        period.
+        period. Ports are checked again on every keyspace notification of
+        their keys, or every ASIC_DB_POLL_INTERVAL secs if notifications are
+        not available.
 
         Parameters:
             db (SonicV2Connector): database.
@@ -393,26 +412,39 @@ class ConfigMgmtDPB(ConfigMgmt):
             (bool)
         '''
         self.sysLog(doPrint=True, msg="Verify Port Deletion from Asic DB, Wait...")
+        pubsub = None
         try:
-            for waitTime in range(timeout):
+            db.connect(db.ASIC_DB)
+            client = get_redis_client(db, db.ASIC_DB)
+            keys = [self.oidKey + portMap[port] for port in ports]
+            # subscribe before the first check, so no deletion is missed
+            pubsub = self._subscribeAsicDBKeys(db, client, keys)
+            endTime = monotonic() + timeout
+            tries = 0
+            while True:
+                tries += 1
                 self.sysLog(logLevel=syslog.LOG_DEBUG, msg='Check Asic DB: {} \
-                    try'.format(waitTime+1))
-                # checkNoPortsInAsicDb will return True if all ports are not
-                # present in ASIC DB
-                if self._checkNoPortsInAsicDb(db, ports, portMap):
+                    try'.format(tries))
+                keys = self._keysInAsicDB(client, keys)
+                if not keys:
                     break
-                tsleep(1)
 
-            # raise if timer expired
-            if waitTime + 1 == timeout:
-                self.sysLog(syslog.LOG_CRIT, "!!!  Critical Failure, Ports \
-                    are not Deleted from ASIC DB, Bail Out  !!!", doPrint=True)
-                raise Exception("Ports are present in ASIC DB after {} secs".format(timeout))
+                waitTime = endTime - monotonic()
+                # raise if timer expired
+                if waitTime <= 0:
+                    self.sysLog(syslog.LOG_CRIT, "!!!  Critical Failure, Ports \
+                        are not Deleted from ASIC DB, Bail Out  !!!", doPrint=True)
+                    raise Exception("Ports are present in ASIC DB after {} secs".format(timeout))
+                self._waitAsicDBEvent(pubsub, min(waitTime, ASIC_DB_POLL_INTERVAL))
 
         except Exception as e:
             self.sysLog(doPrint=True, logLevel=syslog.LOG_ERR, msg=str(e))
             raise e
 
+        finally:
+            if pubsub is not None:
+                pubsub.close()
+
         return True
 
     def breakOutPort(self, delPorts=list(), portJson=dict(), force=False, \
@@ -664,8 +696,9 @@ class ConfigMgmtDPB(ConfigMgmt):
 
     def _searchKeysInConfig(self, In, Out, skeys):
         '''
-        Search Relevant Keys in Input Config using DFS, This function is mainly
-        used to search ports related config in Default ConfigDbJson file.
+        Search Relevant Keys in Input Config using a key index of the config,
+        built with one walk of the config, This function is mainly used to
+        search ports related config in Default ConfigDbJson file.
 
         Parameters:
             In (dict): Input Config to be searched
@@ -675,37 +708,34 @@ class ConfigMgmtDPB(ConfigMgmt):
         Returns:
             found (bool): True if any of skeys is found else False.
         '''
-        found = False
-        if isinstance(In, dict):
-            for key in In:
-                for skey in skeys:
-                    # pattern is very specific to current primary keys in
-                    # config DB, may need to be updated later.
-                    pattern = r'^{0}\||{0}$|^{0}$'.format(skey)
-                    reg = re.compile(pattern)
-                    if reg.search(key):
-                        # In primary key, only 1 match can be found, so return
-                        Out[key] = In[key]
-                        found = True
-                        break
-                # Put the key in Out by default, if not added already.
-                # Remove later, if subelements does not contain any port.
-                if Out.get(key) is None:
-                    Out[key] = type(In[key])()
-                    if self._searchKeysInConfig(In[key], Out[key], skeys) == False:
-                        del Out[key]
-                    else:
-                        found = True
-
-        elif isinstance(In, list):
-            for skey in skeys:
-                if skey in In:
-                    found = True
-                    Out.append(skey)
+        index = _configKeyIndex(In)
+        hits = list()
+        for skey in skeys:
+            hits.extend(index.get(skey, []))
+        # the whole config of a matched key is taken, skip the matches below it
+        matched = set(path for path, item in hits if item is None)
 
-        else:
-            # nothing for other keys
-            pass
+        found = False
+        for path, item in sorted(hits, key=lambda hit: len(hit[0])):
+            parents = path[:-1] if item is None else path
+            if any(parents[:i] in matched for i in range(1, len(parents) + 1)):
+                continue
+            inNode = In
+            outNode = Out
+            for key in path[:-1]:
+                if key not in outNode:
+                    outNode[key] = type(inNode[key])()
+                inNode = inNode[key]
+                outNode = outNode[key]
+            key = path[-1]
+            if item is None:
+                # In primary key, only 1 match can be found
+                outNode[key] = inNode[key]
+            else:
+                outNode.setdefault(key, list())
+                if item not in outNode[key]:
+                    outNode[key].append(item)
+            found = True
 
         return found
 
@@ -965,7 +995,45 @@ class ConfigMgmtDPB(ConfigMgmt):
 
 # end of class ConfigMgmtDPB
 
+
 # Helper Functions
+def _configKeyIndex(config):
+    '''
+    Index the keys of a config, so that the search keys are looked up
+    instead of matched with every key of the config. A search key matches
+    the first part of a key, e.g. Ethernet8|10.0.0.1/31, the last part of
+    a key, e.g. Vlan100|Ethernet8, or an item of a list.
+
+    Parameters:
+        config (dict): config to index.
+
+    Returns:
+        index (dict): search key to list of (path, item), path is the tuple
+            of keys from the config top, item is the list item or None for
+            a key.
+    '''
+    index = dict()
+
+    def _indexNode(node, path):
+        if isinstance(node, dict):
+            for key in node:
+                keyPath = path + (key,)
+                parts = str(key).split('|')
+                index.setdefault(parts[-1], []).append((keyPath, None))
+                # pattern is very specific to current primary keys in config DB,
+                # may need to be updated later.
+                if len(parts) > 1 and parts[0] != parts[-1]:
+                    index.setdefault(parts[0], []).append((keyPath, None))
+                _indexNode(node[key], keyPath)
+        elif isinstance(node, list) and path:
+            for item in node:
+                if isinstance(item, str):
+                    index.setdefault(item, []).append((path, item))
+        return
+
+    _indexNode(config, ())
+    return index
+
 def readJsonFile(fileName):
     '''
     Read Json file.
@@ -4,6 +4,7 @@ import threading
 import click
 import concurrent.futures
 import datetime
+import hashlib
 import ipaddress
 import json
 import jsonpatch
@@ -44,7 +45,9 @@ from utilities_common.helper import get_port_pbh_binding, get_port_acl_binding,
 from utilities_common.general import load_db_config, load_module_from_source
 from .validated_config_db_connector import ValidatedConfigDBConnector
 import utilities_common.multi_asic as multi_asic_util
+import utilities_common.port_index as port_index_util
 from utilities_common.flock import try_lock
+from utilities_common.bulk_db import bulk_delete_tables
 
 from .utils import log
 
@@ -255,6 +258,8 @@ def breakout_Ports(cm, delPorts=list(), portJson=dict(), force=False, \
 
     deps, ret = cm.breakOutPort(delPorts=delPorts,  portJson=portJson, \
                     force=force, loadDefConfig=loadDefConfig)
+    # Ports are deleted and added in CONFIG_DB
+    port_index_util.invalidate_port_index()
     # check if DPB failed
     if ret == False:
         if not force and deps:
@@ -309,18 +314,18 @@ def interface_alias_to_name(config_db, interface_alias):
         namespace = get_port_namespace(interface_alias)
         if namespace is None:
             return None
-        config_db = ConfigDBConnector(use_unix_socket_path=True, namespace=namespace)
-
-    config_db.connect()
-    port_dict = config_db.get_table('PORT')
+        config_db = port_index_util.get_config_db(namespace)
+    else:
+        config_db.connect()
+    port_index = port_index_util.get_port_index(config_db)
 
     if interface_alias is not None:
-        if not port_dict:
+        if not port_index:
             click.echo("port_dict is None!")
             raise click.Abort()
-        for port_name in port_dict:
-            if interface_alias == port_dict[port_name]['alias']:
-                return port_name if sub_intf_sep_idx == -1 else port_name + VLAN_SUB_INTERFACE_SEPARATOR + vlan_id
+        port_name = port_index.get_name(interface_alias)
+        if port_name is not None:
+            return port_name if sub_intf_sep_idx == -1 else port_name + VLAN_SUB_INTERFACE_SEPARATOR + vlan_id
 
     # Interface alias not in port_dict, just return interface_alias, e.g.,
     # portchannel is passed in as argument, which does not have an alias
@@ -335,36 +340,23 @@ def interface_name_is_valid(config_db, interface_name):
         namespace = get_port_namespace(interface_name)
         if namespace is None:
             return False
-        config_db = ConfigDBConnector(use_unix_socket_path=True, namespace=namespace)
-
-    config_db.connect()
-    port_dict = config_db.get_table('PORT')
-    port_channel_dict = config_db.get_table('PORTCHANNEL')
-    sub_port_intf_dict = config_db.get_table('VLAN_SUB_INTERFACE')
-    loopback_dict = config_db.get_table('LOOPBACK_INTERFACE')
+        config_db = port_index_util.get_config_db(namespace)
+    else:
+        config_db.connect()
+    port_index = port_index_util.get_port_index(config_db)
 
     if clicommon.get_interface_naming_mode() == "alias":
         interface_name = interface_alias_to_name(config_db, interface_name)
 
     if interface_name is not None:
-        if not port_dict:
+        if not port_index:
             click.echo("port_dict is None!")
             raise click.Abort()
-        for port_name in port_dict:
-            if interface_name == port_name:
+        if port_index.has_name(interface_name):
+            return True
+        for table_name in ['PORTCHANNEL', 'VLAN_SUB_INTERFACE', 'LOOPBACK_INTERFACE']:
+            if interface_name in config_db.get_keys(table_name):
                 return True
-        if port_channel_dict:
-            for port_channel_name in port_channel_dict:
-                if interface_name == port_channel_name:
-                    return True
-        if sub_port_intf_dict:
-            for sub_port_intf_name in sub_port_intf_dict:
-                if interface_name == sub_port_intf_name:
-                    return True
-        if loopback_dict:
-            for loopback_name in loopback_dict:
-                if interface_name == loopback_name:
-                    return True
     return False
 
 def interface_name_to_alias(config_db, interface_name):
@@ -376,18 +368,16 @@ def interface_name_to_alias(config_db, interface_name):
         namespace = get_port_namespace(interface_name)
         if namespace is None:
             return None
-        config_db = ConfigDBConnector(use_unix_socket_path=True, namespace=namespace)
-
-    config_db.connect()
-    port_dict = config_db.get_table('PORT')
+        config_db = port_index_util.get_config_db(namespace)
+    else:
+        config_db.connect()
+    port_index = port_index_util.get_port_index(config_db)
 
     if interface_name is not None:
-        if not port_dict:
+        if not port_index:
             click.echo("port_dict is None!")
             raise click.Abort()
-        for port_name in port_dict:
-            if interface_name == port_name:
-                return port_dict[port_name]['alias']
+        return port_index.get_alias(interface_name)
 
     return None
 
@@ -529,6 +519,10 @@ def get_port_namespace(port):
     if table_name == "":
         return None
 
+    # PORT table lookups are served by the cached port index of each namespace
+    if table_name == 'PORT':
+        return port_index_util.get_port_namespace(port, alias=clicommon.get_interface_naming_mode() == "alias")
+
     ns_list = multi_asic.get_all_namespaces()
     namespaces = ns_list['front_ns'] + ns_list['back_ns']
     for namespace in namespaces:
@@ -749,16 +743,24 @@ def _change_hostname(hostname):
         with open('/etc/hosts', 'a') as f:
             f.write("127.0.0.1 " + str(hostname) + '\n')
 
-def _clear_cbf():
-    CBF_TABLE_NAMES = [
-            'DSCP_TO_FC_MAP',
-            'EXP_TO_FC_MAP']
 
-    namespace_list = [DEFAULT_NAMESPACE]
-    if multi_asic.get_num_asics() > 1:
-        namespace_list = multi_asic.get_namespaces_from_linux()
+def _run_per_namespace(func, namespace_list):
+    """Run func(ns) for all the namespaces concurrently, returns the results in namespace_list order"""
+    if len(namespace_list) <= 1:
+        return [func(ns) for ns in namespace_list]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(namespace_list)) as executor:
+        return list(executor.map(func, namespace_list))
 
-    for ns in namespace_list:
+
+def _clear_config_tables(table_names, namespace_list):
+    """
+    Delete the tables from CONFIG_DB of all the namespaces, one pipelined
+    multi-table delete per namespace, the namespaces are cleared concurrently.
+
+    Returns:
+        list of the connected ConfigDBConnector in namespace_list order
+    """
+    def clear(ns):
         if ns is DEFAULT_NAMESPACE:
             config_db = ConfigDBConnector()
         else:
@@ -766,8 +768,31 @@ def _clear_cbf():
                 use_unix_socket_path=True, namespace=ns
             )
         config_db.connect()
-        for cbf_table in CBF_TABLE_NAMES:
-            config_db.delete_table(cbf_table)
+        bulk_delete_tables(config_db, table_names)
+        return config_db
+
+    return _run_per_namespace(clear, namespace_list)
+
+
+def _report_stage_timings(command, timings, verbose=False):
+    """Log the time taken by each stage of the command, echo it as well if verbose"""
+    message = "'{}' stage timings: {}".format(
+        command, ", ".join("{} {:.3f}s".format(stage, seconds) for stage, seconds in timings.items()))
+    log.log_info(message)
+    if verbose:
+        click.echo(message)
+
+
+def _clear_cbf():
+    CBF_TABLE_NAMES = [
+            'DSCP_TO_FC_MAP',
+            'EXP_TO_FC_MAP']
+
+    namespace_list = [DEFAULT_NAMESPACE]
+    if multi_asic.get_num_asics() > 1:
+        namespace_list = multi_asic.get_namespaces_from_linux()
+
+    _clear_config_tables(CBF_TABLE_NAMES, namespace_list)
 
 #API to validate the interface passed for storm-control configuration
 def storm_control_interface_validate(port_name):
@@ -905,16 +930,7 @@ def _clear_qos(delay=False, verbose=False):
     if multi_asic.get_num_asics() > 1:
         namespace_list = multi_asic.get_namespaces_from_linux()
 
-    for ns in namespace_list:
-        if ns is DEFAULT_NAMESPACE:
-            config_db = ConfigDBConnector()
-        else:
-            config_db = ConfigDBConnector(
-                use_unix_socket_path=True, namespace=ns
-            )
-        config_db.connect()
-        for qos_table in QOS_TABLE_NAMES:
-            config_db.delete_table(qos_table)
+    config_db = _clear_config_tables(QOS_TABLE_NAMES, namespace_list)[-1]
     if delay:
         device_metadata = config_db.get_entry('DEVICE_METADATA', 'localhost')
         # Traditional buffer manager do not remove buffer tables in any case, no need to wait.
@@ -1306,22 +1322,113 @@ def validate_gre_type(ctx, _, value):
         raise click.UsageError("{} is not a valid GRE type".format(value))
 
 
-def multiasic_save_to_singlefile(db, filename):
+def multiasic_save_to_singlefile(db, filename, parallel=False):
     """A function to save all asic's config to single file
     """
     all_current_config = {}
     cfgdb_clients = db.cfgdb_clients
 
-    for ns, config_db in cfgdb_clients.items():
-        current_config = config_db.get_config()
-        sonic_cfggen.FormatConverter.to_serialized(current_config)
+    if parallel:
+        namespaces = list(cfgdb_clients)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(namespaces)) as executor:
+            ns_configs = list(executor.map(get_config_db_data, namespaces))
+    else:
+        ns_configs = []
+        for ns, config_db in cfgdb_clients.items():
+            current_config = config_db.get_config()
+            sonic_cfggen.FormatConverter.to_serialized(current_config)
+            ns_configs.append(sort_dict(current_config))
+
+    for ns, current_config in zip(cfgdb_clients, ns_configs):
         asic_name = "localhost" if ns == DEFAULT_NAMESPACE else ns
-        all_current_config[asic_name] = sort_dict(current_config)
+        all_current_config[asic_name] = current_config
     click.echo("Integrate each ASIC's config into a single JSON file {}.".format(filename))
+    if parallel:
+        if not save_config_file(json.dumps(all_current_config, indent=4), filename):
+            click.echo("Config is unchanged, {} is not written".format(filename))
+        return
     with open(filename, 'w') as file:
         json.dump(all_current_config, file, indent=4)
 
 
+def get_config_db_data(namespace=DEFAULT_NAMESPACE):
+    """
+    Read CONFIG_DB of the namespace with pipelined reads, the data is the
+    same as the 'sonic-cfggen -d --print-data' output sorted by sort_dict()
+    """
+    if namespace is DEFAULT_NAMESPACE:
+        config_db = ConfigDBPipeConnector()
+    else:
+        config_db = ConfigDBPipeConnector(use_unix_socket_path=True, namespace=namespace)
+
+    config_db.connect(False)
+    current_config = config_db.get_config()
+    sonic_cfggen.FormatConverter.to_serialized(current_config)
+    return sort_dict(current_config)
+
+
+def get_config_db_dump(namespace=DEFAULT_NAMESPACE):
+    """
+    Dump CONFIG_DB of the namespace as 'config save' writes it
+    """
+    return json.dumps(get_config_db_data(namespace), indent=4)
+
+
+def save_config_file(content, filename):
+    """
+    Atomically replace the file with the content through a temporary file
+
+    Returns:
+        False if the file already has the same content and is left as is, True otherwise
+    """
+    data = content.encode()
+    # Replace the target of a symlink rather than the symlink
+    filename = os.path.realpath(filename)
+    try:
+        with open(filename, 'rb') as f:
+            if hashlib.sha256(f.read()).digest() == hashlib.sha256(data).digest():
+                return False
+        mode = os.stat(filename).st_mode & 0o777
+    except OSError:
+        mode = 0o644
+
+    fd, tmpfname = tempfile.mkstemp(dir=os.path.dirname(filename),
+                                    prefix='.{}.'.format(os.path.basename(filename)), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmpfname, mode)
+        os.replace(tmpfname, filename)
+    except BaseException:
+        os.remove(tmpfname)
+        raise
+    return True
+
+
+def save_namespaces_parallel(ns_files):
+    """
+    Save CONFIG_DB of the namespaces to their files concurrently
+
+    Args:
+        ns_files: list of (namespace, file)
+    """
+    def save_namespace(ns_file):
+        namespace, file = ns_file
+        return save_config_file(get_config_db_dump(namespace), file)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(ns_files)) as executor:
+        saved = list(executor.map(save_namespace, ns_files))
+
+    for (namespace, file), is_saved in zip(ns_files, saved):
+        asic_name = HOST_NAMESPACE if namespace is DEFAULT_NAMESPACE else namespace
+        if is_saved:
+            click.echo("Saved {} config to {}".format(asic_name, file))
+        else:
+            click.echo("Config of {} is unchanged, {} is not written".format(asic_name, file))
+
+
 def apply_patch_wrapper(args):
     return apply_patch_for_scope(*args)
 
@@ -1483,6 +1590,248 @@ def multiasic_write_to_db(filename, load_sysinfo):
         migrate_db_to_lastest(ns)
 
 
+def get_reload_config_file(inst, cfg_files, file_format):
+    """
+    Get the namespace and the config file of the instance inst of 'config reload'.
+    inst -1 is the linux host, the other instances are the ASIC namespaces.
+    """
+    # Get the namespace name, for linux host it is DEFAULT_NAMESPACE
+    if inst == -1:
+        namespace = DEFAULT_NAMESPACE
+    else:
+        namespace = "{}{}".format(NAMESPACE_PREFIX, inst)
+
+    # Get the file from user input, else take the default file /etc/sonic/config_db{NS_id}.json
+    if cfg_files:
+        file = cfg_files[inst+1]
+        # Save to tmpfile in case of stdin input which can only be read once
+        if file == "/dev/stdin":
+            file_input = read_json_file(file)
+            (_, tmpfname) = tempfile.mkstemp(dir="/tmp", suffix="_configReloadStdin")
+            write_json_file(file_input, tmpfname)
+            file = tmpfname
+    else:
+        if file_format == 'config_db':
+            if namespace is DEFAULT_NAMESPACE:
+                file = DEFAULT_CONFIG_DB_FILE
+            else:
+                file = "/etc/sonic/config_db{}.json".format(inst)
+        else:
+            file = DEFAULT_CONFIG_YANG_FILE
+
+    return namespace, file
+
+
+def get_config_file_hwsku(file):
+    try:
+        command = [SONIC_CFGGEN_PATH, "-j", file, '-v', "DEVICE_METADATA.localhost.hwsku"]
+        proc = subprocess.Popen(command, text=True, stdout=subprocess.PIPE)
+        output, err = proc.communicate()
+
+    except FileNotFoundError as e:
+        click.echo("{}".format(str(e)), err=True)
+        raise click.Abort()
+    except Exception as e:
+        click.echo("{}\n{}".format(type(e), str(e)), err=True)
+        raise click.Abort()
+
+    if not output:
+        click.secho("Could not get the HWSKU from config file,  Exiting!!!", fg='magenta')
+        sys.exit(1)
+
+    return output.strip()
+
+
+class NamespaceReload(object):
+    """
+    'config reload' of one namespace by the parallel reload engine.
+
+    The config files are read and merged in-process the way sonic-cfggen -j
+    does it, and written to CONFIG_DB with the pipelined mod_config() of
+    ConfigDBPipeConnector, so CONFIG_DB ends up the same as after the
+    sonic-cfggen based reload. Config in config_yang format is still
+    written by sonic-cfggen. The time taken by each stage is kept in timings.
+    """
+
+    STAGES = ['load', 'flush', 'sysinfo', 'write', 'migrate']
+
+    def __init__(self, namespace, file=None, file_format='config_db', config=None):
+        """
+        Args:
+            namespace: namespace to reload, DEFAULT_NAMESPACE for the linux host
+            file: config file of the namespace
+            file_format: 'config_db' or 'config_yang'
+            config: config of the namespace in config_db format, used instead of
+                    the config files (the multi ASIC single file mode)
+        """
+        self.namespace = namespace
+        self.file = file
+        self.file_format = file_format
+        self.config = config
+        self.file_input = config
+        self.data = None
+        self.load_sysinfo = False
+        self.hwsku = None
+        self.timings = OrderedDict()
+
+    @property
+    def name(self):
+        return self.namespace if self.namespace is not DEFAULT_NAMESPACE else HOST_NAMESPACE
+
+    def _run_stage(self, stage, func):
+        start = time.monotonic()
+        try:
+            return func()
+        finally:
+            self.timings[stage] = time.monotonic() - start
+
+    def _namespace_opts(self):
+        return [] if self.namespace is DEFAULT_NAMESPACE else ['-n', str(self.namespace)]
+
+    def load(self):
+        """Read and merge the config files, nothing is written to the DB"""
+        self._run_stage('load', self._load)
+
+    def _load(self):
+        if self.config is not None:
+            self.data = sonic_cfggen.FormatConverter.to_deserialized(copy.deepcopy(self.config))
+            return
+
+        if self.file_format == 'config_db':
+            self.file_input = read_json_file(self.file)
+            if not isinstance(self.file_input, dict):
+                raise ValueError("{} is not a config_db JSON object".format(self.file))
+        else:
+            # sonic-cfggen converts and writes the config_yang file
+            return
+
+        data = {}
+        if os.path.isfile(INIT_CFG_FILE):
+            sonic_cfggen.deep_update(data, sonic_cfggen.FormatConverter.to_deserialized(read_json_file(INIT_CFG_FILE)))
+        sonic_cfggen.deep_update(data, sonic_cfggen.FormatConverter.to_deserialized(copy.deepcopy(self.file_input)))
+        self.data = data
+
+    def write(self):
+        """Replace the CONFIG_DB content of the namespace with the loaded config"""
+        client, config_db = self._run_stage('flush', lambda: flush_configdb(self.namespace))
+
+        if self.load_sysinfo:
+            command = [str(SONIC_CFGGEN_PATH), '-H', '-k', str(self.hwsku)] + self._namespace_opts() + ['--write-to-db']
+            self._run_stage('sysinfo', lambda: clicommon.run_command(command, display_cmd=True))
+
+        self._run_stage('write', self._write)
+        client.set(config_db.INIT_INDICATOR, 1)
+
+        self._run_stage('migrate', lambda: migrate_db_to_lastest(self.namespace))
+
+    def _write(self):
+        if self.data is None:
+            config_gen_opts = []
+            if os.path.isfile(INIT_CFG_FILE):
+                config_gen_opts += ['-j', str(INIT_CFG_FILE)]
+            config_gen_opts += ['-Y', str(self.file)] + self._namespace_opts()
+            clicommon.run_command([SONIC_CFGGEN_PATH] + config_gen_opts + ['--write-to-db'], display_cmd=True)
+            return
+
+        if self.namespace is DEFAULT_NAMESPACE:
+            config_db = ConfigDBPipeConnector(use_unix_socket_path=True)
+        else:
+            config_db = ConfigDBPipeConnector(use_unix_socket_path=True, namespace=self.namespace)
+        config_db.connect(False)
+        config_db.mod_config(sonic_cfggen.FormatConverter.output_to_db(self.data))
+
+
+def load_namespace_reloads(reloads):
+    """Load the config of all the namespaces concurrently, exits if one of them can't be loaded"""
+    errors = []
+
+    def load(ns_reload):
+        try:
+            ns_reload.load()
+        except Exception as e:
+            errors.append("Failed to load the config of {}: {}".format(ns_reload.name, e))
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(reloads)) as executor:
+        list(executor.map(load, reloads))
+
+    if errors:
+        for error in errors:
+            click.secho(error, fg='magenta', err=True)
+        sys.exit(1)
+
+
+def get_namespace_reloads(cfg_files, num_cfg_file, file_format, load_sysinfo):
+    """Get the loaded NamespaceReload of every namespace which config file exists"""
+    reloads = []
+    for inst in range(-1, num_cfg_file-1):
+        namespace, file = get_reload_config_file(inst, cfg_files, file_format)
+        if not os.path.exists(file):
+            click.echo("The config file {} doesn't exist".format(file))
+            continue
+        reloads.append(NamespaceReload(namespace, file, file_format))
+
+    if not reloads:
+        return reloads
+
+    load_namespace_reloads(reloads)
+
+    # As the sequential reload does, the system info is loaded for the first
+    # namespace which config misses it and for all the following ones
+    for ns_reload in reloads:
+        if not load_sysinfo and ns_reload.file_input is not None:
+            load_sysinfo = load_sysinfo_if_missing(ns_reload.file_input)
+        if load_sysinfo:
+            ns_reload.load_sysinfo = True
+            ns_reload.hwsku = get_config_file_hwsku(ns_reload.file)
+    return reloads
+
+
+def get_single_file_namespace_reloads(filename, load_sysinfo):
+    """Get the loaded NamespaceReload of every namespace of a multi ASIC single config file"""
+    file_input = read_json_file(filename)
+    reloads = []
+    for ns in [DEFAULT_NAMESPACE, *multi_asic.get_namespace_list()]:
+        asic_name = HOST_NAMESPACE if ns == DEFAULT_NAMESPACE else ns
+        ns_reload = NamespaceReload(ns, filename, config=file_input[asic_name])
+
+        ns_reload.load_sysinfo = True if load_sysinfo else load_sysinfo_if_missing(ns_reload.config)
+        if ns_reload.load_sysinfo:
+            ns_reload.hwsku = ns_reload.config.get("DEVICE_METADATA", {}).get("localhost", {}).get("hwsku")
+            if not ns_reload.hwsku:
+                click.secho("Could not get the HWSKU from config file,  Exiting!", fg='magenta')
+                sys.exit(1)
+        reloads.append(ns_reload)
+
+    load_namespace_reloads(reloads)
+    return reloads
+
+
+def reload_namespaces_parallel(reloads):
+    """Write the loaded config of all the namespaces concurrently and report the stage timings"""
+    start = time.monotonic()
+    try:
+        delete_transceiver_tables()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(reloads)) as executor:
+            list(executor.map(lambda ns_reload: ns_reload.write(), reloads))
+    finally:
+        # The tmpfile is removed even if a namespace fails to load
+        for ns_reload in reloads:
+            if ns_reload.file.endswith("_configReloadStdin"):
+                # Remove tmpfile
+                try:
+                    os.remove(ns_reload.file)
+                except OSError as e:
+                    click.echo("An error occurred while removing the temporary file: {}".format(str(e)), err=True)
+
+    click.echo("Config reload stage timings (seconds):")
+    for ns_reload in reloads:
+        timings = ', '.join('{} {:.3f}'.format(stage, ns_reload.timings[stage])
+                            for stage in NamespaceReload.STAGES if stage in ns_reload.timings)
+        click.echo("  {}: {}, total {:.3f}".format(ns_reload.name, timings, sum(ns_reload.timings.values())))
+        log.log_notice("'reload' {} stage timings: {}".format(ns_reload.name, timings))
+    click.echo("  elapsed {:.3f}".format(time.monotonic() - start))
+
+
 def config_file_yang_validation(filename):
     config = read_json_file(filename)
 
@@ -1583,9 +1932,11 @@ config.add_command(switchport.switchport)
 @config.command()
 @click.option('-y', '--yes', is_flag=True, callback=_abort_if_false,
                 expose_value=False, prompt='Existing files will be overwritten, continue?')
+@click.option('-p', '--parallel', default=False, is_flag=True,
+              help='Dump the config of all the namespaces in-process and in parallel')
 @click.argument('filename', required=False)
 @clicommon.pass_db
-def save(db, filename):
+def save(db, filename, parallel):
     """Export current config DB to a file on disk.\n
        <filename> : Names of configuration file(s) to save, separated by comma with no spaces in between
     """
@@ -1604,12 +1955,13 @@ def save(db, filename):
         # save all ASIC configurations to that single file.
         if len(cfg_files) == 1 and multi_asic.is_multi_asic():
             filename = cfg_files[0]
-            multiasic_save_to_singlefile(db, filename)
+            multiasic_save_to_singlefile(db, filename, parallel)
             return
         elif len(cfg_files) != num_cfg_file:
             click.echo("Input {} config file(s) separated by comma for multiple files ".format(num_cfg_file))
             return
 
+    ns_files = []
     # In case of multi-asic mode we have additional config_db{NS}.json files for
     # various namespaces created per ASIC. {NS} is the namespace index.
     for inst in range(-1, num_cfg_file-1):
@@ -1628,6 +1980,10 @@ def save(db, filename):
             else:
                 file = "/etc/sonic/config_db{}.json".format(inst)
 
+        if parallel:
+            ns_files.append((DEFAULT_NAMESPACE if namespace is None else namespace, file))
+            continue
+
         if namespace is None:
             command = "{} -d --print-data > {}".format(SONIC_CFGGEN_PATH, file)
         else:
@@ -1640,6 +1996,10 @@ def save(db, filename):
         with open(file, 'w') as config_db_file:
             json.dump(config_db, config_db_file, indent=4)
 
+    if ns_files:
+        log.log_info("'save' executing...")
+        save_namespaces_parallel(ns_files)
+
 @config.command()
 @click.option('-y', '--yes', is_flag=True)
 @click.argument('filename', required=False)
@@ -1909,10 +2269,12 @@ def list_checkpoints(ctx, time, verbose):
 @click.option('-f', '--force', default=False, is_flag=True, help='Force config reload without system checks')
 @click.option('-t', '--file_format', default='config_db',type=click.Choice(['config_yang', 'config_db']),show_default=True,help='specify the file format')
 @click.option('-b', '--bypass-lock', default=False, is_flag=True, help='Do reload without acquiring lock')
+@click.option('-p', '--parallel', default=False, is_flag=True,
+              help='Load the config in-process and reload all the namespaces in parallel')
 @click.argument('filename', required=False)
 @clicommon.pass_db
 @try_lock(SYSTEM_RELOAD_LOCK, timeout=0)
-def reload(db, filename, yes, load_sysinfo, no_service_restart, force, file_format, bypass_lock):
+def reload(db, filename, yes, load_sysinfo, no_service_restart, force, file_format, bypass_lock, parallel):
     """Clear current configuration and import a previous saved config DB dump file.
        <filename> : Names of configuration file(s) to load, separated by comma with no spaces in between
     """
@@ -1960,12 +2322,24 @@ def reload(db, filename, yes, load_sysinfo, no_service_restart, force, file_form
     if filename is not None and filename != "/dev/stdin":
         config_file_yang_validation(filename)
 
+    if parallel:
+        # The config files are loaded before the services are stopped,
+        # nothing is changed if one of them is invalid
+        if multiasic_single_file_mode:
+            reloads = get_single_file_namespace_reloads(cfg_files[0], load_sysinfo)
+        else:
+            reloads = get_namespace_reloads(cfg_files, num_cfg_file, file_format, load_sysinfo)
+        if not reloads:
+            return
+
     #Stop services before config push
     if not no_service_restart:
         log.log_notice("'reload' stopping services...")
         _stop_services()
 
-    if multiasic_single_file_mode:
+    if parallel:
+        reload_namespaces_parallel(reloads)
+    elif multiasic_single_file_mode:
         multiasic_write_to_db(cfg_files[0], load_sysinfo)
     else:
         # In Single ASIC platforms we have single DB service. In multi-ASIC platforms we have a global DB
@@ -1973,29 +2347,7 @@ def reload(db, filename, yes, load_sysinfo, no_service_restart, force, file_form
         # In the below logic, we get all namespaces in this platform and add an empty namespace ''
         # denoting the current namespace which we are in ( the linux host )
         for inst in range(-1, num_cfg_file-1):
-            # Get the namespace name, for linux host it is DEFAULT_NAMESPACE
-            if inst == -1:
-                namespace = DEFAULT_NAMESPACE
-            else:
-                namespace = "{}{}".format(NAMESPACE_PREFIX, inst)
-
-            # Get the file from user input, else take the default file /etc/sonic/config_db{NS_id}.json
-            if cfg_files:
-                file = cfg_files[inst+1]
-                # Save to tmpfile in case of stdin input which can only be read once
-                if file == "/dev/stdin":
-                    file_input = read_json_file(file)
-                    (_, tmpfname) = tempfile.mkstemp(dir="/tmp", suffix="_configReloadStdin")
-                    write_json_file(file_input, tmpfname)
-                    file = tmpfname
-            else:
-                if file_format == 'config_db':
-                    if namespace is DEFAULT_NAMESPACE:
-                        file = DEFAULT_CONFIG_DB_FILE
-                    else:
-                        file = "/etc/sonic/config_db{}.json".format(inst)
-                else:
-                    file = DEFAULT_CONFIG_YANG_FILE
+            namespace, file = get_reload_config_file(inst, cfg_files, file_format)
 
             # Check the file exists before proceeding.
             if not os.path.exists(file):
@@ -2008,23 +2360,7 @@ def reload(db, filename, yes, load_sysinfo, no_service_restart, force, file_form
                     load_sysinfo = load_sysinfo_if_missing(file_input)
 
             if load_sysinfo:
-                try:
-                    command = [SONIC_CFGGEN_PATH, "-j", file, '-v', "DEVICE_METADATA.localhost.hwsku"]
-                    proc = subprocess.Popen(command, text=True, stdout=subprocess.PIPE)
-                    output, err = proc.communicate()
-
-                except FileNotFoundError as e:
-                    click.echo("{}".format(str(e)), err=True)
-                    raise click.Abort()
-                except Exception as e:
-                    click.echo("{}\n{}".format(type(e), str(e)), err=True)
-                    raise click.Abort()
-
-                if not output:
-                    click.secho("Could not get the HWSKU from config file,  Exiting!!!", fg='magenta')
-                    sys.exit(1)
-
-                cfg_hwsku = output.strip()
+                cfg_hwsku = get_config_file_hwsku(file)
 
             client, config_db = flush_configdb(namespace)
             delete_transceiver_tables()
@@ -2486,6 +2822,8 @@ def override_config_db(config_db, config_input):
     click.echo("Overriding input config to configDB ...")
     data = sonic_cfggen.FormatConverter.output_to_db(config_input)
     config_db.mod_config(data)
+    if 'PORT' in config_input:
+        port_index_util.invalidate_port_index()
     click.echo("Overriding completed. No service is restarted.")
 
 
@@ -3222,7 +3560,10 @@ def clear():
 def reload(ctx, dry_run, json_data):
     """Reload CBF configuration"""
     log.log_info("'cbf reload' executing...")
+    stage_timings = OrderedDict()
+    start = time.monotonic()
     _clear_cbf()
+    stage_timings['clear'] = time.monotonic() - start
 
     _, hwsku_path = device_info.get_paths_to_platform_and_hwsku_dirs()
     sonic_version_file = device_info.get_sonic_version_file()
@@ -3234,10 +3575,9 @@ def reload(ctx, dry_run, json_data):
     if multi_asic.get_num_asics() > 1:
         namespace_list = multi_asic.get_namespaces_from_linux()
 
-    for ns in namespace_list:
+    def render(ns):
         if ns is DEFAULT_NAMESPACE:
             asic_id_suffix = ""
-            config_db = ConfigDBConnector()
         else:
             asic_id = multi_asic.get_asic_id_from_name(ns)
             if asic_id is None:
@@ -3249,25 +3589,25 @@ def reload(ctx, dry_run, json_data):
                 raise click.Abort()
             asic_id_suffix = str(asic_id)
 
-            config_db = ConfigDBConnector(
-                use_unix_socket_path=True, namespace=ns
-            )
-
-        config_db.connect()
-
         cbf_template_file = os.path.join(hwsku_path, asic_id_suffix, "cbf.json.j2")
         if os.path.isfile(cbf_template_file):
             cmd_ns = [] if ns is DEFAULT_NAMESPACE else ['-n', str(ns)]
             fname = "{}{}".format(dry_run, asic_id_suffix) if dry_run else "config-db"
             command = [SONIC_CFGGEN_PATH] + cmd_ns + from_db + ['-t', '{},{}'.format(cbf_template_file, fname), '-y', str(sonic_version_file)]
 
-            # Apply the configuration
+            # Render and apply the configuration
             clicommon.run_command(command, display_cmd=True)
         else:
             click.secho("CBF definition template not found at {}".format(
                 cbf_template_file
             ), fg="yellow")
 
+    start = time.monotonic()
+    _run_per_namespace(render, namespace_list)
+    stage_timings['render'] = time.monotonic() - start
+
+    _report_stage_timings('cbf reload', stage_timings)
+
 #
 # 'qos' group ('config qos ...')
 #
@@ -3284,6 +3624,29 @@ def clear(verbose):
     log.log_info("'qos clear' executing...")
     _clear_qos(verbose=verbose)
 
+
+def _write_rendered_config(namespace, files, dry_run_file=None):
+    """
+    Merge the config files rendered by sonic-cfggen the way sonic-cfggen -j does it
+    and write the result to CONFIG_DB of the namespace with one pipelined mod_config(),
+    or to dry_run_file in the sonic-cfggen --print-data format
+    """
+    data = {}
+    for file in files:
+        sonic_cfggen.deep_update(data, sonic_cfggen.FormatConverter.to_deserialized(read_json_file(file)))
+
+    if dry_run_file:
+        with open(dry_run_file, 'w') as f:
+            json.dump(sonic_cfggen.FormatConverter.to_serialized(data), f, sort_keys=True, indent=4)
+        return
+
+    if namespace is DEFAULT_NAMESPACE:
+        config_db = ConfigDBPipeConnector(use_unix_socket_path=True)
+    else:
+        config_db = ConfigDBPipeConnector(use_unix_socket_path=True, namespace=namespace)
+    config_db.connect(False)
+    config_db.mod_config(sonic_cfggen.FormatConverter.output_to_db(data))
+
 def _update_buffer_calculation_model(config_db, model):
     """Update the buffer calculation model into CONFIG_DB"""
     buffer_model_changed = False
@@ -3317,8 +3680,11 @@ def reload(ctx, no_dynamic_buffer, no_delay, dry_run, json_data, ports, verbose)
         return
 
     log.log_info("'qos reload' executing...")
+    stage_timings = OrderedDict()
     if not dry_run:
+        start = time.monotonic()
         status = _clear_qos(delay=not no_delay, verbose=verbose)
+        stage_timings['clear'] = time.monotonic() - start
 
     _, hwsku_path = device_info.get_paths_to_platform_and_hwsku_dirs()
     sonic_version_file = device_info.get_sonic_version_file()
@@ -3330,10 +3696,17 @@ def reload(ctx, no_dynamic_buffer, no_delay, dry_run, json_data, ports, verbose)
     if multi_asic.get_num_asics() > 1:
         namespace_list = multi_asic.get_namespaces_from_linux()
 
-    buffer_model_updated = False
     vendors_supporting_dynamic_buffer = ["mellanox", "barefoot"]
 
-    for ns in namespace_list:
+    def render(ns):
+        """
+        Render the buffer and QoS templates of the namespace
+
+        Returns:
+            tuple(rendered files, file to write in dry run, buffer model updated),
+            the rendered files are None if a template is not found
+        """
+        buffer_model_updated = False
         if ns is DEFAULT_NAMESPACE:
             asic_id_suffix = ""
             config_db = ConfigDBConnector()
@@ -3362,43 +3735,50 @@ def reload(ctx, no_dynamic_buffer, no_delay, dry_run, json_data, ports, verbose)
             if asic_type in vendors_supporting_dynamic_buffer:
                 buffer_model_updated |= _update_buffer_calculation_model(config_db, "traditional")
 
-        if os.path.isfile(buffer_template_file):
-            qos_template_file = os.path.join(
-                hwsku_path, asic_id_suffix, "qos.json.j2"
-            )
-            if os.path.isfile(qos_template_file):
-                cmd_ns = [] if ns is DEFAULT_NAMESPACE else ['-n', str(ns)]
-                buffer_fname = "/tmp/cfg_buffer{}.json".format(asic_id_suffix)
-                qos_fname = "/tmp/cfg_qos{}.json".format(asic_id_suffix)
-
-                command = [SONIC_CFGGEN_PATH] + cmd_ns + from_db + [
-                    '-t', '{},{}'.format(buffer_template_file, buffer_fname),
-                    '-t', '{},{}'.format(qos_template_file, qos_fname),
-                    '-y', sonic_version_file
-                ]
-                clicommon.run_command(command, display_cmd=True)
-
-                command = [SONIC_CFGGEN_PATH] + cmd_ns + ["-j", buffer_fname, "-j", qos_fname]
-                if dry_run:
-                    out, rc = clicommon.run_command(command + ["--print-data"], display_cmd=True, return_cmd=True)
-                    if rc != 0:
-                        # clicommon.run_command does this by default when rc != 0 and return_cmd=False
-                        sys.exit(rc)
-                    with open("{}{}".format(dry_run, asic_id_suffix), 'w') as f:
-                        json.dump(json.loads(out), f, sort_keys=True, indent=4)
-                else:
-                    clicommon.run_command(command + ["--write-to-db"], display_cmd=True)
-
-            else:
-                click.secho("QoS definition template not found at {}".format(
-                    qos_template_file
-                ), fg="yellow")
-        else:
+        dry_run_file = "{}{}".format(dry_run, asic_id_suffix) if dry_run else None
+        if not os.path.isfile(buffer_template_file):
             click.secho("Buffer definition template not found at {}".format(
                 buffer_template_file
             ), fg="yellow")
+            return None, dry_run_file, buffer_model_updated
+
+        qos_template_file = os.path.join(
+            hwsku_path, asic_id_suffix, "qos.json.j2"
+        )
+        if not os.path.isfile(qos_template_file):
+            click.secho("QoS definition template not found at {}".format(
+                qos_template_file
+            ), fg="yellow")
+            return None, dry_run_file, buffer_model_updated
+
+        cmd_ns = [] if ns is DEFAULT_NAMESPACE else ['-n', str(ns)]
+        buffer_fname = "/tmp/cfg_buffer{}.json".format(asic_id_suffix)
+        qos_fname = "/tmp/cfg_qos{}.json".format(asic_id_suffix)
+
+        # Both templates are rendered from one load of the template context
+        command = [SONIC_CFGGEN_PATH] + cmd_ns + from_db + [
+            '-t', '{},{}'.format(buffer_template_file, buffer_fname),
+            '-t', '{},{}'.format(qos_template_file, qos_fname),
+            '-y', sonic_version_file
+        ]
+        clicommon.run_command(command, display_cmd=True)
+        return [buffer_fname, qos_fname], dry_run_file, buffer_model_updated
+
+    def write(ns):
+        files, dry_run_file, _ = rendered[ns]
+        _write_rendered_config(ns, files, dry_run_file)
+
+    start = time.monotonic()
+    rendered = dict(zip(namespace_list, _run_per_namespace(render, namespace_list)))
+    stage_timings['render'] = time.monotonic() - start
+
+    start = time.monotonic()
+    _run_per_namespace(write, [ns for ns in namespace_list if rendered[ns][0]])
+    stage_timings['write'] = time.monotonic() - start
+
+    _report_stage_timings('qos reload', stage_timings, verbose)
 
-    if buffer_model_updated:
+    if any(buffer_model_updated for _, _, buffer_model_updated in rendered.values()):
         print("Buffer calculation model updated, restarting swss is required to take effect")
 
     if not status:
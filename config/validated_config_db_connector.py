@@ -5,6 +5,7 @@ from jsonpointer import JsonPointer
 from sonic_py_common import device_info
 from generic_config_updater.generic_updater import GenericUpdater, ConfigFormat
 from generic_config_updater.gu_common import EmptyTableError, genericUpdaterLogging
+from utilities_common.bulk_db import bulk_set_entries
 
 class ValidatedConfigDBConnector(object):
     
@@ -130,3 +131,31 @@ class ValidatedConfigDBConnector(object):
 
         gcu_patch = self.create_gcu_patch(op, table, key, value)
         self.apply_patch(gcu_patch, table)
+
+    def set_entries(self, table, entries):
+        """
+        set_entry() of many entries of a table, validated and applied as one
+        patch if YANG validation is enabled, written in one pipeline otherwise
+
+        Args:
+            table: table name
+            entries: {key: value} in the set_entry() format, the entry is deleted if value is None
+        """
+        if not entries:
+            return
+        if not self.yang_enabled:
+            current = self.connector.get_table(table)
+            bulk_set_entries(self.connector, table, entries,
+                             current={key: current[key] for key in entries if key in current})
+            return
+
+        gcu_json_input = []
+        if not self.get_table(table) and any(value is not None for value in entries.values()):
+            gcu_json_input.append({"op": "add", "path": "/{}".format(table), "value": {}})
+        for key, value in entries.items():
+            patch_path, patch_value = self.make_path_value_jsonpatch_compatible(table, key, value)
+            if value is None:
+                gcu_json_input.append({"op": "remove", "path": patch_path})
+            else:
+                gcu_json_input.append({"op": "add", "path": patch_path, "value": patch_value})
+        self.apply_patch(jsonpatch.JsonPatch(gcu_json_input), table)
@@ -3,7 +3,10 @@ import utilities_common.cli as clicommon
 import utilities_common.dhcp_relay_util as dhcp_relay_util
 
 from jsonpatch import JsonPatchConflict
+from natsort import natsorted
+from sonic_py_common.interface import get_intf_longname
 from time import sleep
+from utilities_common.bulk_db import TableSnapshot, bulk_set_entries
 from .utils import log
 from .validated_config_db_connector import ValidatedConfigDBConnector
 from . import stp
@@ -271,6 +274,68 @@ def vlan_member():
     pass
 
 
+class VlanMemberSnapshot(object):
+    """
+    CONFIG_DB tables checked by 'vlan member add/del', read once per command
+    so that a range of VLANs and a list of ports are validated in memory.
+    config_db is a TableSnapshot which serves the clicommon checks of a port.
+    """
+
+    def __init__(self, config_db):
+        self.config_db = TableSnapshot(config_db)
+        self.vlans = set(self.config_db.get_table('VLAN'))
+        self.vlan_members = self.config_db.get_table('VLAN_MEMBER')
+        self.portchannel_members = self.config_db.get_table('PORTCHANNEL_MEMBER')
+        self.vlan_sub_interfaces = self.config_db.get_table('VLAN_SUB_INTERFACE')
+
+    def is_untagged_member(self, port):
+        return any(intf == port and data.get('tagging_mode') == 'untagged'
+                   for (_, intf), data in self.vlan_members.items())
+
+    def has_sub_interfaces(self, port):
+        return any(get_intf_longname(intf).partition('.')[0] == port
+                   for intf in self.vlan_sub_interfaces if isinstance(intf, str))
+
+
+def get_vlan_member_port_name(ctx, db, port):
+    if clicommon.get_interface_naming_mode() == "alias":  # TODO: MISSING CONSTRAINT IN YANG MODEL
+        alias = port
+        iface_alias_converter = clicommon.InterfaceAliasConverter(db)
+        port = iface_alias_converter.alias_to_name(alias)
+        if port is None:
+            ctx.fail("cannot find port name for alias {}".format(alias))
+    return port
+
+
+def validate_vlan_ids(ctx, snapshot, vid_list):
+    for vid in vid_list:
+        vlan = 'Vlan{}'.format(vid)
+        if not clicommon.is_vlanid_in_range(vid):
+            ctx.fail("Invalid VLAN ID {} (2-4094)".format(vid))
+        if vlan not in snapshot.vlans:
+            ctx.fail("{} does not exist".format(vlan))
+
+
+def disable_stp_on_vlan_ports(db, members):
+    """disable_stp_on_vlan_port() of many (vlan, port) VLAN members"""
+    if members and stp.is_global_stp_enabled(db) is True:
+        bulk_set_entries(db, 'STP_VLAN_PORT', {member: None for member in members})
+        for port in natsorted({port for _, port in members}):
+            if len(stp.get_vlan_list_for_interface(db, port)) == 0:
+                db.set_entry('STP_PORT', port, None)
+
+
+def commit_vlan_members(ctx, config_db, members, vid, error):
+    """Write all the VLAN_MEMBER entries with one pipeline or one validated patch"""
+    vlans = natsorted({vlan for vlan, _ in members})
+    ports = natsorted({port for _, port in members})
+    vlan = vlans[0] if len(vlans) == 1 else 'Vlan {}'.format(vid)
+    try:
+        config_db.set_entries('VLAN_MEMBER', members)
+    except (ValueError, JsonPatchConflict):
+        ctx.fail(error.format(vlan=vlan, port=','.join(ports)))
+
+
 @vlan_member.command('add')
 @click.argument('vid', metavar='<vid>', required=True)
 @click.argument('port', metavar='port', required=True)
@@ -279,78 +344,68 @@ def vlan_member():
 @click.option('-e', '--except_flag', is_flag=True, help="Skips the given vlans and adds all other existing vlans")
 @clicommon.pass_db
 def add_vlan_member(db, vid, port, untagged, multiple, except_flag):
-    """Add VLAN member"""
+    """Add VLAN member, the port may be a comma separated list of ports"""
 
     ctx = click.get_current_context()
 
-    # parser will parse the vid input if there are syntax errors it will throw error
-    vid_list = clicommon.vlan_member_input_parser(ctx, "add", db, except_flag, multiple, vid, port)
-    # multiple vlan command cannot be used to add multiple untagged vlan members
-    if untagged and (multiple or except_flag or vid == "all"):
-        ctx.fail("{} cannot have more than one untagged Vlan.".format(port))
     config_db = ValidatedConfigDBConnector(db.cfgdb)
     if ADHOC_VALIDATION:
-        for vid in vid_list:
-            vlan = 'Vlan{}'.format(vid)
+        snapshot = VlanMemberSnapshot(db.cfgdb)
+        members = {}
+        for member_port in port.replace(" ", "").split(","):
+            # parser will parse the vid input if there are syntax errors it will throw error
+            vid_list = clicommon.vlan_member_input_parser(ctx, "add", db, except_flag, multiple, vid, member_port)
+            # multiple vlan command cannot be used to add multiple untagged vlan members
+            if untagged and (multiple or except_flag or vid == "all"):
+                ctx.fail("{} cannot have more than one untagged Vlan.".format(member_port))
+            log.log_info("'vlan member add {} {}' executing...".format(vid, member_port))
+
             # default vlan checker
-            if vid == 1:
-                ctx.fail("{} is default VLAN".format(vlan))
-            log.log_info("'vlan member add {} {}' executing...".format(vid, port))
-            if not clicommon.is_vlanid_in_range(vid):
-                ctx.fail("Invalid VLAN ID {} (2-4094)".format(vid))
-            if clicommon.check_if_vlanid_exist(db.cfgdb, vlan) is False:
-                ctx.fail("{} does not exist".format(vlan))
-            if clicommon.get_interface_naming_mode() == "alias":  # TODO: MISSING CONSTRAINT IN YANG MODEL
-                alias = port
-                iface_alias_converter = clicommon.InterfaceAliasConverter(db)
-                port = iface_alias_converter.alias_to_name(alias)
-                if port is None:
-                    ctx.fail("cannot find port name for alias {}".format(alias))
-            if clicommon.is_port_mirror_dst_port(db.cfgdb, port):  # TODO: MISSING CONSTRAINT IN YANG MODEL
-                ctx.fail("{} is configured as mirror destination port".format(port))
-            if clicommon.is_port_vlan_member(db.cfgdb, port, vlan):  # TODO: MISSING CONSTRAINT IN YANG MODEL
-                ctx.fail("{} is already a member of {}".format(port, vlan))
-            if clicommon.is_valid_port(db.cfgdb, port):
+            if 1 in vid_list:
+                ctx.fail("Vlan1 is default VLAN")
+            validate_vlan_ids(ctx, snapshot, vid_list)
+            member_port = get_vlan_member_port_name(ctx, db, member_port)
+            # TODO: MISSING CONSTRAINT IN YANG MODEL
+            if clicommon.is_port_mirror_dst_port(snapshot.config_db, member_port):
+                ctx.fail("{} is configured as mirror destination port".format(member_port))
+            for vlan_id in vid_list:
+                vlan = 'Vlan{}'.format(vlan_id)
+                # TODO: MISSING CONSTRAINT IN YANG MODEL
+                if (vlan, member_port) in snapshot.vlan_members or (vlan, member_port) in members:
+                    ctx.fail("{} is already a member of {}".format(member_port, vlan))
+            if clicommon.is_valid_port(snapshot.config_db, member_port):
                 is_port = True
-            elif clicommon.is_valid_portchannel(db.cfgdb, port):
+            elif clicommon.is_valid_portchannel(snapshot.config_db, member_port):
                 is_port = False
             else:
-                ctx.fail("{} does not exist".format(port))
-            if (is_port and clicommon.is_port_router_interface(db.cfgdb, port)) or \
-                (not is_port and clicommon.is_pc_router_interface(
-                    db.cfgdb, port)):  # TODO: MISSING CONSTRAINT IN YANG MODEL
-                ctx.fail("{} is a router interface!".format(port))
-            portchannel_member_table = db.cfgdb.get_table('PORTCHANNEL_MEMBER')
+                ctx.fail("{} does not exist".format(member_port))
+            if (is_port and clicommon.is_port_router_interface(snapshot.config_db, member_port)) or \
+                (not is_port and clicommon.is_pc_router_interface(snapshot.config_db, member_port)) or \
+                    snapshot.has_sub_interfaces(member_port):  # TODO: MISSING CONSTRAINT IN YANG MODEL
+                ctx.fail("{} is a router interface!".format(member_port))
             if (is_port and clicommon.interface_is_in_portchannel(
-                 portchannel_member_table, port)):  # TODO: MISSING CONSTRAINT IN YANG MODEL
-                ctx.fail("{} is part of portchannel!".format(port))
-            if (clicommon.interface_is_untagged_member(
-                    db.cfgdb, port) and untagged):  # TODO: MISSING CONSTRAINT IN YANG MODEL
-                ctx.fail("{} is already untagged member!".format(port))
+                 snapshot.portchannel_members, member_port)):  # TODO: MISSING CONSTRAINT IN YANG MODEL
+                ctx.fail("{} is part of portchannel!".format(member_port))
+            if snapshot.is_untagged_member(member_port) and untagged:  # TODO: MISSING CONSTRAINT IN YANG MODEL
+                ctx.fail("{} is already untagged member!".format(member_port))
             # checking mode status of port if its access, trunk or routed
-            if is_port:
-                port_data = config_db.get_entry('PORT', port)
-            # if not port then is a port channel
-            elif not is_port:
-                port_data = config_db.get_entry('PORTCHANNEL', port)
-            existing_mode = None
-            if "mode" in port_data:
-                existing_mode = port_data["mode"]
+            port_data = snapshot.config_db.get_table('PORT' if is_port else 'PORTCHANNEL').get(member_port, {})
+            existing_mode = port_data.get("mode")
             if existing_mode == "routed":
-                ctx.fail("{} is in routed mode!\nUse switchport mode command to change port mode".format(port))
+                ctx.fail("{} is in routed mode!\nUse switchport mode command to change port mode".format(member_port))
             mode_type = "access" if untagged else "trunk"
             if existing_mode == "access" and mode_type == "trunk":  # TODO: MISSING CONSTRAINT IN YANG MODEL
-                ctx.fail("{} is in access mode! Tagged Members cannot be added".format(port))
-            elif existing_mode == mode_type or (existing_mode == "trunk" and mode_type == "access"):
-                pass
+                ctx.fail("{} is in access mode! Tagged Members cannot be added".format(member_port))
+
+            for vlan_id in vid_list:
+                members['Vlan{}'.format(vlan_id), member_port] = {'tagging_mode': "untagged" if untagged else "tagged"}
 
-            # If port is being made L2 port, enable STP
-            enable_stp_on_port(db.cfgdb, port)
+        # If port is being made L2 port, enable STP
+        for member_port in natsorted({member_port for _, member_port in members}):
+            enable_stp_on_port(db.cfgdb, member_port)
 
-            try:
-                config_db.set_entry('VLAN_MEMBER', (vlan, port), {'tagging_mode': "untagged" if untagged else "tagged"})
-            except ValueError:
-                ctx.fail("{} invalid or does not exist, or {} invalid or does not exist".format(vlan, port))
+        commit_vlan_members(ctx, config_db, members, vid,
+                            "{vlan} invalid or does not exist, or {port} invalid or does not exist")
 
 
 @vlan_member.command('del')
@@ -360,43 +415,33 @@ def add_vlan_member(db, vid, port, untagged, multiple, except_flag):
 @click.option('-e', '--except_flag', is_flag=True, help="Skips the given vlans and adds all other existing vlans")
 @clicommon.pass_db
 def del_vlan_member(db, vid, port, multiple, except_flag):
-    """Delete VLAN member"""
+    """Delete VLAN member, the port may be a comma separated list of ports"""
 
     ctx = click.get_current_context()
 
-    # parser will parse the vid input if there are syntax errors it will throw error
-
-    vid_list = clicommon.vlan_member_input_parser(ctx, "del", db, except_flag, multiple, vid, port)
-
     config_db = ValidatedConfigDBConnector(db.cfgdb)
     if ADHOC_VALIDATION:
-        for vid in vid_list:
-            log.log_info("'vlan member del {} {}' executing...".format(vid, port))
-
-            if not clicommon.is_vlanid_in_range(vid):
-                ctx.fail("Invalid VLAN ID {} (2-4094)".format(vid))
-
-            vlan = 'Vlan{}'.format(vid)
-
-            if clicommon.check_if_vlanid_exist(db.cfgdb, vlan) is False:
-                ctx.fail("{} does not exist".format(vlan))
-
-            if clicommon.get_interface_naming_mode() == "alias":  # TODO: MISSING CONSTRAINT IN YANG MODEL
-                alias = port
-                iface_alias_converter = clicommon.InterfaceAliasConverter(db)
-                port = iface_alias_converter.alias_to_name(alias)
-                if port is None:
-                    ctx.fail("cannot find port name for alias {}".format(alias))
-
-            if not clicommon.is_port_vlan_member(db.cfgdb, port, vlan):  # TODO: MISSING CONSTRAINT IN YANG MODEL
-                ctx.fail("{} is not a member of {}".format(port, vlan))
-
-            # If port is being made non-L2 port, disable STP
-            disable_stp_on_vlan_port(db.cfgdb, vlan, port)
-
-            try:
-                config_db.set_entry('VLAN_MEMBER', (vlan, port), None)
-                delete_db_entry("DHCPv6_COUNTER_TABLE|{}".format(port), db.db, db.db.STATE_DB)
-                delete_db_entry("DHCP_COUNTER_TABLE|{}".format(port), db.db, db.db.STATE_DB)
-            except JsonPatchConflict:
-                ctx.fail("{} invalid or does not exist, or {} is not a member of {}".format(vlan, port, vlan))
+        snapshot = VlanMemberSnapshot(db.cfgdb)
+        members = {}
+        for member_port in port.replace(" ", "").split(","):
+            # parser will parse the vid input if there are syntax errors it will throw error
+            vid_list = clicommon.vlan_member_input_parser(ctx, "del", db, except_flag, multiple, vid, member_port)
+            log.log_info("'vlan member del {} {}' executing...".format(vid, member_port))
+
+            validate_vlan_ids(ctx, snapshot, vid_list)
+            member_port = get_vlan_member_port_name(ctx, db, member_port)
+            for vlan_id in vid_list:
+                vlan = 'Vlan{}'.format(vlan_id)
+                if (vlan, member_port) not in snapshot.vlan_members:  # TODO: MISSING CONSTRAINT IN YANG MODEL
+                    ctx.fail("{} is not a member of {}".format(member_port, vlan))
+                members[vlan, member_port] = None
+
+        # If port is being made non-L2 port, disable STP
+        disable_stp_on_vlan_ports(db.cfgdb, list(members))
+
+        commit_vlan_members(ctx, config_db, members, vid,
+                            "{vlan} invalid or does not exist, or {port} is not a member of {vlan}")
+
+        for member_port in natsorted({member_port for _, member_port in members}):
+            delete_db_entry("DHCPv6_COUNTER_TABLE|{}".format(member_port), db.db, db.db.STATE_DB)
+            delete_db_entry("DHCP_COUNTER_TABLE|{}".format(member_port), db.db, db.db.STATE_DB)
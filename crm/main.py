@@ -1,10 +1,12 @@
 #!/usr/bin/env python3
 
 import click
+from concurrent.futures import ThreadPoolExecutor
 from swsscommon.swsscommon import ConfigDBConnector
 from tabulate import tabulate
 from sonic_py_common import multi_asic
 from utilities_common.general import load_db_config
+from utilities_common.bulk_db import bulk_get_all
 from utilities_common import multi_asic as multi_asic_util
 
 from sonic_py_common import device_info
@@ -15,6 +17,9 @@ from .dash_show import show_dash
 
 platform_info = device_info.get_platform_info()
 
+# Maximum number of namespaces which CRM stats are read concurrently
+CRM_SNAPSHOT_WORKERS = 16
+
 
 class Crm:
 
@@ -42,6 +47,8 @@ class Crm:
         self.db = None
         self.cfgdb = db
         self.multi_asic = multi_asic_util.MultiAsic()
+        # CRM stats by namespace, {namespace: {COUNTERS_DB key: {field: value}}}
+        self.snapshots = {}
 
     def get_thresholds_list(self):
         return list(self.thresholds)
@@ -118,11 +125,58 @@ class Crm:
         click.echo(tabulate(data, headers=header, tablefmt="simple", missingval=""))
         click.echo()
 
+    @staticmethod
+    def read_snapshot(db):
+        """
+        Read all the CRM stats of a namespace in one pass
+        """
+        return bulk_get_all(db, db.COUNTERS_DB, 'CRM:*')
+
+    def read_snapshots(self):
+        """
+        Read the CRM stats of all the namespaces to display, concurrently
+        """
+        current_namespace = self.multi_asic.current_namespace
+        ns_list = self.multi_asic.get_ns_list_based_on_options()
+        if current_namespace not in ns_list:
+            ns_list.append(current_namespace)
+
+        def read(ns):
+            if ns == current_namespace:
+                db = self.db
+            elif self.multi_asic.db and self.multi_asic.db.db_clients.get(ns):
+                db = self.multi_asic.db.db_clients[ns]
+            else:
+                db = multi_asic.connect_to_all_dbs_for_ns(ns)
+            return ns, self.read_snapshot(db)
+
+        if len(ns_list) == 1:
+            self.snapshots.update([read(ns_list[0])])
+            return
+
+        with ThreadPoolExecutor(max_workers=min(len(ns_list), CRM_SNAPSHOT_WORKERS)) as executor:
+            self.snapshots.update(executor.map(read, ns_list))
+
+    def get_snapshot(self):
+        """
+        CRM stats of the current namespace, the stats of all the namespaces
+        are read on the first call and every view is built from them.
+        """
+        if self.multi_asic.current_namespace not in self.snapshots:
+            self.read_snapshots()
+        return self.snapshots[self.multi_asic.current_namespace]
+
+    def get_snapshot_entries(self, prefix):
+        """
+        CRM stats entries which keys start with the prefix, in the order they were read
+        """
+        return {key: entry for key, entry in self.get_snapshot().items() if key.startswith(prefix)}
+
     def get_resources(self, resource):
         """
         CRM Handler to get resources information.
         """
-        crm_stats = self.db.get_all(self.db.COUNTERS_DB, 'CRM:STATS')
+        crm_stats = self.get_snapshot().get('CRM:STATS')
         data = []
 
         if crm_stats:
@@ -141,10 +195,11 @@ class Crm:
         CRM Handler to get ACL recources information.
         """
         data = []
+        acl_stats = self.get_snapshot()
 
         for stage in ["INGRESS", "EGRESS"]:
             for bind_point in ["PORT", "LAG", "VLAN", "RIF", "SWITCH"]:
-                crm_stats = self.db.get_all(self.db.COUNTERS_DB, 'CRM:ACL_STATS:{0}:{1}'.format(stage, bind_point))
+                crm_stats = acl_stats.get('CRM:ACL_STATS:{0}:{1}'.format(stage, bind_point))
 
                 if crm_stats:
                     for res in ["acl_group", "acl_table"]:
@@ -160,15 +215,13 @@ class Crm:
         CRM Handler to display ACL table information.
         """
         # Retrieve all ACL table keys from CRM:ACL_TABLE_STATS
-        crm_acl_keys = self.db.keys(self.db.COUNTERS_DB, 'CRM:ACL_TABLE_STATS*')
+        crm_acl_stats = self.get_snapshot_entries('CRM:ACL_TABLE_STATS')
         data = []
 
-        for key in crm_acl_keys or [None]:
+        for key, crm_stats in crm_acl_stats.items():
             if key:
                 id = key.replace('CRM:ACL_TABLE_STATS:', '')
 
-                crm_stats = self.db.get_all(self.db.COUNTERS_DB, key)
-
                 for res in ['acl_entry', 'acl_counter']:
                     if ('crm_stats_' + res + '_used' in crm_stats) and ('crm_stats_' + res + '_available' in crm_stats):
                         data.append([id, res, crm_stats['crm_stats_' + res + '_used'], crm_stats['crm_stats_' + res + '_available']])
@@ -276,14 +329,12 @@ class DashCrm(Crm):
 
     def get_dash_acl_group_resources(self, resource=None):
         # Retrieve all ACL table keys from CRM:ACL_TABLE_STATS
-        crm_acl_keys = self.db.keys(self.db.COUNTERS_DB, 'CRM:DASH_ACL_GROUP_STATS*')
+        crm_acl_stats = self.get_snapshot_entries('CRM:DASH_ACL_GROUP_STATS')
         data = []
 
-        for key in crm_acl_keys:
+        for key, crm_stats in crm_acl_stats.items():
             id = key.replace('CRM:DASH_ACL_GROUP_STATS:', '')
 
-            crm_stats = self.db.get_all(self.db.COUNTERS_DB, key)
-
             query = [resource] if resource else self.dash_acl_group_resources
             for res in query:
                 used = f'crm_stats_{res}_used'
@@ -2,11 +2,14 @@ import os
 import sys
 import json
 import re
+import time
+import threading
 import click
+from concurrent.futures import ThreadPoolExecutor
 from tabulate import tabulate
 from sonic_py_common import multi_asic
 from utilities_common.constants import DEFAULT_NAMESPACE
-from dump.match_infra import RedisSource, JsonSource, MatchEngine, CONN
+from dump.match_infra import RedisSource, JsonSource, MatchEngine, PrefetchMatchEngine, CONN
 from swsscommon.swsscommon import ConfigDBConnector
 from dump import plugins
 
@@ -49,7 +52,11 @@ def dump(ctx):
               help="Prints any intermediate output to stdout useful for dev & troubleshooting")
 @click.option('--namespace', '-n', default=DEFAULT_NAMESPACE, type=str,
               show_default=True, help='Dump the redis-state for this namespace.')
-def state(ctx, module, identifier, db, table, key_map, verbose, namespace):
+@click.option('--workers', '-w', default=1, type=click.IntRange(1, 64), show_default=True,
+              help="Number of ids dumped in parallel when the identifier is 'all'")
+@click.option('--timing', is_flag=True, default=False, show_default=True,
+              help="Print the time taken by each stage of the dump to stderr")
+def state(ctx, module, identifier, db, table, key_map, verbose, namespace, workers, timing):
     """
     Dump the current state of the identifier for the specified module from Redis DB or CONFIG_FILE
     """
@@ -70,22 +77,32 @@ def state(ctx, module, identifier, db, table, key_map, verbose, namespace):
     else:
         os.environ["VERBOSE"] = "0"
 
-    obj = plugins.dump_modules[module](ctx.obj)
+    timings = []
+    start = time.time()
+    match_engine = ctx.obj
+    if identifier == "all":
+        # Read the tables the plugin depends on once, instead of once per id
+        match_engine = PrefetchMatchEngine(ctx.obj.conn_pool)
+        num_keys = match_engine.prefetch(namespace, plugins.dump_modules[module].PREFETCH_TABLES)
+        start = add_timing(timings, "prefetch", start, "{} keys".format(num_keys))
+
+    obj = plugins.dump_modules[module](match_engine)
 
     if identifier == "all":
         ids = obj.get_all_args(namespace)
     else:
         ids = identifier.split(",")
 
-    params = {}
-    collected_info = {}
-    params['namespace'] = namespace
-    for arg in ids:
-        params[plugins.dump_modules[module].ARG_NAME] = arg
-        try:
-            collected_info[arg] = obj.execute(params)
-        except ValueError as err:
-            click.fail(f"Failed to execute plugin: {err}")
+    # The plugins reading APPL_DB with the redis library are not thread safe, and without prefetched
+    # tables every read goes to redis behind the lock, so the ids are dumped one by one
+    if not isinstance(match_engine, PrefetchMatchEngine) or obj.return_pb2_obj() or not obj.PREFETCH_TABLES:
+        workers = 1
+
+    try:
+        collected_info = execute_plugin(module, obj, match_engine, ids, namespace, workers)
+    except ValueError as err:
+        ctx.fail(f"Failed to execute plugin: {err}")
+    start = add_timing(timings, "execute", start, "{} ids, {} workers".format(len(ids), workers))
 
     if len(db) > 0:
         collected_info = filter_out_dbs(db, collected_info)
@@ -93,16 +110,54 @@ def state(ctx, module, identifier, db, table, key_map, verbose, namespace):
     vidtorid = extract_rid(collected_info, namespace, ctx.obj.conn_pool)
 
     if not key_map:
-        collected_info = populate_fv(collected_info, module, namespace, ctx.obj.conn_pool, obj.return_pb2_obj())
+        collected_info = populate_fv(collected_info, module, namespace, ctx.obj.conn_pool, obj.return_pb2_obj(),
+                                     match_engine)
 
     for id in vidtorid.keys():
         collected_info[id]["ASIC_DB"]["vidtorid"] = vidtorid[id]
+    add_timing(timings, "populate", start)
 
     print_dump(collected_info, table, module, identifier, key_map)
 
+    if timing:
+        print_timings(timings, module)
+
     return
 
 
+def execute_plugin(module, obj, match_engine, ids, namespace, workers):
+    """ Execute the plugin for all the ids, each worker thread executes its own plugin object """
+    if workers <= 1:
+        collected_info = {}
+        params = {'namespace': namespace}
+        for arg in ids:
+            params[plugins.dump_modules[module].ARG_NAME] = arg
+            collected_info[arg] = obj.execute(params)
+        return collected_info
+
+    local = threading.local()
+
+    def execute(arg):
+        if not hasattr(local, "obj"):
+            local.obj = plugins.dump_modules[module](match_engine)
+        params = {'namespace': namespace, plugins.dump_modules[module].ARG_NAME: arg}
+        return local.obj.execute(params)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return dict(zip(ids, executor.map(execute, ids)))
+
+
+def add_timing(timings, stage, start, info=""):
+    end = time.time()
+    timings.append((stage, "{:.3f}".format(end - start), info))
+    return end
+
+
+def print_timings(timings, module):
+    click.echo("Module: {}".format(module), err=True)
+    click.echo(tabulate(timings, ["Stage", "Time(s)", "Info"]), err=True)
+
+
 def extract_rid(info, ns, conn_pool):
     r = RedisSource(conn_pool)
     r.connect("ASIC_DB", ns)
@@ -145,7 +200,7 @@ def filter_out_dbs(db_list, collected_info):
     return collected_info
 
 
-def populate_fv(info, module, namespace, conn_pool, dash_object):
+def populate_fv(info, module, namespace, conn_pool, dash_object, match_engine=None):
     all_dbs = set()
     for id in info.keys():
         for db_name in info[id].keys():
@@ -181,7 +236,11 @@ def populate_fv(info, module, namespace, conn_pool, dash_object):
                         print("Issue in importing dash module!")
                         return final_info
                 else:
-                    fv = db_conn.get_all(db_name, key)
+                    fv = None
+                    if isinstance(match_engine, PrefetchMatchEngine):
+                        fv = match_engine.get_entry(db_name, key, namespace)
+                    if fv is None:
+                        fv = db_conn.get_all(db_name, key)
                 final_info[id][db_name]["keys"].append({key: fv})
     return final_info
 
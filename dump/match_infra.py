@@ -1,11 +1,13 @@
 import json
 import fnmatch
 import copy
+import threading
 from abc import ABC, abstractmethod
 from dump.helper import verbose_print
 from swsscommon.swsscommon import SonicV2Connector, SonicDBConfig
 from sonic_py_common import multi_asic
 from utilities_common.constants import DEFAULT_NAMESPACE
+from utilities_common.bulk_db import BULK_CHUNK_SIZE, bulk_get_entries
 import redis
 
 
@@ -31,6 +33,20 @@ EXCEP_DICT = {
 }
 
 
+def match_field_value(f_values, value, match_entire_list):
+    """ Check if the value of a field matches the value requested """
+    if not f_values:
+        return False
+    if "," in f_values and not match_entire_list:
+        return value in f_values.split(",")
+    return value == f_values
+
+
+def create_error_template(err):
+    verbose_print("MatchEngine: \n" + err)
+    return {"error": err, "keys": [], "return_values": {}}
+
+
 class MatchRequest:
     """
     Request Object which should be passed to the MatchEngine
@@ -165,6 +181,16 @@ class SourceAdapter(ABC):
     def hgetall(self, db, key):
         raise NotImplementedError
 
+    def get_bulk(self, db, keys, fields=None):
+        """ Return {key: {field: value}} for all the keys, only the fields requested are returned if provided """
+        entries = {}
+        for key in keys:
+            if fields:
+                entries[key] = {field: self.hget(db, key, field) for field in fields}
+            else:
+                entries[key] = self.get(db, key)
+        return entries
+
 
 class RedisSource(SourceAdapter):
     """ Concrete Adaptor Class for connecting to Redis Data Sources """
@@ -196,6 +222,12 @@ class RedisSource(SourceAdapter):
     def hgetall(self, db, key):
         return self.conn.get_all(db, key)
 
+    def get_bulk(self, db, keys, fields=None):
+        entries = bulk_get_entries(self.conn, db, keys, fields)
+        if fields:
+            return {key: {field: entries.get(key, {}).get(field) for field in fields} for key in keys}
+        return {key: entries.get(key, {}) for key in keys}
+
 
 class RedisPySource(SourceAdapter):
     """ Concrete Adaptor Class for connecting to APPL_DB using Redis library"""
@@ -242,6 +274,23 @@ class RedisPySource(SourceAdapter):
         key_val = self.conn.hgetall(key)
         return self.get_decoded_value(self.pb_obj, key_val)
 
+    def get_bulk(self, db, keys, fields=None):
+        """ Read the keys with pipelined HGETALLs, one round trip per chunk of keys """
+        entries = {}
+        for i in range(0, len(keys), BULK_CHUNK_SIZE):
+            chunk = keys[i:i + BULK_CHUNK_SIZE]
+            pipe = self.conn.pipeline(transaction=False)
+            for key in chunk:
+                pipe.hgetall(key)
+            for key, key_val in zip(chunk, pipe.execute()):
+                decoded_dict = self.get_decoded_value(self.pb_obj, key_val)
+                if fields:
+                    entries[key] = {field: (decoded_dict or {}).get(field) for field in fields}
+                else:
+                    entries[key] = decoded_dict
+        return entries
+
+
 class JsonSource(SourceAdapter):
     """ Concrete Adaptor Class for connecting to JSON Data Sources """
 
@@ -389,40 +438,49 @@ class MatchEngine:
         return {"error": "", "keys": [], "return_values": {}}
 
     def __display_error(self, err):
-        template = self.__create_template()
-        template['error'] = err
-        verbose_print("MatchEngine: \n" + template['error'])
-        return template
+        return create_error_template(err)
 
-    def __filter_out_keys(self, src, req, all_matched_keys):
+    def __prefetch(self, src, req, all_matched_keys):
+        """
+        Read the filter field together with the return fields in one bulk read,
+        instead of reading the return fields of the filtered keys in a second one
+        """
+        if not req.field or not req.just_keys or not req.return_fields:
+            return None
+        fields = [req.field] + [field for field in req.return_fields if field != req.field]
+        return src.get_bulk(req.db, all_matched_keys, fields)
+
+    def __filter_out_keys(self, src, req, all_matched_keys, entries=None):
         # TODO: Custom Callbacks for Complex Matching Criteria
         if not req.field:
             return all_matched_keys
 
         filtered_keys = []
+        if entries is None:
+            entries = src.get_bulk(req.db, all_matched_keys, [req.field])
         for key in all_matched_keys:
-            f_values = src.hget(req.db, key, req.field)
-            if not f_values:
-                continue
-            if "," in f_values and not req.match_entire_list:
-                f_value = f_values.split(",")
-            else:
-                f_value = [f_values]
-            if req.value in f_value:
+            if match_field_value(entries[key][req.field], req.value, req.match_entire_list):
                 filtered_keys.append(key)
         return filtered_keys
 
-    def __fill_template(self, src, req, filtered_keys, template):
+    def __fill_template(self, src, req, filtered_keys, template, entries=None):
+        if entries is None:
+            entries = {}
+            if not req.just_keys:
+                entries = src.get_bulk(req.db, filtered_keys)
+            elif len(req.return_fields) > 0:
+                entries = src.get_bulk(req.db, filtered_keys, req.return_fields)
+
         for key in filtered_keys:
             temp = {}
             if not req.just_keys:
-                temp[key] = src.get(req.db, key)
+                temp[key] = entries[key]
                 template["keys"].append(temp)
             elif len(req.return_fields) > 0:
                 template["keys"].append(key)
                 template["return_values"][key] = {}
                 for field in req.return_fields:
-                    template["return_values"][key][field] = src.hget(req.db, key, field)
+                    template["return_values"][key][field] = entries[key][field]
             else:
                 template["keys"].append(key)
         verbose_print("Return Values:" + str(template["return_values"]))
@@ -447,77 +505,73 @@ class MatchEngine:
         if not all_matched_keys:
             return self.__display_error(EXCEP_DICT["NO_MATCHES"])
 
-        filtered_keys = self.__filter_out_keys(src, req, all_matched_keys)
+        entries = self.__prefetch(src, req, all_matched_keys)
+        filtered_keys = self.__filter_out_keys(src, req, all_matched_keys, entries)
         verbose_print("Filtered Keys:" + str(filtered_keys))
         if not filtered_keys:
             return self.__display_error(EXCEP_DICT["NO_ENTRIES"])
-        return self.__fill_template(src, req, filtered_keys, template)
+        return self.__fill_template(src, req, filtered_keys, template, entries)
 
 
 class MatchRequestOptimizer():
     """
-    A Stateful Wrapper which reduces the number of calls to redis by caching the keys
-    The Cache saves all the fv-pairs for a key
-    Caching would only happen when the "key_pattern" is an absolute key and is not a glob-style pattern
+    A Stateful Wrapper which reduces the number of calls to redis by caching the fetched entries
+    The first request for a table and key_pattern fetches all the fv-pairs of all the keys matching the pattern,
+    regardless of the field filter and return fields requested. The later requests for the same pattern,
+    or for an absolute key fetched before, are served from the cache, the field filter and the
+    return fields of the request are applied on the cached entries.
     """
 
     def __init__(self, m_engine):
         self.__key_cache = {}
+        self.__pattern_cache = {}
         self.m_engine = m_engine
 
     def __mutate_request(self, req):
         """
-        Mutate the Request to fetch all the fv pairs, regardless of the orignal request
-        Save the return_fields and just_keys args of original request
-        """
-        fv_requested = []
-        ret_just_keys = req.just_keys
-        fv_requested = copy.deepcopy(req.return_fields)
-        if ret_just_keys:
-            req.just_keys = False
-            req.return_fields = []
-        return req, fv_requested, ret_just_keys
-
-    def __mutate_response(self, ret, fv_requested, ret_just_keys):
+        Mutate the Request to fetch all the fv pairs of all the keys matching the pattern,
+        regardless of the orignal request
         """
-        Mutate the Response based on what was originally asked.
-        """
-        if not ret_just_keys:
-            return ret
-        new_ret = {"error": "", "keys": [], "return_values": {}}
-        for key_fv in ret["keys"]:
-            if isinstance(key_fv, dict):
-                keys = key_fv.keys()
-                new_ret["keys"].extend(keys)
-                for key in keys:
-                    new_ret["return_values"][key] = {}
-                    for field in fv_requested:
-                        new_ret["return_values"][key][field] = key_fv[key].get(field, "")
-        return new_ret
+        req.just_keys = False
+        req.return_fields = []
+        req.field = None
+        req.value = None
+        return req
 
-    def __fill_cache(self, ret):
+    def __fill_cache(self, ret, source):
         """
-        Fill the cache with all the fv-pairs
+        Fill the cache with all the fv-pairs, the keys are cached per (db, file, ns) source
         """
+        entries = {}
         for key_fv in ret["keys"]:
-            keys = key_fv.keys()
-            for key in keys:
-                self.__key_cache[key] = key_fv[key]
+            for key, fv in key_fv.items():
+                entries[key] = fv
+                self.__key_cache[source + (key,)] = fv
+        return entries
 
-    def __fetch_from_cache(self, key, req):
+    def __fetch_from_cache(self, entries, req):
         """
-        Cache will have all the fv-pairs of the requested key
+        Cache will have all the fv-pairs of the requested keys
         Response will be tailored based on what was asked
         """
+        if not entries:
+            return create_error_template(EXCEP_DICT["NO_MATCHES"])
+
         new_ret = {"error": "", "keys": [], "return_values": {}}
-        if not req.just_keys:
-            new_ret["keys"].append(self.__key_cache[key])
-        else:
-            new_ret["keys"].append(key)
-            if req.return_fields:
-                new_ret["return_values"][key] = {}
-                for field in req.return_fields:
-                    new_ret["return_values"][key][field] = self.__key_cache[key][field]
+        for key, fv in entries.items():
+            if req.field and not match_field_value(fv.get(req.field), req.value, req.match_entire_list):
+                continue
+            if not req.just_keys:
+                new_ret["keys"].append({key: fv})
+            else:
+                new_ret["keys"].append(key)
+                if req.return_fields:
+                    new_ret["return_values"][key] = {}
+                    for field in req.return_fields:
+                        new_ret["return_values"][key][field] = fv.get(field, "")
+
+        if not new_ret["keys"]:
+            return create_error_template(EXCEP_DICT["NO_ENTRIES"])
         return new_ret
 
     def fetch(self, req_orig):
@@ -526,14 +580,121 @@ class MatchRequestOptimizer():
         if req.db:
             sep = SonicDBConfig.getSeparator(req.db)
         key = req.table + sep + req.key_pattern
-        if key in self.__key_cache:
+        source = (req.db, req.file, req.ns)
+        pattern = source + (key,)
+        if pattern in self.__key_cache:
             verbose_print("Cache Hit for Key: {}".format(key))
-            return self.__fetch_from_cache(key, req)
-        else:
-            verbose_print("Cache Miss for Key: {}".format(key))
-            req, fv_requested, ret_just_keys = self.__mutate_request(req)
-            ret = self.m_engine.fetch(req)
-            if ret["error"]:
-                return ret
-            self.__fill_cache(ret)
-            return self.__mutate_response(ret, fv_requested, ret_just_keys)
+            return self.__fetch_from_cache({key: self.__key_cache[pattern]}, req)
+
+        if pattern in self.__pattern_cache:
+            verbose_print("Cache Hit for Pattern: {}".format(key))
+            return self.__fetch_from_cache(self.__pattern_cache[pattern], req)
+
+        verbose_print("Cache Miss for Key: {}".format(key))
+        ret = self.m_engine.fetch(self.__mutate_request(copy.deepcopy(req)))
+        if ret["error"] and ret["error"] != EXCEP_DICT["NO_MATCHES"]:
+            return ret
+        self.__pattern_cache[pattern] = self.__fill_cache(ret, source)
+        return self.__fetch_from_cache(self.__pattern_cache[pattern], req)
+
+
+class PrefetchedRedisSource(RedisSource):
+    """ RedisSource which serves the tables prefetched by a PrefetchMatchEngine from memory """
+
+    def __init__(self, conn_pool, m_engine):
+        super().__init__(conn_pool)
+        self.m_engine = m_engine
+        self.tables = {}
+        self.entries = {}
+
+    def connect(self, db, ns):
+        self.tables = self.m_engine.tables.get((ns, db), {})
+        self.entries = self.m_engine.entries.get((ns, db), {})
+        with self.m_engine.lock:
+            return super().connect(db, ns)
+
+    def getKeys(self, db, table, key_pattern):
+        if table not in self.tables:
+            with self.m_engine.lock:
+                return super().getKeys(db, table, key_pattern)
+        keys = self.tables[table]
+        if key_pattern == "*":
+            return list(keys)
+        pattern = table + self.get_separator(db) + key_pattern
+        if not any(c in key_pattern for c in "*?["):
+            return [pattern] if pattern in keys else []
+        return fnmatch.filter(keys, pattern.replace("[^", "[!"))
+
+    def get(self, db, key):
+        if key in self.entries:
+            return dict(self.entries[key])
+        with self.m_engine.lock:
+            return super().get(db, key)
+
+    def hget(self, db, key, field):
+        if key in self.entries:
+            return self.entries[key].get(field)
+        with self.m_engine.lock:
+            return super().hget(db, key, field)
+
+    def hgetall(self, db, key):
+        return self.get(db, key)
+
+    def get_bulk(self, db, keys, fields=None):
+        missing = [key for key in keys if key not in self.entries]
+        entries = {}
+        if missing:
+            with self.m_engine.lock:
+                entries = super().get_bulk(db, missing, fields)
+        for key in keys:
+            if key in entries:
+                continue
+            if fields:
+                entries[key] = {field: self.entries[key].get(field) for field in fields}
+            else:
+                entries[key] = dict(self.entries[key])
+        return entries
+
+
+class PrefetchMatchEngine(MatchEngine):
+    """
+    MatchEngine which reads whole tables once, the requests on these tables are served from memory
+    The requests on the other tables go to redis, serialized by a lock, so that the plugins
+    can be executed for several ids in parallel
+    """
+
+    def __init__(self, pool=None):
+        super().__init__(pool)
+        self.tables = {}  # (ns, db) -> {table: {key: fv}}
+        self.entries = {}  # (ns, db) -> {key: fv}
+        self.lock = threading.Lock()
+
+    def get_redis_source_adapter(self):
+        return PrefetchedRedisSource(self.conn_pool, self)
+
+    def prefetch(self, ns, tables):
+        """
+        Read all the keys of the tables, a list of (db, table) tuples, in the namespace
+
+        Returns:
+            the number of keys read
+        """
+        src = RedisSource(self.conn_pool)
+        count = 0
+        for db, table in tables:
+            if table in self.tables.get((ns, db), {}):
+                continue
+            if not src.connect(db, ns):
+                continue
+            keys = src.getKeys(db, table, "*") or []
+            fvs = src.get_bulk(db, keys)
+            self.tables.setdefault((ns, db), {})[table] = fvs
+            self.entries.setdefault((ns, db), {}).update(fvs)
+            count += len(fvs)
+            verbose_print("PrefetchMatchEngine: {} keys of {} {}".format(len(fvs), db, table))
+        return count
+
+    def get_entry(self, db, key, ns):
+        """ Return the fv-pairs of a prefetched key, None if the key was not prefetched """
+        fv = self.entries.get((ns, db), {}).get(key)
+        return dict(fv) if fv is not None else None
@@ -17,6 +17,13 @@ class Acl_Rule(Executor):
     Debug Dump Plugin for ACL Rule Module
     """
     ARG_NAME = "acl_rule_name"
+    PREFETCH_TABLES = [
+        ("CONFIG_DB", "ACL_RULE"),
+        ("APPL_DB", APP_RULE_NAME),
+        ("ASIC_DB", ASIC_DB_SEPARATOR.join(["ASIC_STATE", "SAI_OBJECT_TYPE_ACL_COUNTER"])),
+        ("ASIC_DB", ASIC_DB_SEPARATOR.join(["ASIC_STATE", "SAI_OBJECT_TYPE_ACL_ENTRY"])),
+        ("ASIC_DB", ASIC_DB_SEPARATOR.join(["ASIC_STATE", "SAI_OBJECT_TYPE_ACL_RANGE"])),
+    ]
 
     def __init__(self, match_engine=None):
         super().__init__(match_engine)
@@ -19,6 +19,18 @@ class Acl_Table(Executor):
     Debug Dump Plugin for ACL Table Module
     """
     ARG_NAME = "acl_table_name"
+    PREFETCH_TABLES = [
+        ("CONFIG_DB", "ACL_TABLE"),
+        ("CONFIG_DB", "ACL_TABLE_TYPE"),
+        ("CONFIG_DB", "ACL_RULE"),
+        ("APPL_DB", APP_TABLE_NAME),
+        ("APPL_DB", APP_TABLE_TYPE_NAME),
+        ("APPL_DB", APP_RULE_NAME),
+        ("ASIC_DB", ASIC_DB_SEPARATOR.join(["ASIC_STATE", "SAI_OBJECT_TYPE_ACL_COUNTER"])),
+        ("ASIC_DB", ASIC_DB_SEPARATOR.join(["ASIC_STATE", "SAI_OBJECT_TYPE_ACL_TABLE"])),
+        ("ASIC_DB", ASIC_DB_SEPARATOR.join(["ASIC_STATE", "SAI_OBJECT_TYPE_ACL_TABLE_GROUP_MEMBER"])),
+        ("ASIC_DB", ASIC_DB_SEPARATOR.join(["ASIC_STATE", "SAI_OBJECT_TYPE_ACL_TABLE_GROUP"])),
+    ]
 
     def __init__(self, match_engine=None):
         super().__init__(match_engine)
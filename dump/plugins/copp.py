@@ -64,6 +64,19 @@ class Copp(Executor):
 
     ARG_NAME = "trap_id"
     CONFIG_FILE = "/etc/sonic/copp_cfg.json"
+    PREFETCH_TABLES = [
+        ("CONFIG_DB", CFG_COPP_TRAP_TABLE_NAME),
+        ("CONFIG_DB", CFG_COPP_GROUP_TABLE_NAME),
+        ("APPL_DB", APP_COPP_TABLE_NAME),
+        ("STATE_DB", "COPP_TRAP_TABLE"),
+        ("STATE_DB", "COPP_GROUP_TABLE"),
+        ("ASIC_DB", ASIC_TRAP_OBJ),
+        ("ASIC_DB", ASIC_TRAP_GROUP_OBJ),
+        ("ASIC_DB", ASIC_HOSTIF_TABLE_ENTRY),
+        ("ASIC_DB", ASIC_HOSTIF),
+        ("ASIC_DB", ASIC_POLICER_OBJ),
+        ("ASIC_DB", ASIC_QUEUE_OBJ),
+    ]
 
     def __init__(self, match_engine=None):
         super().__init__(match_engine)
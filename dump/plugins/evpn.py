@@ -8,6 +8,13 @@ class Evpn(Executor):
     Debug Dump Plugin for EVPN Module
     """
     ARG_NAME = "Remote VNI"
+    PREFETCH_TABLES = [
+        ("APPL_DB", "VXLAN_REMOTE_VNI_TABLE"),
+        ("STATE_DB", "VXLAN_TUNNEL_TABLE"),
+        ("ASIC_DB", "ASIC_STATE:SAI_OBJECT_TYPE_TUNNEL"),
+        ("ASIC_DB", "ASIC_STATE:SAI_OBJECT_TYPE_TUNNEL_TERM_TABLE_ENTRY"),
+        ("ASIC_DB", "ASIC_STATE:SAI_OBJECT_TYPE_TUNNEL_MAP"),
+    ]
 
     def __init__(self, match_engine=None):
         super().__init__(match_engine)
@@ -10,6 +10,7 @@ class Executor(ABC):
 
     ARG_NAME = "id"  # Arg Identifier
     CONFIG_FILE = ""  # Path to config file, if any
+    PREFETCH_TABLES = []  # (db, table) read at once when the plugin is executed for all the ids
 
     def __init__(self, match_engine=None):
         if not isinstance(match_engine, MatchEngine):
@@ -8,6 +8,15 @@ class Fdb(Executor):
     Debug Dump Plugin for FDB Module
     """
     ARG_NAME = "Vlan:fdb_entry"
+    PREFETCH_TABLES = [
+        ("APPL_DB", "FDB_TABLE"),
+        ("APPL_DB", "VXLAN_FDB_TABLE"),
+        ("APPL_DB", "MCLAG_FDB_TABLE"),
+        ("STATE_DB", "FDB_TABLE"),
+        ("ASIC_DB", "ASIC_STATE:SAI_OBJECT_TYPE_VLAN"),
+        ("ASIC_DB", "ASIC_STATE:SAI_OBJECT_TYPE_FDB_ENTRY"),
+        ("ASIC_DB", "ASIC_STATE:SAI_OBJECT_TYPE_BRIDGE_PORT"),
+    ]
 
     def __init__(self, match_engine=None):
         super().__init__(match_engine)
@@ -14,6 +14,20 @@ class Interface(Executor):
     Human readable intf string names are supported
     """
     ARG_NAME = "intf_name"
+    PREFETCH_TABLES = [
+        ("CONFIG_DB", "INTERFACE"),
+        ("CONFIG_DB", "PORTCHANNEL_INTERFACE"),
+        ("CONFIG_DB", "VLAN_INTERFACE"),
+        ("CONFIG_DB", "LOOPBACK_INTERFACE"),
+        ("CONFIG_DB", "VLAN_SUB_INTERFACE"),
+        ("CONFIG_DB", "PORTCHANNEL_MEMBER"),
+        ("APPL_DB", "INTF_TABLE"),
+        ("STATE_DB", "INTERFACE_TABLE"),
+        ("ASIC_DB", "ASIC_STATE:SAI_OBJECT_TYPE_ROUTER_INTERFACE"),
+        ("ASIC_DB", "ASIC_STATE:SAI_OBJECT_TYPE_HOSTIF"),
+        ("ASIC_DB", "ASIC_STATE:SAI_OBJECT_TYPE_VLAN"),
+        ("ASIC_DB", "ASIC_STATE:SAI_OBJECT_TYPE_LAG_MEMBER"),
+    ]
 
     def __init__(self, match_engine=None):
         super().__init__(match_engine)
@@ -9,6 +9,13 @@ class Port(Executor):
     Debug Dump Plugin for PORT Module
     """
     ARG_NAME = "port_name"
+    PREFETCH_TABLES = [
+        ("CONFIG_DB", "PORT"),
+        ("APPL_DB", "PORT_TABLE"),
+        ("STATE_DB", "PORT_TABLE"),
+        ("ASIC_DB", "ASIC_STATE:SAI_OBJECT_TYPE_HOSTIF"),
+        ("ASIC_DB", "ASIC_STATE:SAI_OBJECT_TYPE_PORT"),
+    ]
 
     def __init__(self, match_engine=None):
         super().__init__(match_engine)
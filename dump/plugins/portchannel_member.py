@@ -7,6 +7,13 @@ class Portchannel_Member(Executor):
     Debug Dump Plugin for PortChannel/LAG Module
     """
     ARG_NAME = "portchannel_member"
+    PREFETCH_TABLES = [
+        ("CONFIG_DB", "PORTCHANNEL_MEMBER"),
+        ("APPL_DB", "LAG_MEMBER_TABLE"),
+        ("STATE_DB", "LAG_MEMBER_TABLE"),
+        ("ASIC_DB", "ASIC_STATE:SAI_OBJECT_TYPE_HOSTIF"),
+        ("ASIC_DB", "ASIC_STATE:SAI_OBJECT_TYPE_LAG_MEMBER"),
+    ]
 
     def __init__(self, match_engine=None):
         super().__init__(match_engine)
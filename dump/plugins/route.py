@@ -41,6 +41,19 @@ class Route(Executor):
     Debug Dump Plugin for Route Module
     """
     ARG_NAME = "destination_network"
+    PREFETCH_TABLES = [
+        ("CONFIG_DB", "STATIC_ROUTE"),
+        ("APPL_DB", "ROUTE_TABLE"),
+        ("APPL_DB", "CLASS_BASED_NEXT_HOP_GROUP_TABLE"),
+        ("APPL_DB", "NEXTHOP_GROUP_TABLE"),
+        ("ASIC_DB", "ASIC_STATE:SAI_OBJECT_TYPE_ROUTE_ENTRY"),
+        ("ASIC_DB", "ASIC_STATE:SAI_OBJECT_TYPE_VIRTUAL_ROUTER"),
+        ("ASIC_DB", NH),
+        ("ASIC_DB", NH_GRP),
+        ("ASIC_DB", "ASIC_STATE:SAI_OBJECT_TYPE_NEXT_HOP_GROUP_MEMBER"),
+        ("ASIC_DB", RIF),
+        ("ASIC_DB", CPU_PORT),
+    ]
 
     def __init__(self, match_engine=None):
         super().__init__(match_engine)
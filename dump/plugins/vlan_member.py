@@ -5,6 +5,15 @@ from dump.helper import create_template_dict
 class Vlan_Member(Executor):
 
     ARG_NAME = "vlan_member_name"
+    PREFETCH_TABLES = [
+        ("CONFIG_DB", "VLAN_MEMBER"),
+        ("APPL_DB", "VLAN_MEMBER_TABLE"),
+        ("STATE_DB", "VLAN_MEMBER_TABLE"),
+        ("ASIC_DB", "ASIC_STATE:SAI_OBJECT_TYPE_VLAN"),
+        ("ASIC_DB", "ASIC_STATE:SAI_OBJECT_TYPE_HOSTIF"),
+        ("ASIC_DB", "ASIC_STATE:SAI_OBJECT_TYPE_BRIDGE_PORT"),
+        ("ASIC_DB", "ASIC_STATE:SAI_OBJECT_TYPE_VLAN_MEMBER"),
+    ]
     
     def __init__(self, match_engine=None):
         super().__init__(match_engine)
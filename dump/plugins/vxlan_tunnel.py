@@ -8,6 +8,14 @@ class Vxlan_tunnel(Executor):
     Debug Dump Plugin for Vxlan Tunnel Module
     """
     ARG_NAME = "vxlan_tunnel_name"
+    PREFETCH_TABLES = [
+        ("CONFIG_DB", "VXLAN_TUNNEL"),
+        ("APPL_DB", "VXLAN_TUNNEL_TABLE"),
+        ("STATE_DB", "VXLAN_TUNNEL_TABLE"),
+        ("ASIC_DB", "ASIC_STATE:SAI_OBJECT_TYPE_TUNNEL"),
+        ("ASIC_DB", "ASIC_STATE:SAI_OBJECT_TYPE_TUNNEL_TERM_TABLE_ENTRY"),
+        ("ASIC_DB", "ASIC_STATE:SAI_OBJECT_TYPE_TUNNEL_MAP"),
+    ]
 
     def __init__(self, match_engine=None):
         super().__init__(match_engine)
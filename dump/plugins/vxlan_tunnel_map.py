@@ -8,6 +8,12 @@ class Vxlan_tunnel_map(Executor):
     Debug Dump Plugin for Vxlan Tunnel Map Module
     """
     ARG_NAME = "vxlan_tunnel_map_name"
+    PREFETCH_TABLES = [
+        ("CONFIG_DB", "VXLAN_TUNNEL_MAP"),
+        ("APPL_DB", "VXLAN_TUNNEL_MAP_TABLE"),
+        ("ASIC_DB", "ASIC_STATE:SAI_OBJECT_TYPE_TUNNEL_MAP_ENTRY"),
+        ("ASIC_DB", "ASIC_STATE:SAI_OBJECT_TYPE_TUNNEL_MAP"),
+    ]
 
     def __init__(self, match_engine=None):
         super().__init__(match_engine)
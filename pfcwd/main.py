@@ -9,6 +9,7 @@ from sonic_py_common.multi_asic import get_external_ports
 from tabulate import tabulate
 from utilities_common import multi_asic as multi_asic_util
 from utilities_common import constants
+from utilities_common.bulk_db import TableSnapshot, bulk_get_entries
 from utilities_common.general import load_db_config
 from sonic_py_common import logger
 
@@ -54,6 +55,8 @@ CONFIG_DESCRIPTION = [
 ]
 
 STATS_HEADER = ('QUEUE', 'STATUS',) + list(zip(*STATS_DESCRIPTION))[0]
+# Queue counters read by the stats, the other queue counters are not fetched
+STATS_FIELDS = ['PFC_WD_STATUS'] + [field for stat in STATS_DESCRIPTION for field in stat[1:]]
 CONFIG_HEADER = ('PORT',) + list(zip(*CONFIG_DESCRIPTION))[0]
 
 CONFIG_DB_PFC_WD_TABLE_NAME = 'PFC_WD'
@@ -65,8 +68,10 @@ def cli():
     """ SONiC PFC Watchdog """
     load_db_config()
 
-def get_all_queues(db, namespace=None, display=constants.DISPLAY_ALL):
-    queue_names = db.get_all(db.COUNTERS_DB, 'COUNTERS_QUEUE_NAME_MAP')
+
+def get_all_queues(db, namespace=None, display=constants.DISPLAY_ALL, queue_names=None):
+    if queue_names is None:
+        queue_names = db.get_all(db.COUNTERS_DB, 'COUNTERS_QUEUE_NAME_MAP')
     queues = list(queue_names.keys()) if queue_names else {}
     if display == constants.DISPLAY_ALL:
         return natsorted(queues)
@@ -128,29 +133,46 @@ class PfcwdCli(object):
         self.table = []
         self.all_ports = []
 
+    def get_pfcwd_table(self):
+        """
+        PFC_WD table of the current namespace read in bulk
+        """
+        return TableSnapshot(self.config_db).get_table(
+            CONFIG_DB_PFC_WD_TABLE_NAME
+        )
+
     @multi_asic_util.run_on_multi_asic
     def collect_stats(self, empty, queues):
         table = []
 
+        queue_names = self.db.get_all(
+            self.db.COUNTERS_DB, 'COUNTERS_QUEUE_NAME_MAP'
+        ) or {}
+
         if len(queues) == 0:
             queues = get_all_queues(
                 self.db,
                 self.multi_asic.current_namespace,
-                self.multi_asic.display_option
+                self.multi_asic.display_option,
+                queue_names
             )
+            if not empty:
+                # Only the lossless queues of the ports PFC watchdog
+                # is configured on have watchdog stats
+                pfcwd_ports = self.get_pfcwd_table()
+                queues = [
+                    q for q in queues if q.split(':')[0] in pfcwd_ports
+                ]
+
+        queues = [q for q in queues if q in queue_names]
+        all_stats = bulk_get_entries(
+            self.db, self.db.COUNTERS_DB,
+            ['COUNTERS:' + queue_names[q] for q in queues], STATS_FIELDS
+        )
 
         for queue in queues:
             stats_list = []
-            queue_oid = self.db.get(
-                self.db.COUNTERS_DB, 'COUNTERS_QUEUE_NAME_MAP', queue
-            )
-            if queue_oid is None:
-                continue
-            stats = self.db.get_all(
-                self.db.COUNTERS_DB, 'COUNTERS:' + queue_oid
-            )
-            if stats is None:
-                continue
+            stats = all_stats.get('COUNTERS:' + queue_names[queue], {})
             for stat in STATS_DESCRIPTION:
                 line = stats.get(stat[1], '0') + '/' + stats.get(stat[2], '0')
                 stats_list.append(line)
@@ -196,12 +218,12 @@ class PfcwdCli(object):
                 self.multi_asic.display_option
             )
 
+        pfcwd_table = self.get_pfcwd_table()
+
         ports_found = False
         for port in ports:
             config_list = []
-            config_entry = self.config_db.get_entry(
-                CONFIG_DB_PFC_WD_TABLE_NAME, port
-            )
+            config_entry = pfcwd_table.get(port)
             if config_entry is None or config_entry == {}:
                 continue
             ports_found = True
@@ -213,9 +235,7 @@ class PfcwdCli(object):
         if not ports_found:
             return
 
-        poll_interval = self.config_db.get_entry(
-            CONFIG_DB_PFC_WD_TABLE_NAME, 'GLOBAL'
-        ).get('POLL_INTERVAL')
+        poll_interval = pfcwd_table.get('GLOBAL', {}).get('POLL_INTERVAL')
 
         current_ns = self.multi_asic.current_namespace
         asic_namesapce = \
@@ -229,9 +249,7 @@ class PfcwdCli(object):
                 )
             )
 
-        big_red_switch = self.config_db.get_entry(
-            CONFIG_DB_PFC_WD_TABLE_NAME, 'GLOBAL'
-        ).get('BIG_RED_SWITCH')
+        big_red_switch = pfcwd_table.get('GLOBAL', {}).get('BIG_RED_SWITCH')
 
         if big_red_switch is not None:
             click.echo("BIG_RED_SWITCH status is {}{}".format(
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 
 from swsscommon.swsscommon import SonicV2Connector
+from utilities_common.bulk_db import bulk_get_all, bulk_get_entries
 import json
 import socket
 import struct
@@ -10,6 +11,7 @@ from fcntl import ioctl
 import binascii
 import argparse
 import syslog
+import time
 import traceback
 import ipaddress
 from builtins import str #for unicode conversion in python2
@@ -18,17 +20,13 @@ from builtins import str #for unicode conversion in python2
 ARP_CHUNK = binascii.unhexlify('08060001080006040001') # defines a part of the packet for ARP Request
 ARP_PAD = binascii.unhexlify('00' * 18)
 
-def generate_neighbor_entries(filename, all_available_macs):
-    db = SonicV2Connector(use_unix_socket_path=False)
-    db.connect(db.APPL_DB, False)   # Make one attempt only
 
+def generate_neighbor_entries(filename, all_available_macs, app_db):
     arp_output = []
     neighbor_entries = []
-    keys = db.keys(db.APPL_DB, 'NEIGH_TABLE:*')
-    keys = [] if keys is None else keys
-    for key in keys:
+    entries = bulk_get_all(app_db, app_db.APPL_DB, 'NEIGH_TABLE:*')
+    for key, entry in entries.items():
         vlan_name = key.split(':')[1]
-        entry = db.get_all(db.APPL_DB, key)
         mac = entry['neigh'].lower()
         if (vlan_name, mac) not in all_available_macs:
             # FIXME: print me to log
@@ -43,8 +41,6 @@ def generate_neighbor_entries(filename, all_available_macs):
         neighbor_entries.append((vlan_name, mac, ip_addr))
         syslog.syslog(syslog.LOG_INFO, "Neighbor entry: [Vlan: %s, Mac: %s, Ip: %s]" % (vlan_name, mac, ip_addr))
 
-    db.close(db.APPL_DB)
-
     with open(filename, 'w') as fp:
         json.dump(arp_output, fp, indent=2, separators=(',', ': '))
 
@@ -61,12 +57,52 @@ def get_vlan_ifaces():
 
     return vlans
 
-def get_bridge_port_id_2_port_id(db):
+
+class AsicSnapshot(object):
+    """
+    ASIC_DB objects required to generate the FDB entries.
+    All the object types are read once in bulk and indexed,
+    so that no DB access is done per LAG member, VLAN or MAC.
+    """
+
+    def __init__(self, asic_db, app_db):
+        self.bridge_ports = bulk_get_all(asic_db, asic_db.ASIC_DB, 'ASIC_STATE:SAI_OBJECT_TYPE_BRIDGE_PORT:oid:*',
+                                         fields=['SAI_BRIDGE_PORT_ATTR_TYPE', 'SAI_BRIDGE_PORT_ATTR_PORT_ID'])
+        self.hostifs = bulk_get_all(asic_db, asic_db.ASIC_DB, 'ASIC_STATE:SAI_OBJECT_TYPE_HOSTIF:oid:*',
+                                    fields=['SAI_HOSTIF_ATTR_TYPE', 'SAI_HOSTIF_ATTR_OBJ_ID', 'SAI_HOSTIF_ATTR_NAME'])
+        self.lag_members = bulk_get_all(asic_db, asic_db.ASIC_DB, 'ASIC_STATE:SAI_OBJECT_TYPE_LAG_MEMBER:oid:*',
+                                        fields=['SAI_LAG_MEMBER_ATTR_LAG_ID', 'SAI_LAG_MEMBER_ATTR_PORT_ID'])
+        vlans = bulk_get_all(asic_db, asic_db.ASIC_DB, 'ASIC_STATE:SAI_OBJECT_TYPE_VLAN:oid:*',
+                             fields=['SAI_VLAN_ATTR_VLAN_ID'])
+        fdb_entries = bulk_get_all(asic_db, asic_db.ASIC_DB, 'ASIC_STATE:SAI_OBJECT_TYPE_FDB_ENTRY:*',
+                                   fields=['SAI_FDB_ENTRY_ATTR_TYPE', 'SAI_FDB_ENTRY_ATTR_BRIDGE_PORT_ID'])
+        lag_member_keys = app_db.keys(app_db.APPL_DB, 'LAG_MEMBER_TABLE:*')
+        lag_member_keys = [] if lag_member_keys is None else lag_member_keys
+
+        # LAG member name -> LAG name
+        self.member_2_lag = {}
+        for key in lag_member_keys:
+            _, lag_name, lag_member_name = key.split(":")
+            self.member_2_lag.setdefault(lag_member_name, lag_name)
+
+        # VLAN id -> VLAN oid
+        self.vlan_id_2_bvid = {}
+        for key, value in vlans.items():
+            bvid = key.replace('ASIC_STATE:SAI_OBJECT_TYPE_VLAN:', '')
+            self.vlan_id_2_bvid.setdefault(int(value['SAI_VLAN_ATTR_VLAN_ID']), bvid)
+
+        # VLAN oid -> [(FDB entry key object, FDB entry attributes)]
+        self.fdb_by_bvid = {}
+        for key, value in fdb_entries.items():
+            key_obj = json.loads(key.replace('ASIC_STATE:SAI_OBJECT_TYPE_FDB_ENTRY:', ''))
+            if 'bvid' not in key_obj:
+                continue
+            self.fdb_by_bvid.setdefault(key_obj['bvid'], []).append((key_obj, value))
+
+
+def get_bridge_port_id_2_port_id(snapshot):
     bridge_port_id_2_port_id = {}
-    keys = db.keys(db.ASIC_DB, 'ASIC_STATE:SAI_OBJECT_TYPE_BRIDGE_PORT:oid:*')
-    keys = [] if keys is None else keys
-    for key in keys:
-        value = db.get_all(db.ASIC_DB, key)
+    for key, value in snapshot.bridge_ports.items():
         port_type = value['SAI_BRIDGE_PORT_ATTR_TYPE']
         if port_type != 'SAI_BRIDGE_PORT_TYPE_PORT':
             continue
@@ -77,58 +113,51 @@ def get_bridge_port_id_2_port_id(db):
 
     return bridge_port_id_2_port_id
 
-def get_lag_by_member(member_name, app_db):
-    keys = app_db.keys(app_db.APPL_DB, 'LAG_MEMBER_TABLE:*')
-    keys = [] if keys is None else keys
-    for key in keys:
-        _, lag_name, lag_member_name = key.split(":")
-        if lag_member_name == member_name:
-            return lag_name
-    return None
 
-def get_map_host_port_id_2_iface_name(asic_db):
+def get_lag_by_member(member_name, snapshot):
+    return snapshot.member_2_lag.get(member_name)
+
+
+def get_map_host_port_id_2_iface_name(snapshot):
     host_port_id_2_iface = {}
-    keys = asic_db.keys(asic_db.ASIC_DB, 'ASIC_STATE:SAI_OBJECT_TYPE_HOSTIF:oid:*')
-    keys = [] if keys is None else keys
-    for key in keys:
-        value = asic_db.get_all(asic_db.ASIC_DB, key)
+    for value in snapshot.hostifs.values():
         if value['SAI_HOSTIF_ATTR_TYPE'] != 'SAI_HOSTIF_TYPE_NETDEV':
             continue
         port_id = value['SAI_HOSTIF_ATTR_OBJ_ID']
         iface_name = value['SAI_HOSTIF_ATTR_NAME']
         host_port_id_2_iface[port_id] = iface_name
-    
+
     return host_port_id_2_iface
 
-def get_map_lag_port_id_2_portchannel_name(asic_db, app_db, host_port_id_2_iface):
+
+def get_map_lag_port_id_2_portchannel_name(snapshot, host_port_id_2_iface):
     lag_port_id_2_iface = {}
-    keys = asic_db.keys(asic_db.ASIC_DB, 'ASIC_STATE:SAI_OBJECT_TYPE_LAG_MEMBER:oid:*')
-    keys = [] if keys is None else keys
-    for key in keys:
-        value = asic_db.get_all(asic_db.ASIC_DB, key)
+    for value in snapshot.lag_members.values():
         lag_id = value['SAI_LAG_MEMBER_ATTR_LAG_ID']
         if lag_id in lag_port_id_2_iface:
             continue
         member_id = value['SAI_LAG_MEMBER_ATTR_PORT_ID']
         member_name = host_port_id_2_iface[member_id]
-        lag_name = get_lag_by_member(member_name, app_db)
+        lag_name = get_lag_by_member(member_name, snapshot)
         if lag_name is not None:
             lag_port_id_2_iface[lag_id] = lag_name
 
     return lag_port_id_2_iface
 
-def get_map_port_id_2_iface_name(asic_db, app_db):
+
+def get_map_port_id_2_iface_name(snapshot):
     port_id_2_iface = {}
-    host_port_id_2_iface = get_map_host_port_id_2_iface_name(asic_db)
+    host_port_id_2_iface = get_map_host_port_id_2_iface_name(snapshot)
     port_id_2_iface.update(host_port_id_2_iface)
-    lag_port_id_2_iface = get_map_lag_port_id_2_portchannel_name(asic_db, app_db, host_port_id_2_iface)
+    lag_port_id_2_iface = get_map_lag_port_id_2_portchannel_name(snapshot, host_port_id_2_iface)
     port_id_2_iface.update(lag_port_id_2_iface)
 
     return port_id_2_iface
 
-def get_map_bridge_port_id_2_iface_name(asic_db, app_db):
-    bridge_port_id_2_port_id = get_bridge_port_id_2_port_id(asic_db)
-    port_id_2_iface = get_map_port_id_2_iface_name(asic_db, app_db)
+
+def get_map_bridge_port_id_2_iface_name(snapshot):
+    bridge_port_id_2_port_id = get_bridge_port_id_2_port_id(snapshot)
+    port_id_2_iface = get_map_port_id_2_iface_name(snapshot)
 
     bridge_port_id_2_iface_name = {}
 
@@ -140,37 +169,30 @@ def get_map_bridge_port_id_2_iface_name(asic_db, app_db):
 
     return bridge_port_id_2_iface_name
 
-def get_vlan_oid_by_vlan_id(db, vlan_id):
-    keys = db.keys(db.ASIC_DB, 'ASIC_STATE:SAI_OBJECT_TYPE_VLAN:oid:*')
-    keys = [] if keys is None else keys
-    for key in keys:
-        value = db.get_all(db.ASIC_DB, key)
-        if 'SAI_VLAN_ATTR_VLAN_ID' in value and int(value['SAI_VLAN_ATTR_VLAN_ID']) == vlan_id:
-            return key.replace('ASIC_STATE:SAI_OBJECT_TYPE_VLAN:', '')
+
+def get_vlan_oid_by_vlan_id(snapshot, vlan_id):
+    if vlan_id in snapshot.vlan_id_2_bvid:
+        return snapshot.vlan_id_2_bvid[vlan_id]
 
     raise Exception('Not found bvi oid for vlan_id: %d' % vlan_id)
 
-def get_fdb(db, vlan_name, vlan_id, bridge_id_2_iface):
+
+def get_fdb(snapshot, vlan_name, vlan_id, bridge_id_2_iface):
     fdb_types = {
       'SAI_FDB_ENTRY_TYPE_DYNAMIC': 'dynamic',
       'SAI_FDB_ENTRY_TYPE_STATIC' : 'static'
     }
 
-    bvid = get_vlan_oid_by_vlan_id(db, vlan_id)
+    bvid = get_vlan_oid_by_vlan_id(snapshot, vlan_id)
     available_macs = set()
     map_mac_ip = {}
     fdb_entries = []
-    keys = db.keys(db.ASIC_DB, 'ASIC_STATE:SAI_OBJECT_TYPE_FDB_ENTRY:{*\"bvid\":\"%s\"*}' % bvid)
-    keys = [] if keys is None else keys
-    for key in keys:
-        key_obj = json.loads(key.replace('ASIC_STATE:SAI_OBJECT_TYPE_FDB_ENTRY:', ''))
+    for key_obj, value in snapshot.fdb_by_bvid.get(bvid, []):
         mac = str(key_obj['mac'])
         if not is_mac_unicast(mac):
             continue
         available_macs.add((vlan_name, mac.lower()))
         fdb_mac = mac.replace(':', '-')
-        # get attributes
-        value = db.get_all(db.ASIC_DB, key)
         fdb_type = fdb_types[value['SAI_FDB_ENTRY_ATTR_TYPE']]
         if value['SAI_FDB_ENTRY_ATTR_BRIDGE_PORT_ID'] not in bridge_id_2_iface:
             continue
@@ -189,19 +211,12 @@ def get_fdb(db, vlan_name, vlan_id, bridge_id_2_iface):
 
     return fdb_entries, available_macs, map_mac_ip
 
-def generate_fdb_entries(filename):
-    asic_db = SonicV2Connector(use_unix_socket_path=False)
-    app_db = SonicV2Connector(use_unix_socket_path=False)
-    asic_db.connect(asic_db.ASIC_DB, False)   # Make one attempt only
-    app_db.connect(app_db.APPL_DB, False)   # Make one attempt only
 
+def generate_fdb_entries(filename, asic_db, app_db):
     vlan_ifaces = get_vlan_ifaces()
 
     fdb_entries, all_available_macs, map_mac_ip_per_vlan = generate_fdb_entries_logic(asic_db, app_db, vlan_ifaces)
 
-    asic_db.close(asic_db.ASIC_DB)
-    app_db.close(app_db.APPL_DB)
-
     with open(filename, 'w') as fp:
         json.dump(fdb_entries, fp, indent=2, separators=(',', ': '))
 
@@ -212,11 +227,12 @@ def generate_fdb_entries_logic(asic_db, app_db, vlan_ifaces):
     all_available_macs = set()
     map_mac_ip_per_vlan = {}
 
-    bridge_id_2_iface = get_map_bridge_port_id_2_iface_name(asic_db, app_db)
+    snapshot = AsicSnapshot(asic_db, app_db)
+    bridge_id_2_iface = get_map_bridge_port_id_2_iface_name(snapshot)
 
     for vlan in vlan_ifaces:
         vlan_id = int(vlan.replace('Vlan', ''))
-        fdb_entry, available_macs, map_mac_ip_per_vlan[vlan] = get_fdb(asic_db, vlan, vlan_id, bridge_id_2_iface)
+        fdb_entry, available_macs, map_mac_ip_per_vlan[vlan] = get_fdb(snapshot, vlan, vlan_id, bridge_id_2_iface)
         all_available_macs |= available_macs
         fdb_entries.extend(fdb_entry)
 
@@ -286,48 +302,28 @@ def send_garp_nd(neighbor_entries, map_mac_ip_per_vlan):
 
     return
 
-def get_default_entries(db, route):
-    key = 'ROUTE_TABLE:%s' % route
-    keys = db.keys(db.APPL_DB, key)
-    if keys is None:
-        return None
-
-    entry = db.get_all(db.APPL_DB, key)
-    obj = {
-        key: entry,
-        'OP': 'SET'
-    }
-
-    return obj
-
-def generate_default_route_entries(filename):
-    db = SonicV2Connector(unix_socket_path=False)
-    db.connect(db.APPL_DB, False)   # Make one attempt only
 
+def generate_default_route_entries(filename, app_db):
     default_routes_output = []
 
-    ipv4_default = get_default_entries(db, '0.0.0.0/0')
-    if ipv4_default is not None:
-        default_routes_output.append(ipv4_default)
-
-    ipv6_default = get_default_entries(db, '::/0')
-    if ipv6_default is not None:
-        default_routes_output.append(ipv6_default)
-
-    db.close(db.APPL_DB)
+    default_route_keys = ['ROUTE_TABLE:0.0.0.0/0', 'ROUTE_TABLE:::/0']
+    entries = bulk_get_entries(app_db, app_db.APPL_DB, default_route_keys)
+    for key in default_route_keys:
+        if key in entries:
+            default_routes_output.append({
+                key: entries[key],
+                'OP': 'SET'
+            })
 
     with open(filename, 'w') as fp:
         json.dump(default_routes_output, fp, indent=2, separators=(',', ': '))
 
-def generate_media_config(filename):
-    db = SonicV2Connector(host='127.0.0.1')
-    db.connect(db.APPL_DB, False)   # Make one attempt only
+
+def generate_media_config(filename, app_db):
     media_config= []
     port_serdes_keys = ["preemphasis", "idriver", "ipredriver", "pre1", "pre2", "pre3", "main", "post1", "post2", "post3","attn"]
-    keys = db.keys(db.APPL_DB, 'PORT_TABLE:*')
-    keys = [] if keys is None else keys
-    for key in keys:
-        entry = db.get_all(db.APPL_DB, key)
+    entries = bulk_get_all(app_db, app_db.APPL_DB, 'PORT_TABLE:*')
+    for key, entry in entries.items():
         media_attributes = {}
         for attr in entry.keys():
             if attr in port_serdes_keys:
@@ -338,8 +334,6 @@ def generate_media_config(filename):
         }
         media_config.append(obj)
 
-    db.close(db.APPL_DB)
-
     with open(filename, 'w') as fp:
         json.dump(media_config, fp, indent=2, separators=(',', ': '))
 
@@ -353,10 +347,25 @@ def main():
     if not os.path.isdir(root_dir):
         print("Target directory '%s' not found" % root_dir)
         return 3
-    all_available_macs, map_mac_ip_per_vlan = generate_fdb_entries(root_dir + '/fdb.json')
-    neighbor_entries = generate_neighbor_entries(root_dir + '/arp.json', all_available_macs)
-    generate_default_route_entries(root_dir + '/default_routes.json')
-    generate_media_config(root_dir + '/media_config.json')
+
+    start_time = time.time()
+
+    asic_db = SonicV2Connector(use_unix_socket_path=False)
+    app_db = SonicV2Connector(use_unix_socket_path=False)
+    asic_db.connect(asic_db.ASIC_DB, False)   # Make one attempt only
+    app_db.connect(app_db.APPL_DB, False)   # Make one attempt only
+
+    all_available_macs, map_mac_ip_per_vlan = generate_fdb_entries(root_dir + '/fdb.json', asic_db, app_db)
+    neighbor_entries = generate_neighbor_entries(root_dir + '/arp.json', all_available_macs, app_db)
+    generate_default_route_entries(root_dir + '/default_routes.json', app_db)
+    generate_media_config(root_dir + '/media_config.json', app_db)
+
+    asic_db.close(asic_db.ASIC_DB)
+    app_db.close(app_db.APPL_DB)
+
+    syslog.syslog(syslog.LOG_INFO, "Dumped %d FDB and %d neighbor entries in %.3f seconds" %
+                  (len(all_available_macs), len(neighbor_entries), time.time() - start_time))
+
     send_garp_nd(neighbor_entries, map_mac_ip_per_vlan)
     return 0
 
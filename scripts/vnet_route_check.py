@@ -5,7 +5,8 @@ import json
 import syslog
 import subprocess
 import argparse
-from swsscommon import swsscommon
+from swsscommon.swsscommon import SonicV2Connector
+from utilities_common.bulk_db import bulk_get_all, bulk_get_entries, get_redis_client
 
 ''' vnet_route_check.py: tool that verifies VNET routes consistancy between SONiC and vendor SDK DBs.
 
@@ -48,8 +49,24 @@ Format of differences output:
 
 RC_OK = 0
 RC_ERR = -1
+SDK_CHECK_SCRIPT = '/usr/bin/vnet_route_check.py'
 default_vrf_oid = ""
 
+# Runs the vendor check of every VNET in syncd, so syncd is entered once instead of once per VNET.
+# Input: { <vnet_name>: [ <vrf_oid>, [ <pfx/pfx_len> ] ] }
+# Output: { <vnet_name>: <rc> } of the failed checks, {} if syncd has no vendor check.
+SDK_CHECK_DRIVER = '''
+import json, os, subprocess, sys
+script = sys.argv[1]
+res = {}
+if os.path.isfile(script):
+    for vnet_name, (vrf_oid, routes) in json.load(sys.stdin).items():
+        rc = subprocess.call([script, vrf_oid] + routes, stdout=sys.stderr)
+        if rc:
+            res[vnet_name] = rc
+print(json.dumps(res))
+'''
+
 report_level = syslog.LOG_ERR
 write_to_syslog = True
 
@@ -72,108 +89,86 @@ def print_message(lvl, *args):
             syslog.syslog(lvl, msg)
 
 
-def check_vnet_cfg():
-    ''' Returns True if VNET is configured in APP_DB or False if no VNET configuration.
+def connect_db():
+    ''' Returns DB connector connected to all DBs used by the check.
     '''
-    db = swsscommon.DBConnector('APPL_DB', 0, True)
+    db = SonicV2Connector(use_unix_socket_path=True)
+    for db_name in (db.APPL_DB, db.ASIC_DB, db.COUNTERS_DB, db.STATE_DB):
+        db.connect(db_name)
 
-    vnet_db_keys = swsscommon.Table(db, 'VNET_TABLE').getKeys()
-
-    return True if vnet_db_keys else False
+    return db
 
 
-def get_vnet_intfs():
-    ''' Returns dictionary of VNETs and related VNET interfaces.
-    Format: { <vnet_name>: [ <vnet_rif_name> ] }
+def read_table(db, db_name, table, separator=':', with_values=True):
+    ''' Returns all entries of the table read in bulk.
+    Format: { <key>: { <field>: <value> } }
     '''
-    db = swsscommon.DBConnector('APPL_DB', 0, True)
+    prefix = table + separator
 
-    intfs_table = swsscommon.Table(db, 'INTF_TABLE')
-    intfs_keys = swsscommon.Table(db, 'INTF_TABLE').getKeys()
-
-    vnet_intfs = {}
-
-    for intf_key in intfs_keys:
-        intf_attrs = dict(intfs_table.get(intf_key)[1])
-
-        if 'vnet_name' in intf_attrs:
-            vnet_name = intf_attrs['vnet_name']
-            if vnet_name in vnet_intfs:
-                vnet_intfs[vnet_name].append(intf_key)
-            else:
-                vnet_intfs[vnet_name] = [intf_key]
+    if not with_values:
+        db_keys = get_redis_client(db, db_name).keys(prefix + '*')
+        return {db_key[len(prefix):]: {} for db_key in db_keys}
 
-    return vnet_intfs
+    entries = bulk_get_all(db, db_name, prefix + '*')
+    return {db_key[len(prefix):]: fvs for db_key, fvs in entries.items()}
 
 
-def get_all_rifs_oids():
-    ''' Returns dictionary of all router interfaces and their OIDs.
-    Format: { <rif_name>: <rif_oid> }
+def check_vnet_cfg(db):
+    ''' Returns True if VNET is configured in APP_DB or False if no VNET configuration.
     '''
-    db = swsscommon.DBConnector('COUNTERS_DB', 0, True)
-    rif_table = swsscommon.Table(db, 'COUNTERS_RIF_NAME_MAP')
-
-    rif_name_oid_map = dict(rif_table.get('')[1])
+    vnet_db_keys = get_redis_client(db, db.APPL_DB).keys('VNET_TABLE:*')
 
-    return rif_name_oid_map
+    return True if vnet_db_keys else False
 
 
-def get_vnet_rifs_oids():
-    ''' Returns dictionary of VNET interfaces and their OIDs.
-    Format: { <vnet_rif_name>: <vnet_rif_oid> }
+class VnetRouteSnapshot(object):
+    ''' Bulk snapshot of all DB tables required for the VNET routes verification.
+    Every table is read once in a pipelined scan, VNET/RIF/VRF OID joins are done in memory.
     '''
-    vnet_intfs = get_vnet_intfs()
-    intfs_oids = get_all_rifs_oids()
-
-    vnet_intfs = [vnet_intfs[k] for k in vnet_intfs]
-    vnet_intfs = [val for sublist in vnet_intfs for val in sublist]
 
-    vnet_rifs_oids_map = {}
+    def __init__(self, db):
+        self.vnets = read_table(db, db.APPL_DB, 'VNET_TABLE')
+        self.intfs = read_table(db, db.APPL_DB, 'INTF_TABLE')
 
-    for intf_name in intfs_oids or {}:
-        if intf_name in vnet_intfs:
-            vnet_rifs_oids_map[intf_name] = intfs_oids[intf_name]
+        # Only keys are required for the VNET routes
+        self.app_route_keys = list(read_table(db, db.APPL_DB, 'VNET_ROUTE_TABLE', with_values=False)) + \
+            list(read_table(db, db.APPL_DB, 'VNET_ROUTE_TUNNEL_TABLE', with_values=False))
+        self.asic_route_keys = list(read_table(db, db.ASIC_DB, 'ASIC_STATE:SAI_OBJECT_TYPE_ROUTE_ENTRY',
+                                               with_values=False))
 
-    return vnet_rifs_oids_map
+        self.route_states = read_table(db, db.STATE_DB, 'VNET_ROUTE_TUNNEL_TABLE', '|')
 
+        vr_keys = list(read_table(db, db.ASIC_DB, 'ASIC_STATE:SAI_OBJECT_TYPE_VIRTUAL_ROUTER', with_values=False))
+        self.default_vrf_oid = vr_keys[0] if vr_keys else ""
 
-def get_vrf_entries():
-    ''' Returns dictionary of VNET interfaces and corresponding VRF OIDs.
-    Format: { <vnet_rif_name>: <vrf_oid> }
-    '''
-    db = swsscommon.DBConnector('ASIC_DB', 0, True)
-    rif_table = swsscommon.Table(db, 'ASIC_STATE')
-
-    vnet_rifs_oids = get_vnet_rifs_oids()
+        self.vnet_intfs = {}
+        for intf_key, intf_attrs in self.intfs.items():
+            if 'vnet_name' in intf_attrs:
+                self.vnet_intfs.setdefault(intf_attrs['vnet_name'], []).append(intf_key)
 
-    rif_vrf_map = {}
-    for vnet_rif_name in vnet_rifs_oids:
+        vnet_rifs = set(rif for rifs in self.vnet_intfs.values() for rif in rifs)
+        rif_name_oid_map = get_redis_client(db, db.COUNTERS_DB).hgetall('COUNTERS_RIF_NAME_MAP') or {}
+        self.vnet_rifs_oids = {name: oid for name, oid in rif_name_oid_map.items() if name in vnet_rifs}
 
-        db_keys = rif_table.getKeys()
+        # Fetch VRF of VNET RIFs only, by exact key
+        rif_keys = {f'ASIC_STATE:SAI_OBJECT_TYPE_ROUTER_INTERFACE:{rif_oid}': vnet_rif_name
+                    for vnet_rif_name, rif_oid in self.vnet_rifs_oids.items()}
+        rif_vrfs = bulk_get_entries(db, db.ASIC_DB, rif_keys, fields=['SAI_ROUTER_INTERFACE_ATTR_VIRTUAL_ROUTER_ID'])
 
-        for db_key in db_keys:
-            if (db_key == f'SAI_OBJECT_TYPE_ROUTER_INTERFACE:{vnet_rifs_oids[vnet_rif_name]}'):
-                rif_attrs = dict(rif_table.get(db_key)[1])
-                rif_vrf_map[vnet_rif_name] = rif_attrs['SAI_ROUTER_INTERFACE_ATTR_VIRTUAL_ROUTER_ID']
+        self.rif_vrf_map = {}
+        for rif_key, fvs in rif_vrfs.items():
+            self.rif_vrf_map[rif_keys[rif_key]] = fvs['SAI_ROUTER_INTERFACE_ATTR_VIRTUAL_ROUTER_ID']
 
-    return rif_vrf_map
 
-
-def filter_out_vnet_ip2me_routes(vnet_routes):
+def filter_out_vnet_ip2me_routes(snapshot, vnet_routes):
     ''' Filters out IP2ME routes from the provided dictionary with VNET routes
     Format: { <vnet_name>: { 'routes': [ <pfx/pfx_len> ], 'vrf_oid': <oid> } }
     '''
-    db = swsscommon.DBConnector('APPL_DB', 0, True)
-
-    all_rifs_db_keys = swsscommon.Table(db, 'INTF_TABLE').getKeys()
-    vnet_intfs = get_vnet_intfs()
+    vnet_intfs = set(rif for rifs in snapshot.vnet_intfs.values() for rif in rifs)
 
-    vnet_intfs = [vnet_intfs[k] for k in vnet_intfs]
-    vnet_intfs = [val for sublist in vnet_intfs for val in sublist]
-
-    vnet_ip2me_routes = []
-    for rif in all_rifs_db_keys:
-        rif_attrs = rif.split(':')
+    vnet_ip2me_routes = set()
+    for rif in snapshot.intfs:
+        rif_attrs = rif.split(':', 1)
         # Skip RIF entries without IP prefix and prefix length (they have only one attribute - RIF name)
         if len(rif_attrs) == 1:
             continue
@@ -184,34 +179,26 @@ def filter_out_vnet_ip2me_routes(vnet_routes):
         if rif_attrs[0] in vnet_intfs:
             rif_ip, _ = rif_attrs[1].split('/')
             ip2me_route = rif_ip + '/32'
-            vnet_ip2me_routes.append(ip2me_route)
+            vnet_ip2me_routes.add(ip2me_route)
 
-    for vnet, vnet_attrs in vnet_routes.items():
-        for route in vnet_attrs['routes']:
-            if route in vnet_ip2me_routes:
-                vnet_attrs['routes'].remove(route)
+    for vnet in list(vnet_routes):
+        vnet_attrs = vnet_routes[vnet]
+        vnet_attrs['routes'] = [route for route in vnet_attrs['routes'] if route not in vnet_ip2me_routes]
 
         if not vnet_attrs['routes']:
             vnet_routes.pop(vnet)
 
 
-def get_vnet_routes_from_app_db():
+def get_vnet_routes_from_app_db(snapshot):
     ''' Returns dictionary of VNET routes configured per each VNET in APP_DB.
     Format: { <vnet_name>: { 'routes': [ <pfx/pfx_len> ], 'vrf_oid': <oid> } }
     '''
-    db = swsscommon.DBConnector('APPL_DB', 0, True)
-
-    vnet_intfs = get_vnet_intfs()
-    vnet_vrfs = get_vrf_entries()
-
-    vnet_route_table = swsscommon.Table(db, 'VNET_ROUTE_TABLE')
-    vnet_route_tunnel_table = swsscommon.Table(db, 'VNET_ROUTE_TUNNEL_TABLE')
-
-    vnet_routes_db_keys = vnet_route_table.getKeys() + vnet_route_tunnel_table.getKeys()
+    vnet_intfs = snapshot.vnet_intfs
+    vnet_vrfs = snapshot.rif_vrf_map
 
     vnet_routes = {}
 
-    for vnet_route_db_key in vnet_routes_db_keys:
+    for vnet_route_db_key in snapshot.app_route_keys:
         vnet_route_list = vnet_route_db_key.split(':',1)
         vnet_name = vnet_route_list[0]
         vnet_route = vnet_route_list[1]
@@ -222,15 +209,10 @@ def get_vnet_routes_from_app_db():
 
             if vnet_name not in vnet_intfs:
                 # this route has no vnet_intf and may be part of default VRF.
-                vnet_table = swsscommon.Table(db, 'VNET_TABLE')
-                scope_value = ""
-                # "Vnet_v4_in_v4-0": [("vxlan_tunnel", "tunnel_v4"), ("scope", "default"), ("vni", "10000"), ("peer_list", "")]
-                for key,value in vnet_table.get(vnet_name)[1]:
-                    if key == "scope":
-                        scope_value = value
-                        break
+                # "Vnet_v4_in_v4-0": {"vxlan_tunnel": "tunnel_v4", "scope": "default", "vni": "10000", "peer_list": ""}
+                scope_value = snapshot.vnets.get(vnet_name, {}).get('scope', "")
                 if scope_value == 'default':
-                    vnet_routes[vnet_name]['vrf_oid'] = default_vrf_oid
+                    vnet_routes[vnet_name]['vrf_oid'] = snapshot.default_vrf_oid
                 else:
                     assert "Non-default VRF route present without vnet interface."
             else:
@@ -242,64 +224,50 @@ def get_vnet_routes_from_app_db():
     return vnet_routes
 
 
-def get_vnet_routes_from_asic_db():
+def get_vnet_routes_from_asic_db(snapshot):
     ''' Returns dictionary of VNET routes configured per each VNET in ASIC_DB.
     Format: { <vnet_name>: { 'routes': [ <pfx/pfx_len> ], 'vrf_oid': <oid> } }
     '''
-    db = swsscommon.DBConnector('ASIC_DB', 0, True)
-
-    tbl = swsscommon.Table(db, 'ASIC_STATE')
-
-    vnet_vrfs = get_vrf_entries()
-    vnet_vrfs_oids = [vnet_vrfs[k] for k in vnet_vrfs]
-    vnet_vrfs_oids.append(default_vrf_oid) 
-
-    vnet_intfs = get_vnet_intfs()
+    vnet_vrfs = snapshot.rif_vrf_map
+    vnet_intfs = snapshot.vnet_intfs
 
     vrf_oid_to_vnet_map = {}
-    vrf_oid_to_vnet_map[default_vrf_oid] = 'default_VRF'
+    vrf_oid_to_vnet_map[snapshot.default_vrf_oid] = 'default_VRF'
 
     for vnet_name, vnet_rifs in vnet_intfs.items():
-        for vnet_rif, vrf_oid in vnet_vrfs.items():
-            if vnet_rif in vnet_rifs:
-                vrf_oid_to_vnet_map[vrf_oid] = vnet_name
-
-    routes_db_keys = tbl.getKeys()
+        for vnet_rif in vnet_rifs:
+            if vnet_rif in vnet_vrfs:
+                vrf_oid_to_vnet_map[vnet_vrfs[vnet_rif]] = vnet_name
 
     vnet_routes = {}
 
-    for route_db_key in routes_db_keys:
+    for route_db_key in snapshot.asic_route_keys:
         route_attrs = route_db_key.lower().split('\"', -1)
 
-        if 'sai_object_type_route_entry' not in route_attrs[0]:
-            continue
-
         # route_attrs[11] - VRF OID for the VNET route
         # route_attrs[3] - VNET route IP subnet
+        if len(route_attrs) < 12:
+            continue
         vrf_oid = route_attrs[11]
         ip_addr = route_attrs[3]
 
-        if vrf_oid in vnet_vrfs_oids:
+        if vrf_oid in vrf_oid_to_vnet_map:
             vnet_name = vrf_oid_to_vnet_map[vrf_oid]
-            if vrf_oid_to_vnet_map[vrf_oid] not in vnet_routes:
+            if vnet_name not in vnet_routes:
                 vnet_routes[vnet_name] = {}
                 vnet_routes[vnet_name]['routes'] = []
                 vnet_routes[vnet_name]['vrf_oid'] = vrf_oid
 
             vnet_routes[vnet_name]['routes'].append(ip_addr)
 
-    filter_out_vnet_ip2me_routes(vnet_routes)
+    filter_out_vnet_ip2me_routes(snapshot, vnet_routes)
 
     return vnet_routes
 
 
-def check_routes_with_default_vrf(vnet_name, vnet_attrs, routes_1, routes):
+def check_routes_with_default_vrf(vnet_name, vnet_attrs, routes_1_all, routes):
     for vnet_route in vnet_attrs['routes']:
-        ispresent = False
-        for vnet_name_other, vnet_attrs_other in routes_1.items():
-            if vnet_route in vnet_attrs_other['routes']:
-                ispresent = True
-        if not ispresent:
+        if vnet_route not in routes_1_all:
             if vnet_name not in routes:
                 routes[vnet_name] = {}
                 routes[vnet_name]['routes'] = []
@@ -315,10 +283,14 @@ def get_vnet_routes_diff(routes_1, routes_2, verify_default_vrf_routes = False):
 
     routes = {}
 
+    # Hashed views of routes_1 to avoid list scans per route
+    routes_1_sets = {vnet_name: set(vnet_attrs['routes']) for vnet_name, vnet_attrs in routes_1.items()}
+    routes_1_all = set().union(*routes_1_sets.values())
+
     for vnet_name, vnet_attrs in routes_2.items():
         if vnet_attrs['vrf_oid'] == default_vrf_oid:
             if verify_default_vrf_routes:
-                check_routes_with_default_vrf(vnet_name, vnet_attrs, routes_1, routes)
+                check_routes_with_default_vrf(vnet_name, vnet_attrs, routes_1_all, routes)
             else:
                 continue
         else:
@@ -326,7 +298,7 @@ def get_vnet_routes_diff(routes_1, routes_2, verify_default_vrf_routes = False):
                 routes[vnet_name] =  vnet_attrs['routes'].copy()
             else:
                 for vnet_route in vnet_attrs['routes']:
-                    if vnet_route not in routes_1[vnet_name]['routes']:
+                    if vnet_route not in routes_1_sets[vnet_name]:
                         if vnet_name not in routes:
                             routes[vnet_name] = {}
                             routes[vnet_name]['routes'] = []
@@ -341,42 +313,39 @@ def get_sdk_vnet_routes_diff(routes):
     '''
     routes_diff = {}
 
-    res = subprocess.call(['docker', 'exec', 'syncd', 'test', '-f', '/usr/bin/vnet_route_check.py'])
-    if res != 0:
+    if not routes:
         return routes_diff
 
-    for vnet_name, vnet_routes in routes.items():
-        vnet_routes = routes[vnet_name]["routes"]
-        vnet_vrf_oid = routes[vnet_name]["vrf_oid"]
+    request = {vnet_name: [vnet_attrs["vrf_oid"], vnet_attrs["routes"]] for vnet_name, vnet_attrs in routes.items()}
+    proc = subprocess.run(['docker', 'exec', '-i', 'syncd', 'python3', '-c', SDK_CHECK_DRIVER, SDK_CHECK_SCRIPT],
+                          input=json.dumps(request), stdout=subprocess.PIPE, universal_newlines=True)
+    if proc.returncode != 0:
+        print_message(syslog.LOG_WARNING, "Failed to check VNET routes in SDK, rc={}".format(proc.returncode))
+        return routes_diff
 
-        res = subprocess.call(['docker', 'exec', 'syncd', "/usr/bin/vnet_route_check.py", vnet_vrf_oid, vnet_routes])
-        if res:
-            routes_diff[vnet_name] = {}
-            routes_diff[vnet_name]['routes'] = res
+    for vnet_name, res in json.loads(proc.stdout).items():
+        routes_diff[vnet_name] = {}
+        routes_diff[vnet_name]['routes'] = res
 
     return routes_diff
 
 
-def filter_active_vnet_routes(vnet_routes: dict):
+def filter_active_vnet_routes(snapshot, vnet_routes: dict):
     """ Filters a dictionary containing VNet routes configured for each VNet in APP_DB.
     For each VNet in "vnet_routes", only active routes are included in the returned dictionary.
     Format (for both input and output):
     { <vnet_name>: { 'routes': [ <pfx/pfx_len> ], 'vrf_oid': <oid> } }
     """
-    state_db = swsscommon.DBConnector("STATE_DB", 0, True)
-    vnet_route_tunnel_table = swsscommon.Table(state_db, "VNET_ROUTE_TUNNEL_TABLE")
-
     vnet_active_routes = {}
     for vnet_name, vnet_info in vnet_routes.items():
         active_routes = []
         for prefix in vnet_info["routes"]:
             key = f"{vnet_name}|{prefix}"
-            exists, fvs = vnet_route_tunnel_table.get(key)
-            if not exists:
+            fvs_dict = snapshot.route_states.get(key)
+            if fvs_dict is None:
                 print_message(syslog.LOG_WARNING, f"VNET_ROUTE_TUNNEL_TABLE|{key} does not exist in STATE DB.")
                 active_routes.append(prefix)  # Treating "prefix" as an active route
                 continue
-            fvs_dict = dict(fvs)
             if fvs_dict.get("state") == "active":
                 active_routes.append(prefix)
         if len(active_routes) > 0:
@@ -394,20 +363,19 @@ def main():
 
     rc = RC_OK
 
+    db = connect_db()
+
     # Don't run VNET routes consistancy logic if there is no VNET configuration
-    if not check_vnet_cfg():
+    if not check_vnet_cfg(db):
         return rc
-    asic_db = swsscommon.DBConnector('ASIC_DB', 0, True)
-    virtual_router = swsscommon.Table(asic_db, 'ASIC_STATE:SAI_OBJECT_TYPE_VIRTUAL_ROUTER')
+
+    snapshot = VnetRouteSnapshot(db)
     global default_vrf_oid
-    default_vrf_oid = ""
-    vr_keys = virtual_router.getKeys()
-    if vr_keys:
-        default_vrf_oid = vr_keys[0]
-
-    app_db_vnet_routes = get_vnet_routes_from_app_db()
-    active_app_db_vnet_routes = filter_active_vnet_routes(app_db_vnet_routes)
-    asic_db_vnet_routes = get_vnet_routes_from_asic_db()
+    default_vrf_oid = snapshot.default_vrf_oid
+
+    app_db_vnet_routes = get_vnet_routes_from_app_db(snapshot)
+    active_app_db_vnet_routes = filter_active_vnet_routes(snapshot, app_db_vnet_routes)
+    asic_db_vnet_routes = get_vnet_routes_from_asic_db(snapshot)
 
     if args.all:
         missed_in_asic_db_routes = get_vnet_routes_diff(asic_db_vnet_routes, app_db_vnet_routes, True)
@@ -0,0 +1,197 @@
+"""
+Batch CDB firmware upgrade of transceivers
+
+The firmware image is read once and shared by all the ports. Each port goes
+through the download, run and commit stages of the CDB firmware upgrade. The
+stage reached by each port is saved to a state file after every stage, with
+the identity of the module and the firmware version of the bank the image was
+downloaded to, so an interrupted batch upgrade with the same image resumes
+every port from its next stage as long as it is still the same module.
+"""
+
+import hashlib
+import json
+import os
+import threading
+
+STAGE_PENDING = 'pending'
+STAGE_DOWNLOADED = 'downloaded'
+STAGE_RUN = 'run'
+STAGE_COMMITTED = 'committed'
+STAGES = [STAGE_PENDING, STAGE_DOWNLOADED, STAGE_RUN, STAGE_COMMITTED]
+
+# Download progress is reported in steps of this percentage
+PROGRESS_STEP = 10
+
+
+class FirmwareUpgradeError(Exception):
+    pass
+
+
+def get_fw_switch_status(fw_result):
+    """
+    Check that the module runs the new uncommitted image after run
+    Args:
+        fw_result: 'result' of the CMIS api get_module_fw_info()
+
+    Returns:
+        tuple(1, message) if the image switch is done, tuple(-1, error message) otherwise
+    """
+    (ImageA, ImageARunning, ImageACommitted, ImageAInvalid,
+     ImageB, ImageBRunning, ImageBCommitted, ImageBInvalid, _, _) = fw_result
+
+    if (ImageARunning == 1) and (ImageAInvalid == 1):       # ImageA is running, but also invalid.
+        return -1, "FW info error : ImageA shows running, but also shows invalid!"
+    elif (ImageBRunning == 1) and (ImageBInvalid == 1):     # ImageB is running, but also invalid.
+        return -1, "FW info error : ImageB shows running, but also shows invalid!"
+    elif (ImageARunning == 1) and (ImageACommitted == 0):   # ImageA is running, but not committed.
+        return 1, "FW images switch successful : ImageA is running"
+    elif (ImageBRunning == 1) and (ImageBCommitted == 0):   # ImageB is running, but not committed.
+        return 1, "FW images switch successful : ImageB is running"
+    else:                                                   # No image is running, or running and committed is same
+        return -1, "FW info error : Failed to switch into uncommitted image!"
+
+
+def get_inactive_bank(fw_result):
+    """
+    Args:
+        fw_result: 'result' of the CMIS api get_module_fw_info()
+
+    Returns:
+        tuple(bank, version) of the image which is not running, bank is 'A' or 'B'
+    """
+    ImageA, ImageARunning, _, _, ImageB = fw_result[:5]
+    if ImageARunning == 1:
+        return 'B', ImageB
+    return 'A', ImageA
+
+
+def get_bank_version(fw_result, bank):
+    """Return the firmware version of the image bank 'A' or 'B'"""
+    return fw_result[0] if bank == 'A' else fw_result[4]
+
+
+def get_module_id(sfp):
+    """
+    Return the vendor PN and SN of the module, None if they can't be read
+    """
+    try:
+        info = sfp.get_transceiver_info()
+    except NotImplementedError:
+        return None
+    if not info or not info.get('model') or not info.get('serial'):
+        return None
+    return {'vendor_pn': info['model'], 'vendor_sn': info['serial']}
+
+
+def is_module_unchanged(saved_module, module_id, fw_info):
+    """
+    Check that the module of a saved stage is still the same
+
+    Args:
+        saved_module: module saved with the downloaded stage, see UpgradeState.get_module()
+        module_id: current vendor PN/SN of the module, see get_module_id()
+        fw_info: current CMIS api get_module_fw_info()
+
+    Returns:
+        True if the vendor PN/SN and the firmware version of the bank the image was downloaded to are unchanged
+    """
+    if saved_module is None or module_id is None or not fw_info['status']:
+        return False
+    if any(saved_module.get(key) != value for key, value in module_id.items()):
+        return False
+    return get_bank_version(fw_info['result'], saved_module.get('bank')) == saved_module.get('version')
+
+
+class DownloadProgress(object):
+    """Prints the download progress in steps of a percentage, used in place of click.progressbar"""
+
+    def __init__(self, length, label, echo, step=PROGRESS_STEP):
+        self.length = length
+        self.label = label
+        self.echo = echo
+        self.step = step
+        self.pos = 0
+        self.next_percent = step
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+    def update(self, count):
+        self.pos += count
+        percent = self.pos * 100 // self.length
+        if percent >= self.next_percent:
+            self.echo("{} {}%".format(self.label, percent))
+            self.next_percent = percent - percent % self.step + self.step
+
+
+class FirmwareImage(object):
+    """Firmware image file read into memory"""
+
+    def __init__(self, filepath):
+        with open(filepath, 'rb') as f:
+            self.data = f.read()
+        self.path = os.path.abspath(filepath)
+        self.size = len(self.data)
+        self.digest = hashlib.sha256(self.data).hexdigest()
+
+
+class UpgradeState(object):
+    """Per-port upgrade stage of an image saved in a JSON file"""
+
+    def __init__(self, path, image, restart=False):
+        self.path = path
+        self.image = image
+        self.lock = threading.Lock()
+        self.ports = {}
+
+        if not restart and os.path.isfile(path):
+            try:
+                with open(path) as f:
+                    state = json.load(f)
+                # The saved stages are valid only for the same image
+                if state.get('image_sha256') == image.digest:
+                    self.ports = state.get('ports', {})
+            except (ValueError, OSError):
+                pass
+
+    def get_stage(self, port):
+        with self.lock:
+            return self.ports.get(port, {}).get('stage', STAGE_PENDING)
+
+    def get_module(self, port):
+        """
+        Returns:
+            the module saved with the downloaded stage of the port: vendor_pn, vendor_sn and the bank and
+            version of the downloaded image, None if not saved
+        """
+        with self.lock:
+            return self.ports.get(port, {}).get('module')
+
+    def set_stage(self, port, stage, error=None, module=None):
+        """
+        Save the stage of the port, the module is kept from the previous stage unless given
+        """
+        with self.lock:
+            if module is None and stage != STAGE_PENDING:
+                module = self.ports.get(port, {}).get('module')
+            self.ports[port] = {'stage': stage}
+            if module is not None:
+                self.ports[port]['module'] = module
+            if error is not None:
+                self.ports[port]['error'] = error
+            self._save()
+
+    def _save(self):
+        state = {
+            'image': self.image.path,
+            'image_sha256': self.image.digest,
+            'ports': self.ports
+        }
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(state, f, indent=4)
+        os.replace(tmp_path, self.path)
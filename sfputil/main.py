@@ -12,12 +12,19 @@ import natsort
 import ast
 import time
 import datetime
+import functools
+import threading
 
 import subprocess
 import click
 import sonic_platform
 import sonic_platform_base.sonic_sfp.sfputilhelper
 from sfputil.debug import debug
+from sfputil.fw_batch import (
+    DownloadProgress, FirmwareImage, FirmwareUpgradeError, UpgradeState, get_fw_switch_status, get_inactive_bank,
+    get_module_id, is_module_unchanged, STAGE_COMMITTED, STAGE_DOWNLOADED, STAGE_PENDING, STAGE_RUN
+)
+from sfputil.port_reader import PortReader, get_sfp_bus, DEFAULT_PORT_TIMEOUT
 from sonic_platform_base.sfp_base import SfpBase
 from swsscommon.swsscommon import SonicV2Connector, ConfigDBConnector
 from natsort import natsorted
@@ -30,6 +37,7 @@ from utilities_common.sfp_helper import covert_application_advertisement_to_outp
 from utilities_common.sfp_helper import QSFP_DATA_MAP
 from tabulate import tabulate
 from utilities_common.general import load_db_config
+from utilities_common.cli import UserCache
 
 VERSION = '3.0'
 
@@ -277,6 +285,14 @@ QSFP_DD_DOM_VALUE_UNIT_MAP = {
 
 RJ45_PORT_TYPE = 'RJ45'
 
+MAX_READ_WORKERS = 64
+
+# Time to wait for the module to switch to the new image after run
+FW_SWITCH_TIMEOUT = 60
+FW_SWITCH_POLL_INTERVAL = 2
+
+FW_UPGRADE_STATE_FILE = 'fw_upgrade_state.json'
+
 # Global platform-specific Chassis class instance
 platform_chassis = None
 
@@ -299,6 +315,71 @@ def is_sfp_present(port_name):
     return bool(presence)
 
 
+class PortReadAbort(Exception):
+    """Raised by a per-port read to stop the command with a message and an exit code"""
+    def __init__(self, message, exit_code=ERROR_NOT_IMPLEMENTED):
+        super(PortReadAbort, self).__init__(message)
+        self.message = message
+        self.exit_code = exit_code
+
+
+# Options of the 'show' subcommands which read the transceivers concurrently
+_port_reader_click_options = [
+    click.option('--workers', metavar='<workers>', type=click.IntRange(1, MAX_READ_WORKERS),
+                 default=1, show_default=True,
+                 help="Number of transceivers read concurrently, the platform must support concurrent reads"),
+    click.option('--bus-limit', metavar='<bus_limit>', type=click.IntRange(0, MAX_READ_WORKERS),
+                 default=0, show_default=True,
+                 help="Number of transceivers read concurrently on the same I2C bus, 0 for no limit"),
+    click.option('--timeout', metavar='<seconds>', type=click.IntRange(0), default=DEFAULT_PORT_TIMEOUT,
+                 show_default=True, help="Per-transceiver read timeout in seconds, 0 for no timeout")
+]
+
+
+def port_reader_click_options(func):
+    for option in reversed(_port_reader_click_options):
+        func = option(func)
+    return func
+
+
+def get_logical_port_bus(logical_port_name):
+    physical_port = logical_port_name_to_physical_port_list(logical_port_name)[0]
+    return get_sfp_bus(platform_chassis.get_sfp(physical_port))
+
+
+def read_ports(logical_port_list, read_func, workers, bus_limit, timeout):
+    """
+    Read the logical ports concurrently
+    Args:
+        logical_port_list: logical port names
+        read_func: function which reads a logical port
+        workers, bus_limit, timeout: PortReader configuration
+
+    Yields:
+        (logical_port_name, result, error) in the order of logical_port_list. Exits if a read raises PortReadAbort
+    """
+    reader = PortReader(max_workers=workers, bus_limit=bus_limit, timeout=timeout, get_bus=get_logical_port_bus,
+                        fatal_errors=(PortReadAbort,))
+    try:
+        for logical_port_name, result, error in reader.read(logical_port_list, read_func):
+            yield logical_port_name, result, error
+    except PortReadAbort as e:
+        click.echo(e.message)
+        sys.exit(e.exit_code)
+
+
+def get_physical_port_lists(logical_port_list):
+    """Return {logical_port_name: physical_port_list} or None if a logical port has no physical port"""
+    physical_port_lists = {}
+    for logical_port_name in logical_port_list:
+        physical_port_list = logical_port_name_to_physical_port_list(logical_port_name)
+        if physical_port_list is None:
+            click.echo("Error: No physical ports found for logical port '{}'".format(logical_port_name))
+            return None
+        physical_port_lists[logical_port_name] = physical_port_list
+    return physical_port_lists
+
+
 def is_port_type_rj45(port_name):
     physical_port = logical_port_to_physical_port_index(port_name)
 
@@ -629,10 +710,10 @@ def show():
 @click.option('-p', '--port', metavar='<port_name>', help="Display SFP EEPROM data for port <port_name> only")
 @click.option('-d', '--dom', 'dump_dom', is_flag=True, help="Also display Digital Optical Monitoring (DOM) data")
 @click.option('-n', '--namespace', default=None, help="Display interfaces for specific namespace")
-def eeprom(port, dump_dom, namespace):
+@port_reader_click_options
+def eeprom(port, dump_dom, namespace, workers, bus_limit, timeout):
     """Display EEPROM data of SFP transceiver(s)"""
     logical_port_list = []
-    output = ""
 
     # Create a list containing the logical port names of all ports we're interested in
     if port is None:
@@ -645,87 +726,101 @@ def eeprom(port, dump_dom, namespace):
 
         logical_port_list = [port]
 
-    for logical_port_name in logical_port_list:
-        ganged = False
-        i = 1
+    physical_port_lists = get_physical_port_lists(logical_port_list)
+    if physical_port_lists is None:
+        return
 
-        physical_port_list = logical_port_name_to_physical_port_list(logical_port_name)
-        if physical_port_list is None:
-            click.echo("Error: No physical ports found for logical port '{}'".format(logical_port_name))
-            return
+    def read_eeprom_output(logical_port_name):
+        return get_eeprom_output(logical_port_name, physical_port_lists[logical_port_name], dump_dom)
 
-        if len(physical_port_list) > 1:
-            ganged = True
+    for logical_port_name, output, error in read_ports(logical_port_list, read_eeprom_output,
+                                                       workers, bus_limit, timeout):
+        if error is not None:
+            output = "{}: Failed to read SFP EEPROM: {}\n\n".format(logical_port_name, error)
+        click.echo(output, nl=False)
 
-        for physical_port in physical_port_list:
-            port_name = get_physical_port_name(logical_port_name, i, ganged)
+    click.echo()
 
-            if is_port_type_rj45(port_name):
-                output += "{}: SFP EEPROM is not applicable for RJ45 port\n".format(port_name)
-                output += '\n'
-                continue
+
+def get_eeprom_output(logical_port_name, physical_port_list, dump_dom):
+    """
+    Read EEPROM data of a logical port
+    Args:
+        logical_port_name: logical port name
+        physical_port_list: physical ports of the logical port
+        dump_dom: also read DOM data
+
+    Returns:
+        output string, raises PortReadAbort if the platform doesn't implement a read
+    """
+    output = ""
+    ganged = len(physical_port_list) > 1
+    i = 1
+
+    for physical_port in physical_port_list:
+        port_name = get_physical_port_name(logical_port_name, i, ganged)
+
+        if is_port_type_rj45(port_name):
+            output += "{}: SFP EEPROM is not applicable for RJ45 port\n".format(port_name)
+            output += '\n'
+            continue
+
+        sfp = platform_chassis.get_sfp(physical_port)
+        try:
+            presence = sfp.get_presence()
+        except NotImplementedError:
+            raise PortReadAbort("Sfp.get_presence() is currently not implemented for this platform")
+
+        if not presence:
+            output += "{}: SFP EEPROM not detected\n".format(port_name)
+        else:
+            output += "{}: SFP EEPROM detected\n".format(port_name)
 
             try:
-                presence = platform_chassis.get_sfp(physical_port).get_presence()
+                xcvr_info = sfp.get_transceiver_info()
             except NotImplementedError:
-                click.echo("Sfp.get_presence() is currently not implemented for this platform")
-                sys.exit(ERROR_NOT_IMPLEMENTED)
+                raise PortReadAbort("Sfp.get_transceiver_info() is currently not implemented for this platform")
 
-            if not presence:
-                output += "{}: SFP EEPROM not detected\n".format(port_name)
-            else:
-                output += "{}: SFP EEPROM detected\n".format(port_name)
+            output += convert_sfp_info_to_output_string(xcvr_info)
+
+            if dump_dom:
+                try:
+                    api = sfp.get_xcvr_api()
+                except NotImplementedError:
+                    raise PortReadAbort(output + "API is currently not implemented for this platform\n")
+                if api is None:
+                    raise PortReadAbort(output + "API is none while getting DOM info!\n")
+                else:
+                    if api.is_flat_memory():
+                        output += "DOM values not supported for flat memory module\n"
+                        continue
+                try:
+                    xcvr_dom_info = sfp.get_transceiver_dom_real_value()
+                except NotImplementedError:
+                    raise PortReadAbort("Sfp.get_transceiver_dom_real_value() is currently not implemented "
+                                        "for this platform")
 
                 try:
-                    xcvr_info = platform_chassis.get_sfp(physical_port).get_transceiver_info()
+                    xcvr_dom_threshold_info = sfp.get_transceiver_threshold_info()
+                    if xcvr_dom_threshold_info:
+                        xcvr_dom_info.update(xcvr_dom_threshold_info)
                 except NotImplementedError:
-                    click.echo("Sfp.get_transceiver_info() is currently not implemented for this platform")
-                    sys.exit(ERROR_NOT_IMPLEMENTED)
-
-                output += convert_sfp_info_to_output_string(xcvr_info)
-
-                if dump_dom:
-                    try:
-                        api = platform_chassis.get_sfp(physical_port).get_xcvr_api()
-                    except NotImplementedError:
-                        output += "API is currently not implemented for this platform\n"
-                        click.echo(output)
-                        sys.exit(ERROR_NOT_IMPLEMENTED)
-                    if api is None:
-                        output += "API is none while getting DOM info!\n"
-                        click.echo(output)
-                        sys.exit(ERROR_NOT_IMPLEMENTED)
-                    else:
-                        if api.is_flat_memory():
-                            output += "DOM values not supported for flat memory module\n"
-                            continue
-                    try:
-                        xcvr_dom_info = platform_chassis.get_sfp(physical_port).get_transceiver_dom_real_value()
-                    except NotImplementedError:
-                        click.echo("Sfp.get_transceiver_dom_real_value() is currently not implemented "
-                                   "for this platform")
-                        sys.exit(ERROR_NOT_IMPLEMENTED)
-
-                    try:
-                        xcvr_dom_threshold_info = platform_chassis.get_sfp(physical_port).get_transceiver_threshold_info()
-                        if xcvr_dom_threshold_info:
-                            xcvr_dom_info.update(xcvr_dom_threshold_info)
-                    except NotImplementedError:
-                        click.echo("Sfp.get_transceiver_threshold_info() is currently not implemented for this platform")
-                        sys.exit(ERROR_NOT_IMPLEMENTED)
-
-                    output += convert_dom_to_output_string(xcvr_info['type'], xcvr_dom_info)
+                    raise PortReadAbort("Sfp.get_transceiver_threshold_info() is currently not implemented "
+                                        "for this platform")
 
-            output += '\n'
+                output += convert_dom_to_output_string(xcvr_info['type'], xcvr_dom_info)
+
+        output += '\n'
 
-    click.echo(output)
+    return output
 
 
 # 'eeprom-hexdump' subcommand
 @show.command()
 @click.option('-p', '--port', metavar='<port_name>', help="Display SFP EEPROM hexdump for port <port_name>")
 @click.option('-n', '--page', metavar='<page_number>', help="Display SFP EEEPROM hexdump for <page_number_in_hex>")
-def eeprom_hexdump(port, page):
+@port_reader_click_options
+def eeprom_hexdump(port, page, workers, bus_limit, timeout):
     """Display EEPROM hexdump of SFP transceiver(s)"""
     if port:
         if page is None:
@@ -739,15 +834,18 @@ def eeprom_hexdump(port, page):
         if page is not None:
             page = validate_eeprom_page(page)
         logical_port_list = natsorted(platform_sfputil.logical)
-        lines = []
-        for logical_port_name in logical_port_list:
-            return_code, output = eeprom_hexdump_single_port(logical_port_name, page)
+
+        def read_hexdump(logical_port_name):
+            return eeprom_hexdump_single_port(logical_port_name, page)
+
+        for logical_port_name, result, error in read_ports(logical_port_list, read_hexdump,
+                                                           workers, bus_limit, timeout):
+            return_code, output = result if error is None else (EXIT_FAIL, f'Error: {error}')
             if return_code != 0:
-                lines.append(f'EEPROM hexdump for port {logical_port_name}')
-                lines.append(f'{EEPROM_DUMP_INDENT}{output}\n')
+                click.echo(f'EEPROM hexdump for port {logical_port_name}')
+                click.echo(f'{EEPROM_DUMP_INDENT}{output}\n')
                 continue
-            lines.append(output)
-        click.echo('\n'.join(lines))
+            click.echo(output)
 
 def validate_eeprom_page(page):
     """
@@ -996,7 +1094,8 @@ def hexdump(indent, data, mem_address, start_newline=True):
 # 'presence' subcommand
 @show.command()
 @click.option('-p', '--port', metavar='<port_name>', help="Display SFP presence for port <port_name> only")
-def presence(port):
+@port_reader_click_options
+def presence(port, workers, bus_limit, timeout):
     """Display presence of SFP transceiver(s)"""
     logical_port_list = []
     output_table = []
@@ -1014,31 +1113,32 @@ def presence(port):
         logical_port_list = [port]
 
     logical_port_list = natsort.natsorted(logical_port_list)
-    for logical_port_name in logical_port_list:
-        ganged = False
-        i = 1
-
-        physical_port_list = logical_port_name_to_physical_port_list(logical_port_name)
-        if physical_port_list is None:
-            click.echo("Error: No physical ports found for logical port '{}'".format(logical_port_name))
-            return
+    physical_port_lists = get_physical_port_lists(logical_port_list)
+    if physical_port_lists is None:
+        return
 
-        if len(physical_port_list) > 1:
-            ganged = True
+    def read_presence(logical_port_name):
+        physical_port_list = physical_port_lists[logical_port_name]
+        ganged = len(physical_port_list) > 1
+        rows = []
 
-        for physical_port in physical_port_list:
+        for i, physical_port in enumerate(physical_port_list, 1):
             port_name = get_physical_port_name(logical_port_name, i, ganged)
 
             try:
                 presence = platform_chassis.get_sfp(physical_port).get_presence()
             except NotImplementedError:
-                click.echo("This functionality is currently not implemented for this platform")
-                sys.exit(ERROR_NOT_IMPLEMENTED)
+                raise PortReadAbort("This functionality is currently not implemented for this platform")
 
             status_string = "Present" if presence else "Not present"
-            output_table.append([port_name, status_string])
+            rows.append([port_name, status_string])
 
-            i += 1
+        return rows
+
+    for logical_port_name, rows, error in read_ports(logical_port_list, read_presence, workers, bus_limit, timeout):
+        if error is not None:
+            rows = [[logical_port_name, "Error: {}".format(error)]]
+        output_table.extend(rows)
 
     click.echo(tabulate(output_table, table_header, tablefmt="simple"))
 
@@ -1142,7 +1242,8 @@ def error_status(port, fetch_from_hardware):
 # 'lpmode' subcommand
 @show.command()
 @click.option('-p', '--port', metavar='<port_name>', help="Display SFP low-power mode status for port <port_name> only")
-def lpmode(port):
+@port_reader_click_options
+def lpmode(port, workers, bus_limit, timeout):
     """Display low-power mode status of SFP transceiver(s)"""
     logical_port_list = []
     output_table = []
@@ -1159,36 +1260,34 @@ def lpmode(port):
 
         logical_port_list = [port]
 
-    for logical_port_name in logical_port_list:
-        ganged = False
-        i = 1
-
-        physical_port_list = logical_port_name_to_physical_port_list(logical_port_name)
-        if physical_port_list is None:
-            click.echo("Error: No physical ports found for logical port '{}'".format(logical_port_name))
-            return
+    physical_port_lists = get_physical_port_lists(logical_port_list)
+    if physical_port_lists is None:
+        return
 
+    def read_lpmode(logical_port_name):
         if is_port_type_rj45(logical_port_name):
-            output_table.append([logical_port_name, "N/A"])
-        else:
-            if len(physical_port_list) > 1:
-                ganged = True
+            return [[logical_port_name, "N/A"]]
 
-            for physical_port in physical_port_list:
-                port_name = get_physical_port_name(logical_port_name, i, ganged)
+        physical_port_list = physical_port_lists[logical_port_name]
+        ganged = len(physical_port_list) > 1
+        rows = []
 
-                try:
-                    lpmode = platform_chassis.get_sfp(physical_port).get_lpmode()
-                except NotImplementedError:
-                    click.echo("This functionality is currently not implemented for this platform")
-                    sys.exit(ERROR_NOT_IMPLEMENTED)
+        for i, physical_port in enumerate(physical_port_list, 1):
+            port_name = get_physical_port_name(logical_port_name, i, ganged)
 
-                if lpmode:
-                    output_table.append([port_name, "On"])
-                else:
-                    output_table.append([port_name, "Off"])
+            try:
+                lpmode = platform_chassis.get_sfp(physical_port).get_lpmode()
+            except NotImplementedError:
+                raise PortReadAbort("This functionality is currently not implemented for this platform")
+
+            rows.append([port_name, "On" if lpmode else "Off"])
+
+        return rows
 
-                i += 1
+    for logical_port_name, rows, error in read_ports(logical_port_list, read_lpmode, workers, bus_limit, timeout):
+        if error is not None:
+            rows = [[logical_port_name, "Error: {}".format(error)]]
+        output_table.extend(rows)
 
     click.echo(tabulate(output_table, table_header, tablefmt='simple'))
 
@@ -1412,12 +1511,34 @@ def firmware():
     """Download/Upgrade firmware on the transceiver"""
     pass
 
-def run_firmware(port_name, mode):
+
+class FirmwareAbort(Exception):
+    """Raised by the firmware functions to stop the command with a message and an exit code"""
+    def __init__(self, message, exit_code=EXIT_FAIL):
+        super(FirmwareAbort, self).__init__(message)
+        self.message = message
+        self.exit_code = exit_code
+
+
+def exit_on_firmware_abort(func):
+    """Print the message of FirmwareAbort and exit with its exit code"""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        except FirmwareAbort as e:
+            click.echo(e.message)
+            sys.exit(e.exit_code)
+    return wrapper
+
+
+def run_firmware(port_name, mode, echo=click.echo):
     """
         Make the inactive firmware as the current running firmware
         @port_name:
         @mode: 0, 1, 2, 3 different modes to run the firmware
-        Returns 1 on success, and exit_code = -1 on failure
+        @echo: function which prints the messages
+        Returns 1 on success, raises FirmwareAbort on failure
     """
     status = 0
     physical_port = logical_port_to_physical_port_index(port_name)
@@ -1426,33 +1547,32 @@ def run_firmware(port_name, mode):
     try:
         api = sfp.get_xcvr_api()
     except NotImplementedError:
-        click.echo("This functionality is currently not implemented for this platform")
-        sys.exit(ERROR_NOT_IMPLEMENTED)
+        raise FirmwareAbort("This functionality is currently not implemented for this platform", ERROR_NOT_IMPLEMENTED)
 
     if mode == 0:
-        click.echo("Running firmware: Non-hitless Reset to Inactive Image")
+        echo("Running firmware: Non-hitless Reset to Inactive Image")
     elif mode == 1:
-        click.echo("Running firmware: Hitless Reset to Inactive Image")
+        echo("Running firmware: Hitless Reset to Inactive Image")
     elif mode == 2:
-        click.echo("Running firmware: Attempt non-hitless Reset to Running Image")
+        echo("Running firmware: Attempt non-hitless Reset to Running Image")
     elif mode == 3:
-        click.echo("Running firmware: Attempt Hitless Reset to Running Image")
+        echo("Running firmware: Attempt Hitless Reset to Running Image")
     else:
-        click.echo("Running firmware: Unknown mode {}".format(mode))
-        sys.exit(EXIT_FAIL)
+        raise FirmwareAbort("Running firmware: Unknown mode {}".format(mode))
 
     try:
         status = api.cdb_run_firmware(mode)
     except NotImplementedError:
-        click.echo("This functionality is not applicable for this transceiver")
-        sys.exit(EXIT_FAIL)
+        raise FirmwareAbort("This functionality is not applicable for this transceiver")
 
     return status
 
-def is_fw_switch_done(port_name):
+
+def is_fw_switch_done(port_name, echo=click.echo):
     """
         Make sure the run_firmware cmd is done
         @port_name:
+        @echo: function which prints the messages
         Returns 1 on success, and exit_code = -1 on failure
     """
     status = 0
@@ -1462,47 +1582,30 @@ def is_fw_switch_done(port_name):
     try:
         api = sfp.get_xcvr_api()
     except NotImplementedError:
-        click.echo("This functionality is currently not implemented for this platform")
-        sys.exit(ERROR_NOT_IMPLEMENTED)
+        raise FirmwareAbort("This functionality is currently not implemented for this platform", ERROR_NOT_IMPLEMENTED)
 
     try:
-        MAX_WAIT = 60 # 60s timeout.
         is_busy = 1 # Initial to 1 for entering while loop at least one time.
-        timeout_time = time.time() + MAX_WAIT
+        timeout_time = time.time() + FW_SWITCH_TIMEOUT
         while is_busy and (time.time() < timeout_time):
             fw_info = api.get_module_fw_info()
             is_busy = 1 if (fw_info['status'] == False) and (fw_info['result'] is not None) else 0
-            time.sleep(2)
+            time.sleep(FW_SWITCH_POLL_INTERVAL)
 
         if fw_info['status'] == True:
-            (ImageA, ImageARunning, ImageACommitted, ImageAInvalid,
-             ImageB, ImageBRunning, ImageBCommitted, ImageBInvalid, _, _) = fw_info['result']
-
-            if (ImageARunning == 1) and (ImageAInvalid == 1):       # ImageA is running, but also invalid.
-                click.echo("FW info error : ImageA shows running, but also shows invalid!")
-                status = -1 # Abnormal status.
-            elif (ImageBRunning == 1) and (ImageBInvalid == 1):     # ImageB is running, but also invalid.
-                click.echo("FW info error : ImageB shows running, but also shows invalid!")
-                status = -1 # Abnormal status.
-            elif (ImageARunning == 1) and (ImageACommitted == 0):   # ImageA is running, but not committed.
-                click.echo("FW images switch successful : ImageA is running")
-                status = 1  # run_firmware is done. 
-            elif (ImageBRunning == 1) and (ImageBCommitted == 0):   # ImageB is running, but not committed.
-                click.echo("FW images switch successful : ImageB is running")
-                status = 1  # run_firmware is done. 
-            else:                                                   # No image is running, or running and committed image is same.
-                click.echo("FW info error : Failed to switch into uncommitted image!")
-                status = -1 # Failure for Switching images.
+            status, message = get_fw_switch_status(fw_info['result'])
+            echo(message)
         else:
-            click.echo("FW switch : Timeout!")
+            echo("FW switch : Timeout!")
             status = -1     # Timeout or check code error or CDB not supported.
 
     except NotImplementedError:
-        click.echo("This functionality is not applicable for this transceiver")
+        echo("This functionality is not applicable for this transceiver")
 
     return status
 
-def commit_firmware(port_name):
+
+def commit_firmware(port_name, echo=click.echo):
     status = 0
     physical_port = logical_port_to_physical_port_index(port_name)
     sfp = platform_chassis.get_sfp(physical_port)
@@ -1510,94 +1613,103 @@ def commit_firmware(port_name):
     try:
         api = sfp.get_xcvr_api()
     except NotImplementedError:
-        click.echo("This functionality is currently not implemented for this platform")
-        sys.exit(ERROR_NOT_IMPLEMENTED)
+        raise FirmwareAbort("This functionality is currently not implemented for this platform", ERROR_NOT_IMPLEMENTED)
 
     try:
         status = api.cdb_commit_firmware()
     except NotImplementedError:
-        click.echo("This functionality is not applicable for this transceiver")
+        echo("This functionality is not applicable for this transceiver")
 
     return status
 
-def download_firmware(port_name, filepath):
-    """Download firmware on the transceiver"""
+
+def read_firmware_image(filepath):
+    """Read the firmware image file into memory, exit if it doesn't exist"""
     try:
-        fd = open(filepath, 'rb')
-        fd.seek(0, 2)
-        file_size = fd.tell()
-        fd.seek(0, 0)
-    except FileNotFoundError:
+        return FirmwareImage(filepath)
+    except (FileNotFoundError, IsADirectoryError):
         click.echo("Firmware file {} NOT found".format(filepath))
         sys.exit(EXIT_FAIL)
 
+
+def download_firmware(port_name, filepath):
+    """Download firmware on the transceiver"""
+    return download_firmware_image(port_name, read_firmware_image(filepath))
+
+
+def download_firmware_image(port_name, image, echo=click.echo, progress=None):
+    """
+        Download the firmware image read into memory on the transceiver
+        @port_name:
+        @image: FirmwareImage
+        @echo: function which prints the messages
+        @progress: function(length, label) which returns the progress bar, click.progressbar if not given
+        Returns the status of the download complete, raises FirmwareAbort on failure
+    """
     physical_port = logical_port_to_physical_port_index(port_name)
     sfp = platform_chassis.get_sfp(physical_port)
     try:
         api = sfp.get_xcvr_api()
     except NotImplementedError:
-        click.echo("This functionality is NOT applicable to this platform")
-        sys.exit(ERROR_NOT_IMPLEMENTED)
+        raise FirmwareAbort("This functionality is NOT applicable to this platform", ERROR_NOT_IMPLEMENTED)
 
     try:
         fwinfo = api.get_module_fw_mgmt_feature()
         if fwinfo['status'] == True:
             startLPLsize, maxblocksize, lplonly_flag, autopaging_flag, writelength = fwinfo['feature']
         else:
-            click.echo("Failed to fetch CDB Firmware management features")
-            sys.exit(EXIT_FAIL)
+            raise FirmwareAbort("Failed to fetch CDB Firmware management features")
     except NotImplementedError:
-        click.echo("This functionality is NOT applicable for this transceiver")
-        sys.exit(ERROR_NOT_IMPLEMENTED)
+        raise FirmwareAbort("This functionality is NOT applicable for this transceiver", ERROR_NOT_IMPLEMENTED)
 
-    click.echo('CDB: Starting firmware download')
-    startdata = fd.read(startLPLsize)
-    status = api.cdb_start_firmware_download(startLPLsize, startdata, file_size)
+    if lplonly_flag:
+        BLOCK_SIZE = min(MAX_LPL_FIRMWARE_BLOCK_SIZE, maxblocksize)
+    else:
+        BLOCK_SIZE = maxblocksize
+    if BLOCK_SIZE <= 0 and image.size > startLPLsize:
+        raise FirmwareAbort("CDB: invalid firmware block size {}".format(BLOCK_SIZE))
+
+    echo('CDB: Starting firmware download')
+    # The blocks are sliced from the image without copying it
+    data = memoryview(image.data)
+    status = api.cdb_start_firmware_download(startLPLsize, bytes(data[:startLPLsize]), image.size)
     if status != 1:
-        click.echo('CDB: Start firmware download failed - status {}'.format(status))
-        sys.exit(EXIT_FAIL)
+        raise FirmwareAbort('CDB: Start firmware download failed - status {}'.format(status))
 
     # Increase the optoe driver's write max to speed up firmware download
     try:
         sfp.set_optoe_write_max(SMBUS_BLOCK_WRITE_SIZE)
     except NotImplementedError:
-        click.echo("Platform doesn't implement optoe write max change. Skipping value increase.")
+        echo("Platform doesn't implement optoe write max change. Skipping value increase.")
 
-    with click.progressbar(length=file_size, label="Downloading ...") as bar:
-        address = 0
-        if lplonly_flag:
-            BLOCK_SIZE = min(MAX_LPL_FIRMWARE_BLOCK_SIZE, maxblocksize)
-        else:
-            BLOCK_SIZE = maxblocksize
-        remaining = file_size - startLPLsize
-        while remaining > 0:
-            count = BLOCK_SIZE if remaining >= BLOCK_SIZE else remaining
-            data = fd.read(count)
-            if len(data) != count:
-                click.echo("Firmware file read failed!")
-                sys.exit(EXIT_FAIL)
-
-            if lplonly_flag:
-                status = api.cdb_lpl_block_write(address, data)
-            else:
-                status = api.cdb_epl_block_write(address, data, autopaging_flag, writelength)
-            if (status != 1):
-                click.echo("CDB: firmware download failed! - status {}".format(status))
-                sys.exit(EXIT_FAIL)
-
-            bar.update(count)
-            address += count
-            remaining -= count
-
-    # Restore the optoe driver's write max to '1' (default value)
+    if progress is None:
+        progress = click.progressbar
     try:
-        sfp.set_optoe_write_max(1)
-    except NotImplementedError:
-        click.echo("Platform doesn't implement optoe write max change. Skipping value restore!")
+        with progress(length=image.size - startLPLsize, label="Downloading ...") as bar:
+            address = 0
+            offset = startLPLsize
+            while offset < image.size:
+                block = bytes(data[offset:offset + BLOCK_SIZE])
+                if lplonly_flag:
+                    status = api.cdb_lpl_block_write(address, block)
+                else:
+                    status = api.cdb_epl_block_write(address, block, autopaging_flag, writelength)
+                if (status != 1):
+                    raise FirmwareAbort("CDB: firmware download failed! - status {}".format(status))
+
+                bar.update(len(block))
+                address += len(block)
+                offset += len(block)
+    finally:
+        # Restore the optoe driver's write max to '1' (default value)
+        try:
+            sfp.set_optoe_write_max(1)
+        except NotImplementedError:
+            echo("Platform doesn't implement optoe write max change. Skipping value restore!")
 
     status = api.cdb_firmware_download_complete()
     update_firmware_info_to_state_db(port_name)
-    click.echo('CDB: firmware download complete')
+    echo('CDB: firmware download complete')
     return status
 
 # 'run' subcommand
@@ -1610,6 +1722,7 @@ def download_firmware(port_name, filepath):
                                                                3 = Attempt Hitless Reset to Running Image\n")
 @click.option('--delay', metavar='<delay>', type=click.IntRange(0, 10), default=5,
               help="Delay time before updating firmware information to STATE_DB")
+@exit_on_firmware_abort
 def run(port_name, mode, delay):
     """Run the firmware with default mode=0"""
 
@@ -1637,6 +1750,7 @@ def run(port_name, mode, delay):
 # 'commit' subcommand
 @firmware.command()
 @click.argument('port_name', required=True, default=None)
+@exit_on_firmware_abort
 def commit(port_name):
     """Commit the running firmware"""
 
@@ -1660,6 +1774,7 @@ def commit(port_name):
 @firmware.command()
 @click.argument('port_name', required=True, default=None)
 @click.argument('filepath', required=True, default=None)
+@exit_on_firmware_abort
 def upgrade(port_name, filepath):
     """Upgrade firmware on the transceiver"""
 
@@ -1705,6 +1820,7 @@ def upgrade(port_name, filepath):
 @firmware.command()
 @click.argument('port_name', required=True, default=None)
 @click.argument('filepath', required=True, default=None)
+@exit_on_firmware_abort
 def download(port_name, filepath):
     """Download firmware on the transceiver"""
 
@@ -1727,6 +1843,152 @@ def download(port_name, filepath):
     click.echo("Total download Time: {}".format(str(datetime.timedelta(seconds=end-start))))
 
 
+def upgrade_firmware_stages(port_name, image, state, mode, echo):
+    """
+    Run the CDB firmware upgrade stages of the port following its saved stage
+
+    A saved stage is trusted only if the vendor PN/SN of the module and the firmware version of the bank
+    the image was downloaded to didn't change, otherwise the upgrade restarts from the download.
+
+    Returns:
+        the stage the port was resumed from
+    """
+    sfp = platform_chassis.get_sfp(logical_port_to_physical_port_index(port_name))
+    try:
+        api = sfp.get_xcvr_api()
+    except NotImplementedError:
+        api = None
+    if api is None:
+        raise FirmwareUpgradeError("Failed to get the transceiver API")
+
+    stage = start_stage = state.get_stage(port_name)
+    try:
+        module_id = get_module_id(sfp)
+        saved_module = state.get_module(port_name)
+        if stage != STAGE_PENDING and not is_module_unchanged(saved_module, module_id, api.get_module_fw_info()):
+            echo("Module or its firmware changed since the saved '{}' stage, restarting from download".format(stage))
+            stage = start_stage = STAGE_PENDING
+
+        if stage == STAGE_PENDING:
+            echo("Starting firmware download of {} bytes".format(image.size))
+            status = download_firmware_image(port_name, image, echo,
+                                             lambda length, label: DownloadProgress(length, label, echo))
+            if status != 1:
+                raise FirmwareUpgradeError("Firmware download complete failed - status {}".format(status))
+
+            fw_info = api.get_module_fw_info()
+            if not fw_info['status']:
+                raise FirmwareUpgradeError("Failed to read the firmware info after download")
+            bank, version = get_inactive_bank(fw_info['result'])
+            stage = STAGE_DOWNLOADED
+            state.set_stage(port_name, stage, module=dict(module_id or {}, bank=bank, version=version))
+            echo("Firmware download complete")
+
+        if stage == STAGE_DOWNLOADED:
+            status = run_firmware(port_name, mode, echo)
+            if status != 1:
+                raise FirmwareUpgradeError("Failed to run firmware in mode={} - status {}".format(mode, status))
+            stage = STAGE_RUN
+            state.set_stage(port_name, stage)
+            echo("Firmware run in mode {} successful".format(mode))
+
+        if stage == STAGE_RUN:
+            if is_fw_switch_done(port_name, echo) != 1:
+                raise FirmwareUpgradeError("Failed to switch firmware images")
+            status = commit_firmware(port_name, echo)
+            if status != 1:
+                raise FirmwareUpgradeError("Failed to commit firmware - status {}".format(status))
+            stage = STAGE_COMMITTED
+            state.set_stage(port_name, stage)
+            echo("Firmware commit successful")
+    except NotImplementedError:
+        state.set_stage(port_name, stage, error="CDB firmware upgrade is not supported")
+        raise FirmwareUpgradeError("CDB firmware upgrade is not supported") from None
+    except Exception as e:
+        state.set_stage(port_name, stage, error=str(e))
+        raise
+
+    return start_stage
+
+
+# 'upgrade-batch' subcommand
+@firmware.command('upgrade-batch')
+@click.argument('filepath', required=True)
+@click.option('-p', '--ports', metavar='<port_list>',
+              help="Comma separated logical ports to upgrade, all the transceivers are upgraded if not given")
+@click.option('--mode', default="0", type=click.Choice(["0", "1", "2", "3"]), show_default=True,
+              help="Run firmware mode, see 'sfputil firmware run --help'")
+@click.option('--workers', metavar='<workers>', type=click.IntRange(1, MAX_READ_WORKERS), default=1,
+              show_default=True,
+              help="Number of transceivers upgraded concurrently, the platform must support concurrent access")
+@click.option('--bus-limit', metavar='<bus_limit>', type=click.IntRange(0, MAX_READ_WORKERS), default=0,
+              show_default=True,
+              help="Number of transceivers upgraded concurrently on the same I2C bus, 0 for no limit")
+@click.option('--state-file', metavar='<path>', default=None,
+              help="File which keeps the upgrade stage of each port to resume an interrupted upgrade")
+@click.option('--restart', is_flag=True, help="Ignore the saved upgrade stages and upgrade all the ports from start")
+def upgrade_batch(filepath, ports, mode, workers, bus_limit, state_file, restart):
+    """Upgrade firmware on many transceivers with the same image"""
+    image = read_firmware_image(filepath)
+
+    if ports is None:
+        logical_port_list = natsorted(platform_sfputil.logical)
+    else:
+        logical_port_list = [port.strip() for port in ports.split(',')]
+        for port in logical_port_list:
+            if platform_sfputil.is_logical_port(port) == 0:
+                click.echo("Error: invalid port '{}'\n".format(port))
+                print_all_valid_port_values()
+                sys.exit(ERROR_INVALID_PORT)
+
+    # Breakout subports share the module, upgrade it once
+    physical_ports = set()
+    port_list = []
+    for port in logical_port_list:
+        physical_port = logical_port_to_physical_port_index(port)
+        if physical_port not in physical_ports:
+            physical_ports.add(physical_port)
+            port_list.append(port)
+
+    if state_file is None:
+        state_file = os.path.join(UserCache(app_name='sfputil').get_directory(), FW_UPGRADE_STATE_FILE)
+    state = UpgradeState(state_file, image, restart)
+
+    echo_lock = threading.Lock()
+
+    def upgrade_port(port):
+        def report_progress(message):
+            with echo_lock:
+                click.echo("{}: {}".format(port, message))
+
+        if is_port_type_rj45(port):
+            raise FirmwareUpgradeError("This functionality is not applicable for RJ45 port")
+        if not is_sfp_present(port):
+            raise FirmwareUpgradeError("SFP EEPROM not detected")
+        return upgrade_firmware_stages(port, image, state, int(mode), report_progress)
+
+    click.echo("Upgrading firmware of {} transceivers with {} ({} bytes)".format(len(port_list), filepath, image.size))
+    reader = PortReader(max_workers=workers, bus_limit=bus_limit, timeout=0, get_bus=get_logical_port_bus)
+    output_table = []
+    failed = 0
+    for port, start_stage, error in reader.read(port_list, upgrade_port):
+        if error is not None:
+            failed += 1
+            output_table.append([port, state.get_stage(port), "Failed: {}".format(error)])
+            continue
+        if start_stage == STAGE_COMMITTED:
+            output_table.append([port, STAGE_COMMITTED, "Already upgraded"])
+            continue
+        update_firmware_info_to_state_db(port)
+        output_table.append([port, STAGE_COMMITTED, "Upgraded"])
+
+    click.echo(tabulate(output_table, ["Port", "Stage", "Result"], tablefmt='simple'))
+    click.echo("Upgraded {} of {} transceivers, upgrade state is saved to {}".format(
+        len(port_list) - failed, len(port_list), state_file))
+    if failed:
+        sys.exit(EXIT_FAIL)
+
+
 # 'unlock' subcommand
 @firmware.command()
 @click.argument('port_name', required=True, default=None)
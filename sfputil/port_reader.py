@@ -0,0 +1,237 @@
+"""
+Concurrent transceiver read engine for sfputil
+
+Reading the EEPROM of a transceiver is a slow I2C/CMIS transaction. The
+PortReader runs the per-port read function of many ports in parallel with a
+bounded number of worker threads, optionally limits the number of concurrent
+transactions on the same I2C bus and returns the results in the port order,
+each one as soon as it and all the ports before it are done.
+
+A port whose read doesn't finish within the timeout after it started is reported
+with a PortReadTimeout error, an exception raised by the read function is reported
+for that port only, unless it is one of the fatal errors, which are raised
+by read() in the port order. The worker thread of a timed out port can't be stopped,
+it is left running and keeps its worker and bus slots until it finishes, so the
+bus limit holds even for hung transactions. A port waiting for a slot has no
+timeout, unless all the slots it needs are held by timed out reads, then it is
+not read and reported with a PortSlotTimeout error right away.
+
+Usage:
+    reader = PortReader(max_workers=8, bus_limit=1, timeout=10, get_bus=get_bus)
+    for port, result, error in reader.read(ports, read_func):
+        ...
+"""
+
+import os
+import re
+import threading
+import time
+
+DEFAULT_MAX_WORKERS = 8
+# No timeout, the reads block until they finish
+DEFAULT_PORT_TIMEOUT = 0
+
+I2C_ADAPTER_PATTERN = re.compile(r'^i2c-\d+$')
+
+
+class PortReadTimeout(Exception):
+    """Raised for a port which read didn't complete in time"""
+    def __init__(self, timeout):
+        super(PortReadTimeout, self).__init__('timed out after {} seconds'.format(timeout))
+
+
+class PortSlotTimeout(Exception):
+    """Raised for a port which wasn't read because its slots are held by timed out reads"""
+    def __init__(self, timeout):
+        super(PortSlotTimeout, self).__init__(
+            'not read, its slot is held by a read which timed out after {} seconds'.format(timeout))
+
+
+def get_sfp_bus(sfp):
+    """
+    Return the root I2C adapter of the transceiver EEPROM, e.g. 'i2c-1'
+
+    Mux channels are I2C adapters nested under their parent adapter in sysfs,
+    so all the ports behind a mux tree share the root adapter.
+
+    Returns:
+        Adapter name or None if the platform doesn't expose the EEPROM path
+    """
+    try:
+        eeprom_path = sfp.get_eeprom_path()
+    except (AttributeError, NotImplementedError):
+        return None
+
+    if not isinstance(eeprom_path, str):
+        return None
+
+    for name in os.path.realpath(eeprom_path).split(os.sep):
+        if I2C_ADAPTER_PATTERN.match(name):
+            return name
+    return None
+
+
+class PortReadTask(object):
+    def __init__(self, port, bus):
+        self.port = port
+        self.bus = bus
+        self.start_time = None
+        self.done = False
+        self.abandoned = False
+        self.result = None
+        self.error = None
+
+
+class PortReader(object):
+    """Runs the per-port reads concurrently and yields the results in port order"""
+
+    def __init__(self, max_workers=DEFAULT_MAX_WORKERS, bus_limit=0, timeout=DEFAULT_PORT_TIMEOUT, get_bus=None,
+                 fatal_errors=()):
+        """
+        Args:
+            max_workers: maximal number of ports read concurrently
+            bus_limit: maximal number of ports read concurrently on the same bus, 0 for no limit
+            timeout: per-port read timeout in seconds, 0 for no timeout
+            get_bus: function which returns the bus of a port, used only if bus_limit is set
+            fatal_errors: exception types which stop the read, SystemExit always does
+        """
+        self.max_workers = max(max_workers, 1)
+        self.bus_limit = bus_limit
+        self.timeout = timeout
+        self.get_bus = get_bus
+        self.fatal_errors = (SystemExit,) + tuple(fatal_errors)
+        self._cond = threading.Condition()
+        self._running = 0
+        self._bus_running = {}
+        # Slots held by the reads which timed out
+        self._hung = 0
+        self._bus_hung = {}
+
+    def _get_bus(self, port):
+        if not self.bus_limit or self.get_bus is None:
+            return None
+        try:
+            return self.get_bus(port)
+        except Exception:
+            return None
+
+    def _can_start(self, task):
+        if self._running >= self.max_workers:
+            return False
+        if task.bus is None:
+            return True
+        return self._bus_running.get(task.bus, 0) < self.bus_limit
+
+    def _blocked_by_hung(self, task):
+        # The task can't start before a timed out read finishes, which may never happen
+        if self._hung >= self.max_workers:
+            return True
+        return task.bus is not None and self._bus_hung.get(task.bus, 0) >= self.bus_limit
+
+    def _release(self, task):
+        self._running -= 1
+        if task.bus is not None:
+            self._bus_running[task.bus] -= 1
+        if task.abandoned:
+            self._hung -= 1
+            if task.bus is not None:
+                self._bus_hung[task.bus] -= 1
+        self._cond.notify_all()
+
+    def _abandon(self, task):
+        task.abandoned = True
+        task.error = PortReadTimeout(self.timeout)
+        self._hung += 1
+        if task.bus is not None:
+            self._bus_hung[task.bus] = self._bus_hung.get(task.bus, 0) + 1
+
+    def _run(self, task, read_func):
+        result = error = None
+        try:
+            result = read_func(task.port)
+        except BaseException as e:
+            error = e
+
+        with self._cond:
+            task.done = True
+            if not task.abandoned:
+                task.result = result
+                task.error = error
+            # A timed out task releases its slots only now, its bus was busy until here
+            self._release(task)
+
+    def _start(self, task, read_func):
+        self._running += 1
+        if task.bus is not None:
+            self._bus_running[task.bus] = self._bus_running.get(task.bus, 0) + 1
+        task.start_time = time.monotonic()
+        thread = threading.Thread(target=self._run, args=(task, read_func))
+        thread.daemon = True
+        thread.start()
+
+    def _dispatch(self, pending, started, read_func):
+        # Start the pending tasks in port order as long as there are free worker and bus slots
+        for task in list(pending):
+            if self._running >= self.max_workers:
+                break
+            if self._can_start(task):
+                pending.remove(task)
+                self._start(task, read_func)
+                started.append(task)
+
+    def _expire(self, started):
+        """
+        Abandon the started reads which timed out
+
+        Returns:
+            seconds until the next started read times out, None if there is none
+        """
+        now = time.monotonic()
+        wait_time = None
+        for task in list(started):
+            if task.done or task.abandoned:
+                started.remove(task)
+                continue
+            remaining = task.start_time + self.timeout - now
+            if remaining <= 0:
+                self._abandon(task)
+                started.remove(task)
+            elif wait_time is None or remaining < wait_time:
+                wait_time = remaining
+        return wait_time
+
+    def read(self, ports, read_func):
+        """
+        Read the ports concurrently
+
+        Args:
+            ports: list of ports, any hashable object passed to read_func and get_bus
+            read_func: function which reads a single port and returns the result
+
+        Yields:
+            (port, result, error) in the order of ports, error is None on success
+
+        Raises:
+            the error of the first port in order which read raised a fatal error
+        """
+        tasks = [PortReadTask(port, self._get_bus(port)) for port in ports]
+        pending = list(tasks)
+        started = []
+
+        for task in tasks:
+            with self._cond:
+                while True:
+                    self._dispatch(pending, started, read_func)
+                    # The timeout of every started read runs, not only the one of this port
+                    wait_time = self._expire(started) if self.timeout else None
+                    if task.done or task.abandoned:
+                        break
+                    if task.start_time is None and self._blocked_by_hung(task):
+                        pending.remove(task)
+                        task.error = PortSlotTimeout(self.timeout)
+                        break
+                    self._cond.wait(wait_time)
+
+            if isinstance(task.error, self.fatal_errors):
+                raise task.error
+            yield task.port, task.result, task.error
@@ -1,4 +1,5 @@
 import importlib
+import json
 import sys
 import os
 import pytest
@@ -11,6 +12,72 @@ sys.path.insert(0, modules_path)
 from acl_loader import *
 from acl_loader.main import *
 
+
+def generate_acl_json(num_rules):
+    """ OpenConfig ACL with num_rules rules which use all the converted fields """
+    tables = ["DATAACL", "DATAACL_2", "DATAACLV4V6", "EVERFLOW", "SSH_ONLY"]
+    protocols = ["IP_TCP", "IP_UDP", "IP_ICMP", "6", 17, "0", "IP_GRE"]
+    acl_sets = {table: {"acl-entries": {"acl-entry": {}}, "config": {"name": table}} for table in tables}
+    for i in range(1, num_rules + 1):
+        table = tables[i % len(tables)]
+        protocol = protocols[i % len(protocols)]
+        ipv6 = table == "DATAACL_2" or (table == "DATAACLV4V6" and i % 2)
+        entry = {
+            "config": {"sequence-id": i},
+            "actions": {"config": {"forwarding-action": "DROP" if i % 7 == 0 else "ACCEPT"}},
+            "ip": {"config": {"protocol": protocol}}
+        }
+        ip_config = entry["ip"]["config"]
+        if ipv6:
+            ip_config["source-ip-address"] = "fc00:{:x}::/64".format(i)
+        else:
+            ip_config["source-ip-address"] = "10.{}.{}.0/24".format(i // 256 % 256, i % 256)
+        if i % 3:
+            ip_config["destination-ip-address"] = "fc02::{:x}/128".format(i) if ipv6 else "20.0.0.{}/32".format(i % 256)
+        if i % 4 == 0:
+            ip_config["dscp"] = i % 64
+
+        l2_config = {}
+        if table == "DATAACLV4V6":
+            l2_config["ethertype"] = "ETHERTYPE_IPV6" if ipv6 else "ETHERTYPE_IPV4"
+        elif i % 11 == 0:
+            l2_config["ethertype"] = ["ETHERTYPE_LLDP", "2048", 35020][i % 3]
+        if i % 5 == 0:
+            l2_config["vlan-id"] = str(i % 4094 + 1)
+        if l2_config:
+            entry["l2"] = {"config": l2_config}
+
+        if protocol in ["IP_TCP", "IP_UDP", "6", 17]:
+            transport_config = {
+                "source-port": [str(i % 65536), "1024..2048", i % 65536, "0"][i % 4],
+                "destination-port": "{}..{}".format(i % 1000, i % 1000 + 100) if i % 2 else str(i % 65536)
+            }
+            if protocol in ["IP_TCP", "6"] or i % 13 == 0:
+                transport_config["tcp-flags"] = ["TCP_SYN", "TCP_ACK", "TCP_FIN", "TCP_RST"][:i % 5]
+            entry["transport"] = {"config": transport_config}
+        elif protocol == "IP_ICMP":
+            icmp_config = {"type": str(i % 256)}
+            if i % 2:
+                icmp_config["code"] = i % 16
+            entry["icmp"] = {"config": icmp_config}
+
+        if i % 10 == 0:
+            entry["input_interface"] = {"interface_ref": {"config": {"interface": "Ethernet0,Ethernet4"}}}
+
+        acl_sets[table]["acl-entries"]["acl-entry"][str(i)] = entry
+
+    return {"acl": {"acl-sets": {"acl-set": acl_sets}}}
+
+
+def load_rules(acl_loader, filename, fast_convert):
+    """ Rules converted from the file, or the type of the exception raised by the conversion """
+    acl_loader.rules_info = {}
+    try:
+        acl_loader.load_rules_from_file(filename, fast_convert=fast_convert)
+    except (AclLoaderException, AttributeError, ValueError) as e:
+        return type(e)
+    return acl_loader.rules_info
+
 class TestAclLoader(object):
     @pytest.fixture(scope="class")
     def acl_loader(self):
@@ -324,6 +391,118 @@ class TestAclLoader(object):
         acl_loader.incremental_update()
         assert acl_loader.rules_info[(('NTP_ACL', 'RULE_1'))]["PACKET_ACTION"] == "DROP"
 
+    def assert_fast_convert_conforms(self, acl_loader, filename):
+        rules = load_rules(acl_loader, filename, fast_convert=False)
+        fast_rules = load_rules(acl_loader, filename, fast_convert=True)
+        assert fast_rules == rules
+        if isinstance(rules, dict):
+            # The values written to config DB are the same as well
+            assert {key: rule_to_raw(rule) for key, rule in fast_rules.items()} == \
+                {key: rule_to_raw(rule) for key, rule in rules.items()}
+        return fast_rules
+
+    @pytest.mark.parametrize("filename", sorted(os.listdir(os.path.join(test_path, 'acl_input'))))
+    def test_fast_convert_conformance(self, acl_loader, filename):
+        self.assert_fast_convert_conforms(acl_loader, os.path.join(test_path, 'acl_input', filename))
+
+    def test_fast_convert_conformance_large(self, acl_loader, tmp_path):
+        filename = os.path.join(str(tmp_path), 'large_acl.json')
+        with open(filename, 'w') as f:
+            json.dump(generate_acl_json(1000), f)
+        rules = self.assert_fast_convert_conforms(acl_loader, filename)
+        assert len(rules) > 500
+
+    def test_fast_convert_invalid_leaf(self, acl_loader, tmp_path):
+        acl_json = generate_acl_json(10)
+        acl_entry = acl_json["acl"]["acl-sets"]["acl-set"]["DATAACL"]["acl-entries"]["acl-entry"]["5"]
+        acl_entry["ip"]["config"]["protocol"] = "IP_FOO"
+        filename = os.path.join(str(tmp_path), 'invalid_acl.json')
+        with open(filename, 'w') as f:
+            json.dump(acl_json, f)
+        acl_loader.rules_info = {}
+        with pytest.raises(ValueError, match="Invalid value IP_FOO of DATAACL/5/ip/config/protocol"):
+            acl_loader.load_rules_from_file(filename, fast_convert=True)
+
+    @pytest.mark.parametrize("path", [
+        ("ip", "config", "source-ip-adress"),
+        ("ip", "conifg", "source-ip-address"),
+        ("transport", "config", "destination-prot"),
+    ])
+    def test_fast_convert_unknown_name(self, acl_loader, tmp_path, path):
+        acl_json = generate_acl_json(10)
+        acl_entry = acl_json["acl"]["acl-sets"]["acl-set"]["DATAACL"]["acl-entries"]["acl-entry"]["5"]
+        container = acl_entry
+        for name in path[:-1]:
+            container = container.setdefault(name, {})
+        container[path[-1]] = "10.0.0.1/32"
+        filename = os.path.join(str(tmp_path), 'unknown_name_acl.json')
+        with open(filename, 'w') as f:
+            json.dump(acl_json, f)
+        # The misspelled name is rejected instead of being ignored, which would install a broader rule
+        assert self.assert_fast_convert_conforms(acl_loader, filename) == AttributeError
+
+    def test_fast_convert_unconverted_leaf(self, acl_loader, tmp_path):
+        acl_json = generate_acl_json(10)
+        acl_entry = acl_json["acl"]["acl-sets"]["acl-set"]["DATAACL"]["acl-entries"]["acl-entry"]["5"]
+        acl_entry["config"]["description"] = "known leaf which is not converted"
+        filename = os.path.join(str(tmp_path), 'unconverted_leaf_acl.json')
+        with open(filename, 'w') as f:
+            json.dump(acl_json, f)
+        assert isinstance(self.assert_fast_convert_conforms(acl_loader, filename), dict)
+
+    def test_full_update_diff(self, acl_loader):
+        current_rules = {
+            ('DATAACL', 'RULE_1'): {'PRIORITY': '9999', 'PACKET_ACTION': 'FORWARD', 'IP_PROTOCOL': '6'},
+            ('DATAACL', 'RULE_2'): {'PRIORITY': '9998', 'PACKET_ACTION': 'FORWARD', 'SRC_IP': '10.0.0.2/32'},
+            ('DATAACL', 'RULE_3'): {'PRIORITY': '9997', 'PACKET_ACTION': 'FORWARD', 'SRC_IP': '10.0.0.3/32'},
+            ('EVERFLOW', 'RULE_1'): {'PRIORITY': '9999', 'MIRROR_ACTION': 'everflow0', 'SRC_IP': '10.0.0.1/32'}
+        }
+        new_rules = {
+            ('DATAACL', 'RULE_1'): {'PRIORITY': '9999', 'PACKET_ACTION': 'FORWARD', 'IP_PROTOCOL': 6},
+            ('DATAACL', 'RULE_2'): {'PRIORITY': '9998', 'PACKET_ACTION': 'DROP', 'SRC_IP': '10.0.0.2/32'},
+            ('DATAACL', 'RULE_4'): {'PRIORITY': '9996', 'PACKET_ACTION': 'DROP', 'SRC_IP': '10.0.0.4/32'}
+        }
+        acl_loader.rules_db_info = current_rules
+        acl_loader.rules_info = new_rules
+        acl_loader.current_table = 'DATAACL'
+        try:
+            with mock.patch('acl_loader.main.bulk_set_entries') as mock_bulk_set_entries:
+                acl_loader.full_update()
+        finally:
+            acl_loader.current_table = None
+
+        configdb = acl_loader.configdb
+        dataacl_rules = {key: rule for key, rule in current_rules.items() if key[0] == 'DATAACL'}
+        # Removed, modified and added rules are written in this order, the unchanged RULE_1 and
+        # the rules of the other tables are not touched
+        assert mock_bulk_set_entries.call_args_list == [
+            mock.call(configdb, 'ACL_RULE', {('DATAACL', 'RULE_3'): None}),
+            mock.call(configdb, 'ACL_RULE', {('DATAACL', 'RULE_2'): new_rules[('DATAACL', 'RULE_2')]},
+                      current=dataacl_rules),
+            mock.call(configdb, 'ACL_RULE', {('DATAACL', 'RULE_4'): new_rules[('DATAACL', 'RULE_4')]})
+        ]
+
+    def test_update_no_changes(self, acl_loader):
+        rules = {('DATAACL', 'RULE_1'): {'PRIORITY': '9999', 'PACKET_ACTION': 'FORWARD'}}
+        acl_loader.rules_db_info = rules
+        acl_loader.rules_info = dict(rules)
+        with mock.patch('acl_loader.main.bulk_set_entries') as mock_bulk_set_entries:
+            acl_loader.incremental_update()
+        assert not mock_bulk_set_entries.called
+
+    def test_delete(self, acl_loader):
+        acl_loader.rules_db_info = {
+            ('DATAACL', 'RULE_1'): {'PRIORITY': '9999', 'PACKET_ACTION': 'FORWARD'},
+            ('DATAACL', 'RULE_2'): {'PRIORITY': '9998', 'PACKET_ACTION': 'DROP'},
+            ('EVERFLOW', 'RULE_1'): {'PRIORITY': '9999', 'MIRROR_ACTION': 'everflow0'}
+        }
+        with mock.patch('acl_loader.main.bulk_set_entries') as mock_bulk_set_entries:
+            acl_loader.delete(rule='RULE_1')
+        mock_bulk_set_entries.assert_called_once_with(acl_loader.configdb, 'ACL_RULE', {
+            ('DATAACL', 'RULE_1'): None,
+            ('EVERFLOW', 'RULE_1'): None
+        })
+
 
 
 class TestMasicAclLoader(object):
@@ -363,3 +542,48 @@ class TestMasicAclLoader(object):
         acl_loader.load_rules_from_file(os.path.join(test_path, 'acl_input/incremental_2.json'))
         acl_loader.incremental_update()
         assert acl_loader.rules_info[(('NTP_ACL', 'RULE_1'))]["PACKET_ACTION"] == "DROP"
+
+    def test_full_update_namespaces(self, acl_loader):
+        rule_1 = {'PRIORITY': '9999', 'PACKET_ACTION': 'FORWARD'}
+        rule_2 = {'PRIORITY': '9998', 'PACKET_ACTION': 'DROP'}
+        acl_loader.rules_db_info = {('DATAACL', 'RULE_1'): rule_1}
+        acl_loader.rules_info = {('DATAACL', 'RULE_1'): rule_1, ('DATAACL', 'RULE_2'): rule_2}
+        # asic0 is in sync with the host config DB, asic1 drifted: RULE_1 differs and RULE_3 is stale
+        asic1_rules = {('DATAACL', 'RULE_1'): dict(rule_1, PACKET_ACTION='DROP'), ('DATAACL', 'RULE_3'): rule_2}
+        asic0_configdb = acl_loader.per_npu_configdb['asic0']
+        asic1_configdb = acl_loader.per_npu_configdb['asic1']
+        with mock.patch('acl_loader.main.bulk_set_entries') as mock_bulk_set_entries, \
+                mock.patch.object(asic0_configdb, 'get_table', return_value=dict(acl_loader.rules_db_info)), \
+                mock.patch.object(asic1_configdb, 'get_table', return_value=asic1_rules):
+            acl_loader.full_update()
+
+        # Each config DB is diffed against its own rules
+        added = {('DATAACL', 'RULE_2'): rule_2}
+        assert mock_bulk_set_entries.call_count == 5
+        mock_bulk_set_entries.assert_any_call(acl_loader.configdb, 'ACL_RULE', added)
+        mock_bulk_set_entries.assert_any_call(asic0_configdb, 'ACL_RULE', added)
+        mock_bulk_set_entries.assert_any_call(asic1_configdb, 'ACL_RULE', {('DATAACL', 'RULE_3'): None})
+        mock_bulk_set_entries.assert_any_call(asic1_configdb, 'ACL_RULE', {('DATAACL', 'RULE_1'): rule_1},
+                                              current=asic1_rules)
+        mock_bulk_set_entries.assert_any_call(asic1_configdb, 'ACL_RULE', added)
+
+    def test_delete_namespaces(self, acl_loader):
+        acl_loader.rules_db_info = {
+            ('DATAACL', 'RULE_1'): {'PRIORITY': '9999', 'PACKET_ACTION': 'FORWARD'},
+            ('DATAACL', 'RULE_2'): {'PRIORITY': '9998', 'PACKET_ACTION': 'DROP'}
+        }
+        # asic1 drifted: RULE_2 differs and RULE_3 is only in asic1
+        asic1_configdb = acl_loader.per_npu_configdb['asic1']
+        asic1_rules = {
+            ('DATAACL', 'RULE_1'): {'PRIORITY': '9999', 'PACKET_ACTION': 'FORWARD'},
+            ('DATAACL', 'RULE_2'): {'PRIORITY': '9998', 'PACKET_ACTION': 'FORWARD'},
+            ('DATAACL', 'RULE_3'): {'PRIORITY': '9997', 'PACKET_ACTION': 'DROP'}
+        }
+        with mock.patch('acl_loader.main.bulk_set_entries') as mock_bulk_set_entries, \
+                mock.patch.object(asic1_configdb, 'get_table', return_value=asic1_rules):
+            acl_loader.delete(table='DATAACL', rule='RULE_1')
+
+        # Only the matched rule is deleted from every config DB, the drift of asic1 is left as is
+        assert mock_bulk_set_entries.call_count == 3
+        for configdb in [acl_loader.configdb, *acl_loader.per_npu_configdb.values()]:
+            mock_bulk_set_entries.assert_any_call(configdb, 'ACL_RULE', {('DATAACL', 'RULE_1'): None})
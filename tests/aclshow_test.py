@@ -319,3 +319,44 @@ def test_clear_and_populate_counters_db():
     with mock.patch('aclshow.SonicV2Connector', return_value=conn):
         test = Aclshow(nullify_on_start, nullify_on_exit, all=True, clear=False, rules=None, tables=None, verbose=None)
     assert test.result.getvalue() == all_after_clear_and_populate_output
+
+
+def test_clear_compact_snapshot():
+    nullify_on_start, nullify_on_exit = True, False
+    test = Aclshow(nullify_on_start, nullify_on_exit, all=True, clear=True, rules=None, tables='DATAACL', verbose=None)
+    assert test.result.getvalue() == clear_output
+    try:
+        with open(aclshow.COUNTERS_CACHE) as fp:
+            saved = json.load(fp)
+        assert list(saved) == ['DATAACL']
+        assert saved['DATAACL']['RULE_1'] == ['101', '100']
+        assert saved['DATAACL']['DEFAULT_RULE'] == ['2', '1']
+    finally:
+        test.nullify_counters()
+
+
+def test_previous_counters_old_format():
+    with open(aclshow.COUNTERS_CACHE, 'w') as fp:
+        json.dump([{'key': ['DATAACL', 'RULE_1'],
+                    'value': {aclshow.COUNTER_PACKETS_ATTR: '100', aclshow.COUNTER_BYTES_ATTR: '90'}}], fp)
+    nullify_on_start, nullify_on_exit = False, True
+    test = Aclshow(nullify_on_start, nullify_on_exit, all=None, clear=None, rules='RULE_1', tables='DATAACL',
+                   verbose=None)
+    assert test.result.getvalue() == """\
+RULE NAME    TABLE NAME      PRIO    PACKETS COUNT    BYTES COUNT
+-----------  ------------  ------  ---------------  -------------
+RULE_1       DATAACL         9999                1             10
+"""
+
+
+def test_filter_before_fetch():
+    with mock.patch.object(aclshow, 'bulk_get_entries', wraps=aclshow.bulk_get_entries) as mock_bulk_get_entries:
+        test = Aclshow(all=None, clear=None, rules='RULE_1,RULE_6', tables='DATAACL', verbose=None)
+    assert test.result.getvalue() == rule1_dataacl_output
+
+    # Only the config and the counters of the filtered rule are read
+    (_, _, rule_keys), _ = mock_bulk_get_entries.call_args_list[0]
+    assert list(rule_keys) == ['ACL_RULE|DATAACL|RULE_1']
+    (_, _, counter_keys), kwargs = mock_bulk_get_entries.call_args_list[1]
+    assert len(counter_keys) == 1
+    assert kwargs['fields'] == [aclshow.COUNTER_PACKETS_ATTR, aclshow.COUNTER_BYTES_ATTR]
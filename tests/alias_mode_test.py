@@ -0,0 +1,79 @@
+import io
+from unittest import mock
+
+from utilities_common import cli as clicommon
+
+NUM_PORTS = 1024
+
+
+class MockAliasConverter(object):
+    def __init__(self, num_ports):
+        self.port_dict = {'Ethernet{}'.format(i * 4): {'alias': 'etp{}'.format(i + 1)} for i in range(num_ports)}
+        self.alias_max_length = max(len(port['alias']) for port in self.port_dict.values())
+
+    def name_to_alias(self, interface_name):
+        if interface_name in self.port_dict:
+            return self.port_dict[interface_name]['alias']
+        return interface_name
+
+
+class MockProcess(object):
+    def __init__(self, lines):
+        self.stdout = io.StringIO(''.join(lines))
+
+    def poll(self):
+        return 0
+
+
+def run_command_in_alias_mode(command, lines):
+    with mock.patch('utilities_common.cli.subprocess.Popen', return_value=MockProcess(lines)):
+        clicommon.run_command_in_alias_mode(command)
+
+
+def intf_status_lines(num_ports):
+    lines = ['  Interface            Lanes    Speed    MTU    FEC    Alias    Vlan    Oper    Admin\n',
+             '-----------  ---------------  -------  -----  -----  -------  ------  ------  -------\n']
+    for i in range(num_ports):
+        lines.append('  Ethernet{}  {},{},{},{}     100G   9100    N/A   etp{}  routed      up       up\n'.format(
+            i * 4, i * 4, i * 4 + 1, i * 4 + 2, i * 4 + 3, i + 1))
+    return lines
+
+
+@mock.patch.object(clicommon, 'iface_alias_converter', MockAliasConverter(NUM_PORTS))
+class TestAliasMode(object):
+
+    def test_translate(self):
+        translator = clicommon.InterfaceNameTranslator(clicommon.iface_alias_converter)
+        text = 'Ethernet0, Ethernet4 Ethernet8,Ethernet12 xEthernet16 Ethernet20.5 Ethernet24\n'
+        assert translator.translate(text) == 'etp1, etp2 Ethernet8,Ethernet12 xEthernet16 Ethernet20.5 etp7\n'
+        assert translator.translate('Ethernet40') == 'etp11'
+        assert translator.translate('Ethernet5000') == 'Ethernet5000'
+        assert translator.get_alias('Ethernet4') == 'etp2'
+        assert translator.get_alias('Ethernet5') is None
+
+    def test_translate_no_ports(self):
+        converter = mock.MagicMock(port_dict={})
+        translator = clicommon.InterfaceNameTranslator(converter)
+        assert translator.translate('Ethernet0 up\n') == 'Ethernet0 up\n'
+
+    def test_default_command_scale(self, capsys):
+        lines = intf_status_lines(NUM_PORTS)
+
+        run_command_in_alias_mode(['intfutil', '-c', 'status'], lines)
+
+        output = capsys.readouterr().out.splitlines()
+        assert len(output) == NUM_PORTS + 2
+        assert output[2].split()[0] == 'etp1'
+        assert output[-1].split()[0] == 'etp{}'.format(NUM_PORTS)
+        assert not any('Ethernet' in line for line in output)
+
+    def test_column_command_scale(self, capsys):
+        lines = ['    IFACE    STATE    RX_OK\n', '---------  -------  -------\n']
+        lines += ['Ethernet{}        U        {}\n'.format(i * 4, i) for i in range(NUM_PORTS)]
+
+        run_command_in_alias_mode(['portstat'], lines)
+
+        output = capsys.readouterr().out.splitlines()
+        assert len(output) == NUM_PORTS + 2
+        assert output[2].split() == ['etp1', 'U', '0']
+        assert output[-1].split() == ['etp{}'.format(NUM_PORTS), 'U', str(NUM_PORTS - 1)]
@@ -0,0 +1,213 @@
+import redis
+from unittest import mock
+
+from natsort import natsorted
+from swsscommon.swsscommon import ConfigDBConnector, SonicV2Connector
+
+from .mock_tables import dbconnector
+from utilities_common import bulk_db
+
+
+CRM_ACL_TABLE_STATS = {
+    'CRM:ACL_TABLE_STATS:0x700000000063f': {
+        'crm_stats_acl_counter_used': '0',
+        'crm_stats_acl_entry_used': '0',
+        'crm_stats_acl_counter_available': '2048',
+        'crm_stats_acl_entry_available': '2048'
+    },
+    'CRM:ACL_TABLE_STATS:0x7000000000670': {
+        'crm_stats_acl_counter_used': '0',
+        'crm_stats_acl_entry_used': '0',
+        'crm_stats_acl_counter_available': '1280',
+        'crm_stats_acl_entry_available': '1024'
+    }
+}
+
+
+class TestBulkDb(object):
+    def setup_method(self):
+        self.db = SonicV2Connector(host='127.0.0.1')
+        self.db.connect(self.db.COUNTERS_DB)
+
+    def test_bulk_get_all(self):
+        entries = bulk_db.bulk_get_all(self.db, self.db.COUNTERS_DB, 'CRM:ACL_TABLE_STATS:*')
+        assert entries == CRM_ACL_TABLE_STATS
+
+    def test_bulk_get_all_fields(self):
+        entries = bulk_db.bulk_get_all(self.db, self.db.COUNTERS_DB, 'CRM:ACL_TABLE_STATS:*',
+                                       fields=['crm_stats_acl_entry_available', 'no_such_field'])
+        assert entries == {
+            'CRM:ACL_TABLE_STATS:0x700000000063f': {'crm_stats_acl_entry_available': '2048'},
+            'CRM:ACL_TABLE_STATS:0x7000000000670': {'crm_stats_acl_entry_available': '1024'}
+        }
+
+    def test_bulk_get_all_no_match(self):
+        assert bulk_db.bulk_get_all(self.db, self.db.COUNTERS_DB, 'NO_SUCH_TABLE:*') == {}
+
+    def test_bulk_get_entries_missing_keys(self):
+        keys = list(CRM_ACL_TABLE_STATS) + ['CRM:ACL_TABLE_STATS:0x0']
+        entries = bulk_db.bulk_get_entries(self.db, self.db.COUNTERS_DB, keys)
+        assert entries == CRM_ACL_TABLE_STATS
+
+    def test_bulk_get_entries_chunks(self):
+        client = bulk_db.get_redis_client(self.db, self.db.COUNTERS_DB)
+        keys = client.keys('*')
+        with mock.patch.object(client, 'pipeline', wraps=client.pipeline) as mock_pipeline:
+            entries = bulk_db.bulk_get_entries(self.db, self.db.COUNTERS_DB, keys, chunk_size=10)
+        assert mock_pipeline.call_count == (len(keys) + 9) // 10
+        for key in ['COUNTERS_PORT_NAME_MAP', 'CRM:STATS']:
+            assert entries[key] == self.db.get_all(self.db.COUNTERS_DB, key)
+
+    def test_bulk_get_entries_scripted(self):
+        client = mock.MagicMock(spec=redis.Redis)
+        script = client.register_script.return_value
+        script.side_effect = [
+            [['f1', 'v1', 'f2', 'v2'], []],
+            [['f1', 'v3']]
+        ]
+        db = mock.MagicMock()
+        db.get_redis_client.return_value = client
+
+        entries = bulk_db.bulk_get_entries(db, 'COUNTERS_DB', ['k1', 'k2', 'k3'], chunk_size=2)
+
+        assert entries == {'k1': {'f1': 'v1', 'f2': 'v2'}, 'k3': {'f1': 'v3'}}
+        client.register_script.assert_called_once_with(bulk_db.BULK_READ_SCRIPT)
+        script.assert_has_calls([
+            mock.call(keys=['k1', 'k2'], args=[], client=client),
+            mock.call(keys=['k3'], args=[], client=client)
+        ])
+        client.pipeline.assert_not_called()
+
+    def test_bulk_get_entries_script_error(self):
+        client = mock.MagicMock(spec=redis.Redis)
+        client.register_script.return_value.side_effect = redis.exceptions.ResponseError('scripting disabled')
+        pipe = client.pipeline.return_value
+        pipe.execute.return_value = [['v1', None]]
+        db = mock.MagicMock()
+        db.get_redis_client.return_value = client
+
+        entries = bulk_db.bulk_get_entries(db, 'COUNTERS_DB', ['k1'], fields=['f1', 'f2'])
+
+        assert entries == {'k1': {'f1': 'v1'}}
+        pipe.hmget.assert_called_once_with('k1', ['f1', 'f2'])
+
+    @mock.patch('utilities_common.bulk_db.SonicDBConfig')
+    @mock.patch('utilities_common.bulk_db.redis.Redis')
+    def test_get_redis_client_swsscommon(self, mock_redis, mock_db_config):
+        db = mock.MagicMock()
+        db.namespace = 'asic0'
+        db.get_redis_client.return_value = object()
+        mock_db_config.getDbSock.return_value = '/var/run/redis0/redis.sock'
+        mock_db_config.getDbId.return_value = 2
+
+        client = bulk_db.get_redis_client(db, 'COUNTERS_DB')
+
+        assert client == mock_redis.return_value
+        mock_redis.assert_called_once_with(unix_socket_path='/var/run/redis0/redis.sock', db=2,
+                                           decode_responses=True)
+        mock_db_config.getDbSock.assert_called_once_with('COUNTERS_DB', 'asic0')
+        # Connection is cached per namespace and DB
+        assert bulk_db.get_redis_client(db, 'COUNTERS_DB') == client
+        assert mock_redis.call_count == 1
+        bulk_db._redis_clients.clear()
+
+
+class TestBulkSetEntries(object):
+    TABLE = 'TEST_BULK_TABLE'
+
+    def setup_method(self):
+        self.config_db = ConfigDBConnector()
+        self.config_db.connect()
+
+    def teardown_method(self):
+        self.config_db.delete_table(self.TABLE)
+
+    def test_bulk_set_entries(self):
+        current = {
+            ('DATAACL', 'RULE_1'): {'PRIORITY': '9999', 'PACKET_ACTION': 'DROP', 'SRC_IP': '10.0.0.1/32'},
+            ('DATAACL', 'RULE_2'): {'PRIORITY': '9998', 'PACKET_ACTION': 'DROP'}
+        }
+        for key, data in current.items():
+            self.config_db.set_entry(self.TABLE, key, data)
+
+        entries = {
+            ('DATAACL', 'RULE_1'): {'PRIORITY': '9999', 'PACKET_ACTION': 'FORWARD', 'DST_IP': '10.0.0.2/32'},
+            ('DATAACL', 'RULE_2'): None,
+            ('DATAACL', 'RULE_3'): {'PRIORITY': '9997', 'PACKET_ACTION': 'DROP', 'IN_PORTS': ['Ethernet0', 'Ethernet4']}
+        }
+        calls = bulk_db.bulk_set_entries(self.config_db, self.TABLE, entries, current=current, chunk_size=2)
+
+        assert calls == 2
+        # The stale SRC_IP of RULE_1 is removed as set_entry() does
+        assert self.config_db.get_table(self.TABLE) == {
+            ('DATAACL', 'RULE_1'): {'PRIORITY': '9999', 'PACKET_ACTION': 'FORWARD', 'DST_IP': '10.0.0.2/32'},
+            ('DATAACL', 'RULE_3'): {'PRIORITY': '9997', 'PACKET_ACTION': 'DROP', 'IN_PORTS': ['Ethernet0', 'Ethernet4']}
+        }
+
+
+class TestBulkDeleteTables(object):
+    def setup_method(self):
+        self.config_db = ConfigDBConnector()
+        self.config_db.connect()
+
+    def teardown_method(self):
+        for table in ['TEST_BULK_TABLE', 'TEST_BULK_TABLE_2', 'TEST_BULK_TABLE_KEEP']:
+            self.config_db.delete_table(table)
+
+    def test_bulk_delete_tables(self):
+        for i in range(5):
+            self.config_db.set_entry('TEST_BULK_TABLE', 'Ethernet{}'.format(i * 4), {'mtu': '9100'})
+        self.config_db.set_entry('TEST_BULK_TABLE_2', ('Ethernet0', '3-4'), {'profile': 'pg_lossless'})
+        self.config_db.set_entry('TEST_BULK_TABLE_KEEP', 'Ethernet0', {'mtu': '9100'})
+
+        calls = bulk_db.bulk_delete_tables(self.config_db, ['TEST_BULK_TABLE', 'TEST_BULK_TABLE_2', 'NO_SUCH_TABLE'],
+                                           chunk_size=4)
+
+        # One pipeline lists the keys, 6 keys are deleted in 2 chunks
+        assert calls == 3
+        assert self.config_db.get_table('TEST_BULK_TABLE') == {}
+        assert self.config_db.get_table('TEST_BULK_TABLE_2') == {}
+        assert self.config_db.get_table('TEST_BULK_TABLE_KEEP') == {'Ethernet0': {'mtu': '9100'}}
+
+
+class TestTableSnapshot(object):
+    def setup_method(self):
+        self.db = SonicV2Connector(host='127.0.0.1')
+        self.db.connect(self.db.APPL_DB)
+        self.db.connect(self.db.COUNTERS_DB)
+
+    def test_get(self):
+        snapshot = bulk_db.TableSnapshot(self.db)
+        with mock.patch.object(self.db, 'get', side_effect=AssertionError), \
+                mock.patch.object(self.db, 'get_all', side_effect=AssertionError):
+            assert snapshot.get(snapshot.APPL_DB, 'PORT_TABLE:Ethernet0', 'alias') == 'Ethernet0'
+            assert snapshot.get(snapshot.APPL_DB, 'PORT_TABLE:Ethernet0', 'no_such_field') is None
+            assert snapshot.get(snapshot.APPL_DB, 'PORT_TABLE:Ethernet1', 'alias') is None
+            assert snapshot.get_all(snapshot.COUNTERS_DB, 'CRM:ACL_TABLE_STATS:0x700000000063f') == \
+                CRM_ACL_TABLE_STATS['CRM:ACL_TABLE_STATS:0x700000000063f']
+            assert natsorted(snapshot.keys(snapshot.COUNTERS_DB, 'CRM:ACL_TABLE_STATS:*')) == \
+                natsorted(CRM_ACL_TABLE_STATS)
+            assert snapshot.keys(snapshot.APPL_DB, 'PORT_TABLE:Ethernet0') == ['PORT_TABLE:Ethernet0']
+
+        # KEYS and one bulk read per table
+        assert snapshot.round_trips == 4
+
+        # The returned entry is a copy
+        snapshot.get_all(snapshot.COUNTERS_DB, 'CRM:ACL_TABLE_STATS:0x700000000063f').clear()
+        assert snapshot.get_all(snapshot.COUNTERS_DB, 'CRM:ACL_TABLE_STATS:0x700000000063f')
+
+    def test_get_without_table(self):
+        snapshot = bulk_db.TableSnapshot(self.db)
+        assert snapshot.get_all(snapshot.COUNTERS_DB, 'COUNTERS_PORT_NAME_MAP') == \
+            self.db.get_all(self.db.COUNTERS_DB, 'COUNTERS_PORT_NAME_MAP')
+        assert snapshot.keys(snapshot.COUNTERS_DB, 'COUNTERS_*') == self.db.keys(self.db.COUNTERS_DB, 'COUNTERS_*')
+        assert snapshot.round_trips == 2
+        assert not snapshot.tables
+
+    def test_get_table(self):
+        config_db = ConfigDBConnector()
+        config_db.connect()
+        snapshot = bulk_db.TableSnapshot(config_db)
+        for table in ['PORT', 'VLAN_MEMBER', 'PORTCHANNEL']:
+            assert snapshot.get_table(table) == config_db.get_table(table)
+        assert snapshot.round_trips == 6
@@ -196,6 +196,66 @@ class TestConfigMgmt(TestCase):
 
         return
 
+    def test_config_key_index(self):
+        config = {
+            "PORT": {"Ethernet8": {"lanes": "8"}, "Ethernet80": {"lanes": "80"}},
+            "INTERFACE": {"Ethernet9|10.0.0.1/31": {}},
+            "VLAN_MEMBER": {"Vlan100|Ethernet8": {}, "Vlan100|Ethernet88": {}},
+            "ACL_TABLE": {"DATAACL": {"ports": ["Ethernet8", "Ethernet88"]}}
+        }
+        index = config_mgmt._configKeyIndex(config)
+        assert sorted(index["Ethernet8"]) == [
+            (("ACL_TABLE", "DATAACL", "ports"), "Ethernet8"),
+            (("PORT", "Ethernet8"), None),
+            (("VLAN_MEMBER", "Vlan100|Ethernet8"), None)]
+        assert index["Ethernet9"] == [(("INTERFACE", "Ethernet9|10.0.0.1/31"), None)]
+        assert "Ethernet800" not in index
+        return
+
+    def test_verify_asic_db(self):
+        curConfig = deepcopy(configDbJson)
+        self.writeJson(curConfig, config_mgmt.CONFIG_DB_JSON_FILE)
+        cmdpb = config_mgmt.ConfigMgmtDPB(source=config_mgmt.CONFIG_DB_JSON_FILE)
+        db = mock.MagicMock()
+        db.ASIC_DB = 'ASIC_DB'
+        db.get_dbid.return_value = 1
+        client = mock.MagicMock()
+        pipe = client.pipeline.return_value
+        # Ethernet4 is deleted first, Ethernet0 after one notification
+        pipe.execute.side_effect = [[1, 0], [0]]
+        keys = [cmdpb.oidKey + oid for oid in ['1000000000001', '1000000000002']]
+
+        with mock.patch.object(config_mgmt, 'get_redis_client', return_value=client):
+            assert cmdpb._verifyAsicDB(db=db, ports=['Ethernet0', 'Ethernet4'],
+                                       portMap={'Ethernet0': '1000000000001', 'Ethernet4': '1000000000002'},
+                                       timeout=60)
+
+        pubsub = client.pubsub.return_value
+        pubsub.subscribe.assert_called_once_with(*['__keyspace@1__:' + key for key in keys])
+        pubsub.get_message.assert_called_once_with(timeout=config_mgmt.ASIC_DB_POLL_INTERVAL)
+        pipe.exists.assert_has_calls([mock.call(keys[0]), mock.call(keys[1]), mock.call(keys[0])])
+        pubsub.close.assert_called_once_with()
+        return
+
+    def test_verify_asic_db_timeout(self):
+        curConfig = deepcopy(configDbJson)
+        self.writeJson(curConfig, config_mgmt.CONFIG_DB_JSON_FILE)
+        cmdpb = config_mgmt.ConfigMgmtDPB(source=config_mgmt.CONFIG_DB_JSON_FILE)
+        client = mock.MagicMock()
+        # keyspace notifications are not available, ASIC DB is polled
+        client.pubsub.side_effect = Exception('no pubsub')
+        client.pipeline.return_value.execute.return_value = [1]
+
+        with mock.patch.object(config_mgmt, 'get_redis_client', return_value=client), \
+                mock.patch.object(config_mgmt, 'tsleep') as mock_sleep, \
+                mock.patch.object(config_mgmt, 'monotonic', side_effect=[0, 0, 1, 2]):
+            with pytest.raises(Exception, match='Ports are present in ASIC DB after 2 secs'):
+                cmdpb._verifyAsicDB(db=mock.MagicMock(), ports=['Ethernet0'],
+                                    portMap={'Ethernet0': '1000000000001'}, timeout=2)
+
+        assert mock_sleep.call_args_list == [mock.call(1), mock.call(1)]
+        return
+
     def tearDown(self):
         try:
             os.remove(config_mgmt.CONFIG_DB_JSON_FILE)
@@ -296,6 +296,48 @@ config_temp = {
         }
     }
 
+save_config_parallel_data = {
+    multi_asic.DEFAULT_NAMESPACE: {
+        "VLAN_MEMBER": {
+            ("Vlan1000", "Ethernet0"): {"tagging_mode": "untagged"}
+        },
+        "PORT": {
+            "Ethernet8": {"admin_status": "down", "speed": "40000"},
+            "Ethernet0": {"admin_status": "up", "speed": "100000"}
+        },
+        "DEVICE_METADATA": {
+            "localhost": {"hostname": "sonic", "mac": "02:42:f0:7f:01:05"}
+        }
+    },
+    "asic0": {
+        "PORT": {
+            "Ethernet16": {"asic_port_name": "Eth4-ASIC0"},
+            "Ethernet4": {"asic_port_name": "Eth1-ASIC0"}
+        },
+        "DEVICE_METADATA": {
+            "localhost": {"asic_name": "asic0", "hostname": "sonic"}
+        }
+    },
+    "asic1": {
+        "PORT": {
+            "Ethernet64": {"asic_port_name": "Eth0-ASIC1"}
+        },
+        "DEVICE_METADATA": {
+            "localhost": {"asic_name": "asic1", "hostname": "sonic"}
+        }
+    }
+}
+
+save_config_parallel_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), "config_save_output", "parallel")
+
+
+def mock_config_db_pipe_connector(use_unix_socket_path=False, namespace=multi_asic.DEFAULT_NAMESPACE):
+    """ConfigDBPipeConnector of a namespace whose config is in save_config_parallel_data"""
+    config_db = mock.MagicMock()
+    config_db.get_config.return_value = copy.deepcopy(save_config_parallel_data[namespace])
+    return config_db
+
+
 def mock_run_command_side_effect(*args, **kwargs):
     command = args[0]
     if isinstance(command, str):
@@ -489,6 +531,38 @@ class TestConfigSave(object):
             assert result.exit_code == 0
             assert "\n".join([li.rstrip() for li in result.output.split('\n')]) == save_config_filename_output
 
+    @mock.patch('config.main.ConfigDBPipeConnector', mock.MagicMock(side_effect=mock_config_db_pipe_connector))
+    def test_config_save_parallel(self, get_cmd_module, setup_single_broadcom_asic, tmp_path):
+        (config, show) = get_cmd_module
+        runner = CliRunner()
+        output_file = str(tmp_path / "config_db.json")
+        expected_result = os.path.join(save_config_parallel_dir, "config_db.json")
+
+        result = runner.invoke(config.config.commands["save"], ["-y", "-p", output_file])
+
+        print(result.exit_code)
+        print(result.output)
+        traceback.print_tb(result.exc_info[2])
+        assert result.exit_code == 0
+        assert result.output == "Saved localhost config to {}\n".format(output_file)
+        assert filecmp.cmp(output_file, expected_result, shallow=False)
+
+        # The file is not rewritten if the config is unchanged
+        inode = os.stat(output_file).st_ino
+        result = runner.invoke(config.config.commands["save"], ["-y", "-p", output_file])
+        assert result.exit_code == 0
+        assert result.output == "Config of localhost is unchanged, {} is not written\n".format(output_file)
+        assert os.stat(output_file).st_ino == inode
+
+        # The changed file is replaced
+        with open(output_file, 'w') as f:
+            f.write("{}")
+        result = runner.invoke(config.config.commands["save"], ["-y", "-p", output_file])
+        assert result.exit_code == 0
+        assert result.output == "Saved localhost config to {}\n".format(output_file)
+        assert filecmp.cmp(output_file, expected_result, shallow=False)
+        assert os.listdir(str(tmp_path)) == ["config_db.json"]
+
     @classmethod
     def teardown_class(cls):
         print("TEARDOWN")
@@ -605,6 +679,48 @@ class TestConfigSaveMasic(object):
             )
             assert filecmp.cmp(output_file, expected_result, shallow=False)
 
+    @mock.patch('config.main.ConfigDBPipeConnector', mock.MagicMock(side_effect=mock_config_db_pipe_connector))
+    def test_config_save_parallel_masic(self, tmp_path):
+        file_names = ["config_db.json", "config_db0.json", "config_db1.json"]
+        output_files = [str(tmp_path / file_name) for file_name in file_names]
+        runner = CliRunner()
+
+        result = runner.invoke(config.config.commands["save"], ["-y", "-p", ",".join(output_files)])
+
+        print(result.exit_code)
+        print(result.output)
+        traceback.print_tb(result.exc_info[2])
+        assert result.exit_code == 0
+        assert result.output.splitlines() == [
+            "Saved {} config to {}".format(name, output_file)
+            for name, output_file in zip(['localhost', 'asic0', 'asic1'], output_files)
+        ]
+        for file_name, output_file in zip(file_names, output_files):
+            assert filecmp.cmp(output_file, os.path.join(save_config_parallel_dir, file_name), shallow=False)
+
+    @mock.patch('config.main.ConfigDBPipeConnector', mock.MagicMock(side_effect=mock_config_db_pipe_connector))
+    def test_config_save_parallel_onefile_masic(self, tmp_path):
+        output_file = str(tmp_path / "all_config_db.json")
+        expected_result = os.path.join(save_config_parallel_dir, "all_config_db.json")
+        runner = CliRunner()
+
+        result = runner.invoke(config.config.commands["save"], ["-y", "-p", output_file])
+
+        print(result.exit_code)
+        print(result.output)
+        traceback.print_tb(result.exc_info[2])
+        assert result.exit_code == 0
+        assert result.output == "Integrate each ASIC's config into a single JSON file {}.\n".format(output_file)
+        assert filecmp.cmp(output_file, expected_result, shallow=False)
+
+        # The file is not rewritten if the config is unchanged
+        inode = os.stat(output_file).st_ino
+        result = runner.invoke(config.config.commands["save"], ["-y", "-p", output_file])
+        assert result.exit_code == 0
+        assert result.output.splitlines()[-1] == "Config is unchanged, {} is not written".format(output_file)
+        assert os.stat(output_file).st_ino == inode
+        assert os.listdir(str(tmp_path)) == ["all_config_db.json"]
+
     @classmethod
     def teardown_class(cls):
         print("TEARDOWN")
@@ -1405,6 +1521,221 @@ class TestReloadConfig(object):
             assert "\n".join([l.rstrip() for l in result.output.split('\n')]) \
                 == RELOAD_CONFIG_DB_OUTPUT.format(config.SYSTEM_RELOAD_LOCK)
 
+    def test_reload_config_parallel(self, get_cmd_module, setup_single_broadcom_asic):
+        self.add_sysinfo_to_cfg_file()
+        with mock.patch(
+                "utilities_common.cli.run_command",
+                mock.MagicMock(side_effect=mock_run_command_side_effect)
+        ), mock.patch("config.main.ConfigDBPipeConnector") as mock_pipe_connector:
+            (config, show) = get_cmd_module
+            runner = CliRunner()
+
+            result = runner.invoke(
+                config.config.commands["reload"],
+                [self.dummy_cfg_file, '-y', '-f', '-p'])
+
+            print(result.exit_code)
+            print(result.output)
+            traceback.print_tb(result.exc_info[2])
+            assert result.exit_code == 0
+            # The config is written in-process instead of by sonic-cfggen
+            assert 'sonic-cfggen' not in result.output
+            mock_pipe_connector.return_value.mod_config.assert_called_once_with({
+                "DEVICE_METADATA": {
+                    "localhost": {
+                        "platform": "some_platform",
+                        "mac": "02:42:f0:7f:01:05"
+                    }
+                }
+            })
+            assert 'Config reload stage timings (seconds):\n  localhost: load ' in result.output
+
+    def test_reload_config_parallel_invalid_input(self, get_cmd_module, setup_single_broadcom_asic):
+        with open(self.dummy_cfg_file, 'w') as f:
+            f.write("[]")
+        with mock.patch(
+                "utilities_common.cli.run_command",
+                mock.MagicMock(side_effect=mock_run_command_side_effect)
+        ):
+            (config, show) = get_cmd_module
+            runner = CliRunner()
+
+            result = runner.invoke(
+                config.config.commands["reload"],
+                [self.dummy_cfg_file, '-y', '-f', '-p'])
+
+            print(result.exit_code)
+            print(result.output)
+            assert result.exit_code != 0
+            # The services are not stopped when the config can't be loaded
+            assert 'Failed to load the config of localhost' in result.output
+            assert 'Stopping SONiC target' not in result.output
+
+    reload_init_cfg = {
+        "DEVICE_METADATA": {"localhost": {"hostname": "init_cfg", "type": "ToRRouter"}},
+        "FEATURE": {"swss": {"state": "enabled", "auto_restart": "enabled"}}
+    }
+
+    reload_input = {
+        "localhost": {
+            "DEVICE_METADATA": {
+                "localhost": {"hostname": "sonic", "hwsku": "some_hwsku", "mac": "02:42:f0:7f:01:05",
+                              "platform": "some_platform"}
+            },
+            "FEATURE": {"swss": {"state": "disabled"}},
+            "VLAN_MEMBER": {"Vlan1000|Ethernet0": {"tagging_mode": "untagged"}}
+        },
+        "asic0": {
+            "DEVICE_METADATA": {
+                "localhost": {"asic_name": "asic0", "hwsku": "some_hwsku", "mac": "02:42:f0:7f:01:05",
+                              "platform": "some_platform"}
+            },
+            "PORT": {"Ethernet0": {"lanes": "0,1", "asic_port_name": "Eth0-ASIC0"}},
+            "BGP_INTERNAL_NEIGHBOR": {"10.0.0.1": {"asn": "65100"}}
+        },
+        "asic1": {
+            "DEVICE_METADATA": {
+                "localhost": {"asic_name": "asic1", "hwsku": "some_hwsku", "mac": "02:42:f0:7f:01:05",
+                              "platform": "some_platform"}
+            },
+            "PORT": {"Ethernet64": {"lanes": "64,65", "asic_port_name": "Eth0-ASIC1"}},
+            "PORTCHANNEL_MEMBER": {"PortChannel0002|Ethernet64": {}}
+        }
+    }
+
+    def get_reloaded_config(self, config, args):
+        """
+        Config written to CONFIG_DB of each namespace by 'config reload <args>'. The
+        sonic-cfggen commands writing config files to the DB are run in-process.
+        """
+        written = {}
+
+        class MockConfigDBPipeConnector(object):
+            INIT_INDICATOR = "CONFIG_DB_INITIALIZED"
+
+            def __init__(self, use_unix_socket_path=False, namespace=multi_asic.DEFAULT_NAMESPACE):
+                self.namespace = namespace
+
+            def connect(self, wait_for_init=True, retry_on=False):
+                pass
+
+            def mod_config(self, data):
+                written.setdefault(self.namespace, []).append(copy.deepcopy(data))
+
+        def run_command_side_effect(command, *args, **kwargs):
+            if command[0] == config.SONIC_CFGGEN_PATH and '-j' in command and command[-1] == '--write-to-db':
+                # As 'sonic-cfggen -j <file>... [-n <namespace>] --write-to-db' does
+                data = {}
+                for opt, value in zip(command, command[1:]):
+                    if opt == '-j':
+                        with open(value) as f:
+                            sonic_cfggen.deep_update(data, sonic_cfggen.FormatConverter.to_deserialized(json.load(f)))
+                namespace = command[command.index('-n') + 1] if '-n' in command else multi_asic.DEFAULT_NAMESPACE
+                MockConfigDBPipeConnector(namespace=namespace).mod_config(
+                    sonic_cfggen.FormatConverter.output_to_db(data))
+            return mock_run_command_side_effect(command, *args, **kwargs)
+
+        with mock.patch("utilities_common.cli.run_command", mock.MagicMock(side_effect=run_command_side_effect)), \
+                mock.patch("config.main.ConfigDBPipeConnector", MockConfigDBPipeConnector), \
+                mock.patch("config.main.config_file_yang_validation"), \
+                mock.patch("sonic_py_common.multi_asic.get_namespace_list", return_value=["asic0", "asic1"]):
+            runner = CliRunner()
+            result = runner.invoke(config.config.commands["reload"], args)
+
+            print(result.exit_code)
+            print(result.output)
+            traceback.print_tb(result.exc_info[2])
+            assert result.exit_code == 0
+        return written
+
+    def write_reload_input(self, tmp_path, names):
+        files = []
+        for name in names:
+            files.append(str(tmp_path / "config_{}.json".format(name)))
+            with open(files[-1], 'w') as f:
+                json.dump(self.reload_input[name], f)
+        return files
+
+    def test_reload_config_parallel_init_cfg(self, get_cmd_module, setup_single_broadcom_asic, tmp_path):
+        (config, show) = get_cmd_module
+        init_cfg_file = str(tmp_path / "init_cfg.json")
+        with open(init_cfg_file, 'w') as f:
+            json.dump(self.reload_init_cfg, f)
+        cfg_file, = self.write_reload_input(tmp_path, ["localhost"])
+
+        with mock.patch.object(config, "INIT_CFG_FILE", init_cfg_file):
+            sequential = self.get_reloaded_config(config, [cfg_file, '-y', '-f'])
+            parallel = self.get_reloaded_config(config, [cfg_file, '-y', '-f', '-p'])
+
+        # The config file is merged into init_cfg.json
+        assert sequential == {
+            multi_asic.DEFAULT_NAMESPACE: [{
+                "DEVICE_METADATA": {
+                    "localhost": {"hostname": "sonic", "hwsku": "some_hwsku", "mac": "02:42:f0:7f:01:05",
+                                  "platform": "some_platform", "type": "ToRRouter"}
+                },
+                "FEATURE": {"swss": {"state": "disabled", "auto_restart": "enabled"}},
+                "VLAN_MEMBER": {("Vlan1000", "Ethernet0"): {"tagging_mode": "untagged"}}
+            }]
+        }
+        assert parallel == sequential
+
+    def test_reload_config_parallel_masic(self, get_cmd_module, setup_multi_broadcom_masic, tmp_path):
+        (config, show) = get_cmd_module
+        init_cfg_file = str(tmp_path / "init_cfg.json")
+        with open(init_cfg_file, 'w') as f:
+            json.dump(self.reload_init_cfg, f)
+        cfg_files = ",".join(self.write_reload_input(tmp_path, ["localhost", "asic0", "asic1"]))
+
+        with mock.patch.object(config, "INIT_CFG_FILE", init_cfg_file):
+            sequential = self.get_reloaded_config(config, [cfg_files, '-y', '-f'])
+            parallel = self.get_reloaded_config(config, [cfg_files, '-y', '-f', '-p'])
+
+        assert sorted(sequential) == [multi_asic.DEFAULT_NAMESPACE, "asic0", "asic1"]
+        assert sequential["asic1"] == [{
+            "DEVICE_METADATA": {
+                "localhost": {"asic_name": "asic1", "hostname": "init_cfg", "hwsku": "some_hwsku",
+                              "mac": "02:42:f0:7f:01:05", "platform": "some_platform", "type": "ToRRouter"}
+            },
+            "FEATURE": {"swss": {"state": "enabled", "auto_restart": "enabled"}},
+            "PORT": {"Ethernet64": {"lanes": "64,65", "asic_port_name": "Eth0-ASIC1"}},
+            "PORTCHANNEL_MEMBER": {("PortChannel0002", "Ethernet64"): {}}
+        }]
+        assert parallel == sequential
+
+    def test_reload_config_parallel_masic_single_file(self, get_cmd_module, setup_multi_broadcom_masic, tmp_path):
+        (config, show) = get_cmd_module
+        cfg_file = str(tmp_path / "all_config_db.json")
+        with open(cfg_file, 'w') as f:
+            json.dump(self.reload_input, f)
+
+        sequential = self.get_reloaded_config(config, [cfg_file, '-y', '-f'])
+        parallel = self.get_reloaded_config(config, [cfg_file, '-y', '-f', '-p'])
+
+        assert sorted(sequential) == [multi_asic.DEFAULT_NAMESPACE, "asic0", "asic1"]
+        assert sequential["asic0"] == [{
+            "DEVICE_METADATA": {
+                "localhost": {"asic_name": "asic0", "hwsku": "some_hwsku", "mac": "02:42:f0:7f:01:05",
+                              "platform": "some_platform"}
+            },
+            "PORT": {"Ethernet0": {"lanes": "0,1", "asic_port_name": "Eth0-ASIC0"}},
+            "BGP_INTERNAL_NEIGHBOR": {"10.0.0.1": {"asn": "65100"}}
+        }]
+        assert parallel == sequential
+
+    def test_reload_config_parallel_write_failure(self, tmp_path):
+        tmp_file = tmp_path / "_configReloadStdin"
+        tmp_file.write_text("{}")
+        failed = mock.MagicMock(file=str(tmp_file))
+        failed.write.side_effect = Exception("load failed")
+
+        with mock.patch("config.main.delete_transceiver_tables"):
+            with pytest.raises(Exception, match="load failed"):
+                config.reload_namespaces_parallel([failed])
+
+        # The tmpfile is removed even if the config of a namespace fails to load
+        assert not tmp_file.exists()
+
     def test_reload_config_lock_failure(self, get_cmd_module, setup_single_broadcom_asic):
         self.add_sysinfo_to_cfg_file()
         with mock.patch(
@@ -1728,6 +2059,54 @@ class TestConfigQos(object):
         mock_wait_until_clear.assert_called_once()
         assert status is False
 
+    @mock.patch('config.main._wait_until_clear')
+    def test_clear_qos_bulk_delete(self, mock_wait_until_clear):
+        from config.main import _clear_qos
+        from utilities_common.bulk_db import bulk_delete_tables
+
+        with mock.patch('config.main.bulk_delete_tables', wraps=bulk_delete_tables) as mock_bulk_delete:
+            assert _clear_qos(False, False)
+
+        # All the QoS tables of the namespace are deleted by one call
+        mock_bulk_delete.assert_called_once()
+        tables = mock_bulk_delete.call_args[0][1]
+        assert 'BUFFER_POOL' in tables and 'PORT_QOS_MAP' in tables
+        config_db = Db().cfgdb
+        for table in tables:
+            assert not config_db.get_table(table)
+
+    def test_qos_write_rendered_config(self, tmp_path):
+        from config.main import _write_rendered_config
+        buffer_file = os.path.join(str(tmp_path), 'cfg_buffer.json')
+        qos_file = os.path.join(str(tmp_path), 'cfg_qos.json')
+        with open(buffer_file, 'w') as f:
+            json.dump({
+                'BUFFER_POOL': {'ingress_lossless_pool': {'size': '1000'}},
+                'BUFFER_PG': {'Ethernet0|3-4': {'profile': 'pg_lossless_profile'}}
+            }, f)
+        with open(qos_file, 'w') as f:
+            json.dump({
+                'BUFFER_POOL': {'ingress_lossless_pool': {'type': 'ingress'}},
+                'PORT_QOS_MAP': {'Ethernet0': {'pfc_enable': '3,4'}}
+            }, f)
+
+        dry_run_file = os.path.join(str(tmp_path), 'qos_config_output.json')
+        _write_rendered_config(config.DEFAULT_NAMESPACE, [buffer_file, qos_file], dry_run_file)
+        with open(dry_run_file) as f:
+            assert json.load(f) == {
+                'BUFFER_PG': {'Ethernet0|3-4': {'profile': 'pg_lossless_profile'}},
+                'BUFFER_POOL': {'ingress_lossless_pool': {'size': '1000', 'type': 'ingress'}},
+                'PORT_QOS_MAP': {'Ethernet0': {'pfc_enable': '3,4'}}
+            }
+
+        with mock.patch('config.main.ConfigDBPipeConnector') as mock_config_db:
+            _write_rendered_config(config.DEFAULT_NAMESPACE, [buffer_file, qos_file])
+        mock_config_db.return_value.mod_config.assert_called_once_with({
+            'BUFFER_PG': {('Ethernet0', '3-4'): {'profile': 'pg_lossless_profile'}},
+            'BUFFER_POOL': {'ingress_lossless_pool': {'size': '1000', 'type': 'ingress'}},
+            'PORT_QOS_MAP': {'Ethernet0': {'pfc_enable': '3,4'}}
+        })
+
     @patch('config.main._wait_until_clear')
     def test_qos_reload_not_empty_should_exit(self, mock_wait_until_clear):
         mock_wait_until_clear.return_value = False
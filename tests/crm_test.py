@@ -2,6 +2,7 @@ import importlib
 import os
 import sys
 from importlib import reload
+from unittest import mock
 
 from click.testing import CliRunner
 import crm.main as crm
@@ -1351,6 +1352,16 @@ class TestCrm(object):
         assert result.exit_code == 0
         assert result.output == crm_show_resources_all
 
+    def test_crm_show_resources_all_snapshot(self):
+        runner = CliRunner()
+        with mock.patch('crm.main.bulk_get_all', wraps=crm.bulk_get_all) as mock_bulk_get_all:
+            result = runner.invoke(crm.cli, ['show', 'resources', 'all'])
+        assert result.exit_code == 0
+        assert result.output == crm_show_resources_all
+        # All the views are built from one read of the CRM stats
+        assert mock_bulk_get_all.call_count == 1
+        assert mock_bulk_get_all.call_args[0][2] == 'CRM:*'
+
     def test_crm_show_resources_fdb(self):
         runner = CliRunner()
         result = runner.invoke(crm.cli, ['show', 'resources', 'fdb'])
@@ -1922,6 +1933,14 @@ class TestCrmMultiAsic(object):
         assert result.exit_code == 0
         assert result.output == crm_multi_asic_show_resources_srv6_nexthop
 
+    def test_crm_multi_asic_show_resources_all_snapshot(self):
+        runner = CliRunner()
+        with mock.patch('crm.main.bulk_get_all', wraps=crm.bulk_get_all) as mock_bulk_get_all:
+            result = runner.invoke(crm.cli, ['show', 'resources', 'all'])
+        assert result.exit_code == 0
+        assert result.output == crm_multi_asic_show_resources_all
+        # The CRM stats are read once per namespace
+        assert mock_bulk_get_all.call_count == 2
 
     @classmethod
     def teardown_class(cls):
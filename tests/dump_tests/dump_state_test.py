@@ -218,6 +218,29 @@ class TestDumpState:
         ddiff = DeepDiff(set(expected_entries), set(rec_json.keys()))
         assert not ddiff, "Expected Entries were not recieved when passing all keyword"
 
+    def test_identifier_all_prefetch(self, match_engine):
+        runner = CliRunner()
+        ports = ["Ethernet0", "Ethernet4", "Ethernet156", "Ethernet160", "Ethernet164", "Ethernet176", "Ethernet60"]
+        expected = runner.invoke(dump.state, ["port", ",".join(ports)], obj=match_engine)
+        assert expected.exit_code == 0, "exit code: {}, Exception: {}, Traceback: {}".format(
+            expected.exit_code, expected.exception, expected.exc_info)
+        for args in [[], ["--workers", "4"]]:
+            result = runner.invoke(dump.state, ["port", "all"] + args, obj=match_engine)
+            assert result.exit_code == 0, "exit code: {}, Exception: {}, Traceback: {}".format(
+                result.exit_code, result.exception, result.exc_info)
+            ddiff = DeepDiff(json.loads(expected.output), json.loads(result.output))
+            assert not ddiff, ddiff
+
+    def test_identifier_all_timing(self, match_engine):
+        runner = CliRunner()
+        with mock.patch("dump.main.print_dump"):
+            result = runner.invoke(dump.state, ["port", "all", "--key-map", "--timing"], obj=match_engine)
+        assert result.exit_code == 0, "exit code: {}, Exception: {}, Traceback: {}".format(
+            result.exit_code, result.exception, result.exc_info)
+        lines = result.output.splitlines()
+        assert lines[0] == "Module: port"
+        assert [line.split()[0] for line in lines[3:]] == ["prefetch", "execute", "populate"]
+
     def test_namespace_single_asic(self, match_engine):
         runner = CliRunner()
         result = runner.invoke(dump.state, ["port", "Ethernet0", "--table", "--key-map", "--namespace", "asic0"], obj=match_engine)
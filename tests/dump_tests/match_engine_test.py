@@ -2,10 +2,11 @@ import os
 import sys
 import unittest
 import pytest
-from dump.match_infra import MatchEngine, EXCEP_DICT, MatchRequest, MatchRequestOptimizer, ConnectionPool, CONN
+from dump.match_infra import MatchEngine, EXCEP_DICT, MatchRequest, MatchRequestOptimizer, ConnectionPool, CONN, \
+    PrefetchMatchEngine
 from utilities_common.constants import DEFAULT_NAMESPACE
 from dump.helper import populate_mock
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 from deepdiff import DeepDiff
 from importlib import reload
 
@@ -303,3 +304,111 @@ class TestMatchEngineOptimizer:
         # missing filed should not cause an excpetion in the optimizer
         assert "whatever" in ret["return_values"]["COPP_GROUP|queue4_group2"]
         assert not  ret["return_values"]["COPP_GROUP|queue4_group2"]["whatever"]
+
+    def test_pattern_caching(self):
+        rv = [{"COPP_GROUP|queue4_group1": {"trap_action": "trap", "trap_priority": "4", "queue": "4"}},
+              {"COPP_GROUP|queue4_group2": {"trap_action": "copy", "trap_priority": "4", "queue": "4",
+                                            "red_action": "drop"}}]
+        template = {"error": "", "keys": rv, "return_values": {}}
+        m_engine = MatchEngine()
+        m_engine.fetch = MagicMock(return_value=template)
+        m_engine_optim = MatchRequestOptimizer(m_engine)
+
+        req = MatchRequest(db="CONFIG_DB", table="COPP_GROUP", key_pattern="queue4*", field="trap_action", value="trap")
+        ret = m_engine_optim.fetch(req)
+        assert ret["keys"] == ["COPP_GROUP|queue4_group1"]
+
+        # The same pattern with a different filter and return fields is served from the cache
+        req = MatchRequest(db="CONFIG_DB", table="COPP_GROUP", key_pattern="queue4*", field="trap_priority", value="4",
+                           return_fields=["trap_action"])
+        ret = m_engine_optim.fetch(req)
+        assert ret["keys"] == ["COPP_GROUP|queue4_group1", "COPP_GROUP|queue4_group2"]
+        assert ret["return_values"] == {"COPP_GROUP|queue4_group1": {"trap_action": "trap"},
+                                        "COPP_GROUP|queue4_group2": {"trap_action": "copy"}}
+
+        req = MatchRequest(db="CONFIG_DB", table="COPP_GROUP", key_pattern="queue4*", just_keys=False)
+        ret = m_engine_optim.fetch(req)
+        assert ret["keys"] == rv
+
+        req = MatchRequest(db="CONFIG_DB", table="COPP_GROUP", key_pattern="queue4*", field="red_action",
+                           value="forward")
+        ret = m_engine_optim.fetch(req)
+        assert ret["error"] == EXCEP_DICT["NO_ENTRIES"]
+
+        assert m_engine.fetch.call_count == 1
+        # The whole pattern is fetched without any filter
+        fetched_req = m_engine.fetch.call_args[0][0]
+        assert not fetched_req.just_keys and not fetched_req.field and not fetched_req.return_fields
+
+    @patch("dump.match_infra.multi_asic.get_namespace_list", MagicMock(return_value=["asic0", "asic1"]))
+    def test_cache_per_source(self):
+        rv = [{"PORT|Ethernet0": {"alias": "etp1"}}, {"PORT|Ethernet4": {"alias": "etp2"}}]
+        template = {"error": "", "keys": rv, "return_values": {}}
+        m_engine = MatchEngine()
+        m_engine.fetch = MagicMock(return_value=template)
+        m_engine_optim = MatchRequestOptimizer(m_engine)
+
+        req = MatchRequest(db="CONFIG_DB", table="PORT", key_pattern="*", ns="asic0")
+        m_engine_optim.fetch(req)
+        # The keys fetched for asic0 don't answer the same key of another namespace or db
+        req = MatchRequest(db="CONFIG_DB", table="PORT", key_pattern="Ethernet0", ns="asic1")
+        m_engine_optim.fetch(req)
+        req = MatchRequest(db="STATE_DB", table="PORT", key_pattern="Ethernet0", ns="asic0")
+        m_engine_optim.fetch(req)
+        assert m_engine.fetch.call_count == 3
+
+        req = MatchRequest(db="CONFIG_DB", table="PORT", key_pattern="Ethernet4", ns="asic0")
+        ret = m_engine_optim.fetch(req)
+        assert ret["keys"] == ["PORT|Ethernet4"]
+        assert m_engine.fetch.call_count == 3
+
+    def test_no_matches_cached(self):
+        template = {"error": EXCEP_DICT["NO_MATCHES"], "keys": [], "return_values": {}}
+        m_engine = MatchEngine()
+        m_engine.fetch = MagicMock(return_value=template)
+        m_engine_optim = MatchRequestOptimizer(m_engine)
+        for _ in range(2):
+            req = MatchRequest(db="CONFIG_DB", table="COPP_GROUP", key_pattern="queue5*")
+            ret = m_engine_optim.fetch(req)
+            assert ret["error"] == EXCEP_DICT["NO_MATCHES"]
+        assert m_engine.fetch.call_count == 1
+
+    def test_connection_error_not_cached(self):
+        template = {"error": EXCEP_DICT["CONN_ERR"], "keys": [], "return_values": {}}
+        m_engine = MatchEngine()
+        m_engine.fetch = MagicMock(return_value=template)
+        m_engine_optim = MatchRequestOptimizer(m_engine)
+        for _ in range(2):
+            req = MatchRequest(db="CONFIG_DB", table="COPP_GROUP", key_pattern="queue5*")
+            ret = m_engine_optim.fetch(req)
+            assert ret["error"] == EXCEP_DICT["CONN_ERR"]
+        assert m_engine.fetch.call_count == 2
+
+
+class TestPrefetchMatchEngine:
+
+    def test_prefetch(self, match_engine):
+        prefetch_engine = PrefetchMatchEngine(match_engine.conn_pool)
+        num_keys = prefetch_engine.prefetch(DEFAULT_NAMESPACE,
+                                            [("STATE_DB", "VXLAN_TUNNEL_TABLE"), ("CONFIG_DB", "PORT")])
+        assert num_keys > 0
+        reqs = [
+            MatchRequest(db="STATE_DB", table="VXLAN_TUNNEL_TABLE", key_pattern="EVPN_25.25.25.2*", field="operstatus",
+                         value="down", return_fields=["src_ip"]),
+            MatchRequest(db="STATE_DB", table="VXLAN_TUNNEL_TABLE", key_pattern="EVPN_25.25.25.25", just_keys=False),
+            MatchRequest(db="CONFIG_DB", table="PORT", key_pattern="*", field="lanes", value="61,62,63,64",
+                         match_entire_list=True),
+            MatchRequest(db="CONFIG_DB", table="PORT", key_pattern="Ethernet10[^0-9]*"),
+            # Not prefetched, read from redis
+            MatchRequest(db="CONFIG_DB", table="SFLOW", key_pattern="global", just_keys=False),
+        ]
+        for req in reqs:
+            ret = prefetch_engine.fetch(req)
+            exp_ret = match_engine.fetch(req)
+            assert sorted(ret["keys"], key=str) == sorted(exp_ret["keys"], key=str)
+            assert ret["return_values"] == exp_ret["return_values"]
+            assert ret["error"] == exp_ret["error"]
+
+        assert prefetch_engine.get_entry("CONFIG_DB", "SFLOW|global", DEFAULT_NAMESPACE) is None
+        entry = prefetch_engine.get_entry("STATE_DB", "VXLAN_TUNNEL_TABLE|EVPN_25.25.25.25", DEFAULT_NAMESPACE)
+        assert entry["src_ip"] == "1.1.1.1"
@@ -33,3 +33,21 @@ class RedisMock():
         kp = match.replace("[^", "[!")
         kys = fnmatch.filter(self.data.keys(), kp)
         return [ky.encode() for ky in kys]
+
+    def pipeline(self, transaction=True):
+        return PipelineMock(self)
+
+
+class PipelineMock():
+
+    def __init__(self, redis_mock):
+        self.redis_mock = redis_mock
+        self.commands = []
+
+    def hgetall(self, key):
+        self.commands.append(key)
+
+    def execute(self):
+        results = [self.redis_mock.hgetall(key) for key in self.commands]
+        self.commands = []
+        return results
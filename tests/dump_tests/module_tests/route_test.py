@@ -6,7 +6,7 @@ from deepdiff import DeepDiff
 from mock import patch
 from dump.helper import create_template_dict, populate_mock
 from dump.plugins.route import Route
-from dump.match_infra import MatchEngine, ConnectionPool
+from dump.match_infra import MatchEngine, ConnectionPool, PrefetchMatchEngine
 from swsscommon.swsscommon import SonicV2Connector
 from utilities_common.constants import DEFAULT_NAMESPACE
 
@@ -310,3 +310,16 @@ class TestRouteModule:
                   "fe80::/64", "20c0:e6e0:0:80::/64", "192.168.0.4/24", "10.1.1.16/16", "10.0.0.16/16"]
         ddiff = DeepDiff(expect, returned, ignore_order=True)
         assert not ddiff, ddiff
+
+    def test_all_args_prefetch(self, match_engine):
+        """
+        Scenario: The routes dumped from the prefetched tables match the ones read from redis
+        """
+        prefetch_engine = PrefetchMatchEngine(match_engine.conn_pool)
+        assert prefetch_engine.prefetch(DEFAULT_NAMESPACE, Route.PREFETCH_TABLES) > 0
+        for dest in Route(match_engine).get_all_args(""):
+            params = {Route.ARG_NAME: dest, "namespace": ""}
+            expect = Route(match_engine).execute(params)
+            returned = Route(prefetch_engine).execute(params)
+            ddiff = DeepDiff(returned, expect, ignore_order=True)
+            assert not ddiff, ddiff
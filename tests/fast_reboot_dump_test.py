@@ -1,5 +1,7 @@
 import json
 import os
+import time
+from unittest import mock
 from deepdiff import DeepDiff
 from utilities_common.db import Db
 import importlib
@@ -37,6 +39,62 @@ class TestFastRebootDump(object):
         expectd_map_mac_ip_per_vlan = {'Vlan2': {'52:54:00:5d:fc:b7': 'PortChannel0001'}}
         assert not DeepDiff(map_mac_ip_per_vlan, expectd_map_mac_ip_per_vlan, ignore_order=True)
     
+    # Test fast-reboot-dump script to dump FDB and neighbor entries at scale with a constant number of
+    # DB scans.
+    def test_generate_fdb_and_neighbor_entries_scale(self, tmp_path):
+        num_vlans = 64
+        num_ports = 32
+        macs_per_vlan = 1000
+        neighbors_per_vlan = 250
+
+        asic_db = Db().db
+        app_db = Db().db
+        asic_client = asic_db.get_redis_client(asic_db.ASIC_DB)
+        app_client = app_db.get_redis_client(app_db.APPL_DB)
+
+        for port in range(num_ports):
+            hostif_key = 'ASIC_STATE:SAI_OBJECT_TYPE_HOSTIF:oid:0xd0000000%05x' % port
+            bridge_port_key = 'ASIC_STATE:SAI_OBJECT_TYPE_BRIDGE_PORT:oid:0x3a000000%05x' % port
+            asic_client.hset(hostif_key, 'SAI_HOSTIF_ATTR_TYPE', 'SAI_HOSTIF_TYPE_NETDEV')
+            asic_client.hset(hostif_key, 'SAI_HOSTIF_ATTR_OBJ_ID', 'oid:0x10000000%05x' % port)
+            asic_client.hset(hostif_key, 'SAI_HOSTIF_ATTR_NAME', 'Ethernet%d' % (port * 4))
+            asic_client.hset(bridge_port_key, 'SAI_BRIDGE_PORT_ATTR_TYPE', 'SAI_BRIDGE_PORT_TYPE_PORT')
+            asic_client.hset(bridge_port_key, 'SAI_BRIDGE_PORT_ATTR_PORT_ID', 'oid:0x10000000%05x' % port)
+
+        vlan_ifaces = []
+        for vlan in range(num_vlans):
+            vlan_id = vlan + 100
+            vlan_ifaces.append('Vlan%d' % vlan_id)
+            bvid = 'oid:0x26000000%06x' % vlan_id
+            asic_client.hset('ASIC_STATE:SAI_OBJECT_TYPE_VLAN:%s' % bvid, 'SAI_VLAN_ATTR_VLAN_ID', str(vlan_id))
+            for i in range(macs_per_vlan):
+                mac = '00:%02X:00:00:%02X:%02X' % (vlan, i // 256, i % 256)
+                key = 'ASIC_STATE:SAI_OBJECT_TYPE_FDB_ENTRY:' \
+                    '{"bvid":"%s","mac":"%s","switch_id":"oid:0x21000000000000"}' % (bvid, mac)
+                asic_client.hset(key, 'SAI_FDB_ENTRY_ATTR_TYPE', 'SAI_FDB_ENTRY_TYPE_DYNAMIC')
+                asic_client.hset(key, 'SAI_FDB_ENTRY_ATTR_BRIDGE_PORT_ID', 'oid:0x3a000000%05x' % (i % num_ports))
+                if i < neighbors_per_vlan:
+                    neigh_key = 'NEIGH_TABLE:Vlan%d:10.%d.%d.%d' % (vlan_id, vlan, i // 256, i % 256)
+                    app_client.hset(neigh_key, 'neigh', mac.lower())
+
+        with mock.patch.object(fast_reboot_dump, 'bulk_get_all',
+                               wraps=fast_reboot_dump.bulk_get_all) as mock_bulk_get_all, \
+                mock.patch.object(fast_reboot_dump.syslog, 'syslog'):
+            start = time.time()
+            fdb_entries, all_available_macs, map_mac_ip_per_vlan = \
+                fast_reboot_dump.generate_fdb_entries_logic(asic_db, app_db, vlan_ifaces)
+            neighbor_entries = fast_reboot_dump.generate_neighbor_entries(str(tmp_path / 'arp.json'),
+                                                                          all_available_macs, app_db)
+            elapsed = time.time() - start
+
+        print("Dumped {} FDB and {} neighbor entries in {:.2f} seconds".format(
+            len(fdb_entries), len(neighbor_entries), elapsed))
+        assert len(fdb_entries) == num_vlans * macs_per_vlan
+        assert len(neighbor_entries) == num_vlans * neighbors_per_vlan
+        assert map_mac_ip_per_vlan['Vlan100']['00:00:00:00:00:21'] == 'Ethernet4'
+        # Each object type is read once, regardless of the number of VLANs
+        assert mock_bulk_get_all.call_count == 6
+
     @classmethod
     def teardown_class(cls):
         print("TEARDOWN")
@@ -1,14 +1,18 @@
 import os
+from unittest import mock
 from click.testing import CliRunner
 import pytest
 
 import show.main as show
 from .utils import get_result_and_return_code
 import subprocess
+from utilities_common.bulk_db import BULK_CHUNK_SIZE
+from utilities_common.general import load_module_from_source
 
 root_path = os.path.dirname(os.path.abspath(__file__))
 modules_path = os.path.dirname(root_path)
 scripts_path = os.path.join(modules_path, "scripts")
+fdbshow_path = os.path.join(scripts_path, "fdbshow")
 
 show_mac_output_with_def_vlan = """\
   No.    Vlan  MacAddress         Port       Type
@@ -593,3 +597,44 @@ class TestFdbshow():
         print("result = {}".format(result))
         assert return_code == 1
         assert result == show_mac_invalid_address_output.strip("\n")
+
+    def test_show_mac_scale(self, capsys):
+        self.set_mock_variant("1")
+        fdbshow = load_module_from_source('fdbshow', fdbshow_path)
+        fdb = fdbshow.FdbShow()
+
+        # 4k MACs learned on Vlan2/Ethernet0 and Vlan3/Ethernet4
+        num_macs = 4 * 1024
+        client = fdb.db.get_redis_client(fdb.db.ASIC_DB)
+        for i in range(num_macs):
+            bvid, br_port = [("oid:0x260000000005c5", "oid:0x3a0000000005cb"),
+                             ("oid:0x260000000006c6", "oid:0x3a0000000006cd")][i % 2]
+            key = fdbshow.FdbShow.FDB_ENTRY_PREFIX + \
+                '{{"bvid":"{}","mac":"00:00:00:{:02X}:{:02X}:{:02X}","switch_id":"oid:0x21000000000000"}}'.format(
+                    bvid, i >> 16, (i >> 8) & 0xff, i & 0xff)
+            client.hset(key, "SAI_FDB_ENTRY_ATTR_BRIDGE_PORT_ID", br_port)
+            client.hset(key, "SAI_FDB_ENTRY_ATTR_TYPE", "SAI_FDB_ENTRY_TYPE_DYNAMIC")
+
+        with mock.patch.object(client, 'keys', wraps=client.keys) as mock_keys, \
+                mock.patch.object(client, 'pipeline', wraps=client.pipeline) as mock_pipeline:
+            fdb.display(None, None, None, None, False)
+
+        lines = capsys.readouterr().out.splitlines()
+        assert lines[-1] == "Total number of entries {}".format(num_macs + 5)
+        assert len(lines) == num_macs + 5 + 3
+        rows = [line.split()[1:] for line in lines[2:-1]]
+        assert ["2", "00:00:00:00:00:00", "Ethernet0", "Dynamic"] in rows
+        assert ["3", "00:00:00:00:00:01", "Ethernet4", "Dynamic"] in rows
+        vlans = [int(row[0]) for row in rows]
+        assert vlans == sorted(vlans)
+        # FDB and Vlan keys are scanned once, the entries are read in chunks, not one by one
+        assert mock_keys.call_count == 2
+        assert mock_pipeline.call_count == 1 + (num_macs + 5 + BULK_CHUNK_SIZE - 1) // BULK_CHUNK_SIZE
+
+        # Only the FDB entries of the requested Vlan are read
+        with mock.patch.object(fdbshow, 'bulk_get_entries', wraps=fdbshow.bulk_get_entries) as mock_bulk:
+            fdb.display("3", "Ethernet4", None, "static", False)
+        fdb_reads = [c for c in mock_bulk.call_args_list if fdbshow.FdbShow.FDB_ENTRY_PREFIX in next(iter(c[0][2]), "")]
+        assert len(fdb_reads) == 1
+        assert len(fdb_reads[0][0][2]) == num_macs // 2 + 1
+        assert capsys.readouterr().out == show_mac__type_output
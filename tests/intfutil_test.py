@@ -1,10 +1,14 @@
+import contextlib
+import io
 import os
 import sys
 from click.testing import CliRunner
-from unittest import TestCase
+from unittest import TestCase, mock
 import subprocess
 
 import show.main as show
+from utilities_common.bulk_db import TableSnapshot
+from utilities_common.general import load_module_from_source
 
 root_path = os.path.dirname(os.path.abspath(__file__))
 modules_path = os.path.dirname(root_path)
@@ -152,6 +156,36 @@ class TestIntfutil(TestCase):
         print(output)
         assert result.output == show_interface_status_output
 
+    def test_intf_status_table_snapshot(self):
+        # The mock DB is already in place, skip the mock setup of the script
+        with mock.patch.dict(os.environ, {"UTILITIES_UNIT_TESTING": "1"}):
+            intfutil = load_module_from_source('intfutil', os.path.join(scripts_path, 'intfutil'))
+
+        intf_status = intfutil.IntfStatus(None, None, None)
+        output = io.StringIO()
+        with mock.patch.object(intfutil, 'is_rj45_port',
+                               side_effect=lambda port: port in ['Ethernet16', 'Ethernet28', 'Ethernet36']), \
+                contextlib.redirect_stdout(output):
+            intf_status.display_intf_status()
+
+        assert output.getvalue() == show_interface_status_output
+        # KEYS and one bulk read for each of the 10 tables, instead of an HGET per port and column
+        assert intf_status.db.round_trips + intf_status.config_db.round_trips == 20
+
+    def test_intf_status_single_port_no_snapshot(self):
+        with mock.patch.dict(os.environ, {"UTILITIES_UNIT_TESTING": "1"}):
+            intfutil = load_module_from_source('intfutil', os.path.join(scripts_path, 'intfutil'))
+
+        intf_status = intfutil.IntfStatus('Ethernet32', None, None)
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            intf_status.display_intf_status()
+
+        assert output.getvalue() == show_interface_status_Ethernet32_output
+        # A single port is read directly, not with a bulk read of the whole tables
+        assert not isinstance(intf_status.db, TableSnapshot)
+        assert not isinstance(intf_status.config_db, TableSnapshot)
+
     # Test 'show interfaces status --verbose'
     def test_intf_status_verbose(self):
         result = self.runner.invoke(show.cli.commands["interfaces"].commands["status"], ["--verbose"])
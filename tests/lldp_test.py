@@ -1,4 +1,8 @@
 import os
+import subprocess
+import threading
+import time
+from unittest import mock
 
 from click.testing import CliRunner
 from utilities_common.general import load_module_from_source
@@ -60,6 +64,43 @@ expected_lldpctl_xml_output = \
         </interface>\n\
         </lldp>\n']
 
+
+class MockLldpctl(object):
+    """
+    Mock of 'sudo docker exec -i lldp<N> lldpctl' process,
+    each instance answers after the given delay
+    """
+    delays = {}
+    outputs = {}
+    timeouts = []
+    # All the instances must be waiting on the barrier at once to pass it
+    barrier = None
+
+    def __init__(self, cmd, stdout=None, text=None):
+        self.instance = cmd[4]
+        self.returncode = 0
+
+    def communicate(self, timeout=None):
+        self.timeouts.append(timeout)
+        if self.barrier is not None:
+            self.barrier.wait()
+        delay = self.delays.get(self.instance, 0)
+        if timeout is not None and delay > timeout:
+            time.sleep(timeout)
+            raise subprocess.TimeoutExpired(self.instance, timeout)
+        time.sleep(delay)
+        if self.instance not in self.outputs:
+            self.returncode = 1
+            return ('', None)
+        return (self.outputs[self.instance], None)
+
+    def wait(self):
+        return self.returncode
+
+    def kill(self):
+        self.delays = {}
+
+
 class TestLldp(object):
     @classmethod
     def setup_class(cls):
@@ -100,6 +141,54 @@ class TestLldp(object):
         output = lldp.get_summary_output(lldp_detail_info=True)
         assert output.strip('\n') == expected_lldpctl_xml_output[0].strip('\n')
 
+    @mock.patch.object(lldpshow.subprocess, 'Popen', MockLldpctl)
+    def test_get_info_concurrent(self):
+        lldp = lldpshow.Lldpshow()
+        lldp.lldp_instance = [0, 1, 2, 3]
+        lldp.lldp_interface = ['', '', '', '']
+        MockLldpctl.delays = {'lldp0': 0.2, 'lldp1': 0.1, 'lldp2': 0, 'lldp3': 0}
+        MockLldpctl.outputs = {'lldp{}'.format(i): 'output{}'.format(i) for i in range(3)}
+        MockLldpctl.timeouts = []
+        # lldpctl of all the instances are in flight at the same time
+        MockLldpctl.barrier = threading.Barrier(4, timeout=30)
+
+        try:
+            lldp.get_info(lldp_detail_info=True, lldp_port=None)
+        finally:
+            MockLldpctl.barrier = None
+
+        # Output is in the instances order, the failed instance is skipped
+        assert lldp.lldpraw == ['output0', 'output1', 'output2']
+        # lldpctl is waited for without a limit by default
+        assert MockLldpctl.timeouts == [None] * 4
+
+    @mock.patch.object(lldpshow.subprocess, 'Popen', MockLldpctl)
+    def test_get_info_timeout(self, capsys):
+        lldp = lldpshow.Lldpshow(timeout=0.5)
+        lldp.lldp_instance = [0, 1]
+        lldp.lldp_interface = ['', '']
+        MockLldpctl.delays = {'lldp0': 5}
+        MockLldpctl.outputs = {'lldp0': expected_lldpctl_xml_output[0], 'lldp1': expected_lldpctl_xml_output[0]}
+
+        lldp.get_info(lldp_detail_info=False, lldp_port=None)
+        lldp.parse_info(lldp_detail_info=False)
+        output = lldp.get_summary_output(lldp_detail_info=False)
+
+        assert output == expected_2MACs_Ethernet0_output
+        assert "Warning: lldp0 didn't respond in 0.5 seconds" in capsys.readouterr().err
+
+    @mock.patch.object(lldpshow.subprocess, 'Popen', MockLldpctl)
+    def test_get_info_port(self):
+        lldp = lldpshow.Lldpshow()
+        lldp.lldp_instance = [0, 1, 2]
+        lldp.lldp_interface = ['', '', '']
+        MockLldpctl.delays = {}
+        MockLldpctl.outputs = {'lldp0': 'Ethernet4', 'lldp1': 'Ethernet0 first', 'lldp2': 'Ethernet0 second'}
+
+        lldp.get_info(lldp_detail_info=True, lldp_port='Ethernet0')
+
+        assert lldp.lldpraw == ['Ethernet0 first']
+
     @classmethod
     def teardown_class(cls):
         print("TEARDOWN")
@@ -194,6 +194,17 @@ class SwssSyncClient(mockredis.MockRedis):
         if self.decode_responses:
             return value.decode('utf-8')
 
+    # Patch mockredis/mockredis/client.py
+    # The official implementation doesn't support the mapping argument of redis-py 3.5+
+    def hset(self, hashkey, attribute=None, value=None, mapping=None):
+        """Emulate hset."""
+        added = 0
+        if attribute is not None:
+            added += super(SwssSyncClient, self).hset(hashkey, attribute, value)
+        for attr, val in (mapping or {}).items():
+            added += super(SwssSyncClient, self).hset(hashkey, attr, val)
+        return added
+
     # Patch mockredis/mockredis/client.py
     # The official implementation will filter out keys with a slash '/'
     # ref: https://github.com/locationlabs/mockredis/blob/master/mockredis/client.py
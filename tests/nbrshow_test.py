@@ -0,0 +1,123 @@
+import os
+import socket
+import sys
+from unittest import mock
+
+from utilities_common.general import load_module_from_source
+
+from .mock_tables import dbconnector
+
+test_path = os.path.dirname(os.path.abspath(__file__))
+modules_path = os.path.dirname(test_path)
+scripts_path = os.path.join(modules_path, "scripts")
+mock_db_path = os.path.join(test_path, "fdbshow_input")
+sys.path.insert(0, modules_path)
+
+nbrshow_path = os.path.join(scripts_path, 'nbrshow')
+nbrshow = load_module_from_source('nbrshow', nbrshow_path)
+
+NUD_INCOMPLETE = 0x01
+NUD_REACHABLE = 0x02
+NUD_STALE = 0x04
+NUD_NOARP = 0x40
+
+LINKS = {1: 'Vlan2', 2: 'PortChannel0001', 3: 'eth0'}
+
+NEIGHBORS = {
+    socket.AF_INET: [
+        ('192.168.0.2', '11:22:33:44:55:66', 1, NUD_STALE),
+        ('192.168.0.3', '00:aa:bb:cc:dd:ee', 1, NUD_REACHABLE),
+        ('192.168.0.4', None, 1, NUD_INCOMPLETE),
+        ('10.64.246.1', '00:00:5e:00:01:f6', 3, NUD_STALE),
+        ('10.0.0.57', '52:54:00:87:8f:2c', 2, NUD_REACHABLE)
+    ],
+    socket.AF_INET6: [
+        ('fe80::1', '11:22:33:44:55:66', 1, NUD_STALE),
+        ('ff02::1', '33:33:00:00:00:01', 1, NUD_NOARP),
+        ('fc00::72', '52:54:00:87:8f:2c', 2, NUD_REACHABLE)
+    ]
+}
+
+show_arp_output = """\
+Address      MacAddress         Iface            Vlan
+-----------  -----------------  ---------------  ------
+10.0.0.57    52:54:00:87:8f:2c  PortChannel0001  -
+10.64.246.1  00:00:5e:00:01:f6  eth0             -
+192.168.0.2  11:22:33:44:55:66  Ethernet0        2
+192.168.0.3  00:aa:bb:cc:dd:ee  -                2
+""" + "Total number of entries 4 \n"
+
+show_arp_ip_output = """\
+Address      MacAddress         Iface        Vlan
+-----------  -----------------  ---------  ------
+192.168.0.2  11:22:33:44:55:66  Ethernet0       2
+""" + "Total number of entries 1 \n"
+
+show_ndp_output = """\
+Address    MacAddress         Iface            Vlan    Status
+---------  -----------------  ---------------  ------  ---------
+fc00::72   52:54:00:87:8f:2c  PortChannel0001  -       REACHABLE
+fe80::1    11:22:33:44:55:66  Ethernet0        2       STALE
+""" + "Total number of entries 2 \n"
+
+
+def get_kernel_neighbors(family, namespace=None):
+    return LINKS, NEIGHBORS[family]
+
+
+@mock.patch.object(nbrshow, 'get_kernel_neighbors', mock.MagicMock(side_effect=get_kernel_neighbors))
+class TestNbrshow(object):
+    @classmethod
+    def setup_class(cls):
+        os.environ["UTILITIES_UNIT_TESTING"] = "1"
+        dbconnector.dedicated_dbs['ASIC_DB'] = os.path.join(mock_db_path, 'asic_db')
+        dbconnector.dedicated_dbs['COUNTERS_DB'] = os.path.join(mock_db_path, 'counters_db')
+
+    @classmethod
+    def teardown_class(cls):
+        os.environ["UTILITIES_UNIT_TESTING"] = "0"
+        dbconnector.dedicated_dbs['ASIC_DB'] = None
+        dbconnector.dedicated_dbs['COUNTERS_DB'] = None
+
+    def test_show_arp(self, capsys):
+        nbrshow.ArpShow(None, None).display()
+        assert capsys.readouterr().out == show_arp_output
+
+    def test_show_arp_ipaddr(self, capsys):
+        nbrshow.ArpShow('192.168.0.2', None).display()
+        assert capsys.readouterr().out == show_arp_ip_output
+
+    def test_show_arp_iface(self, capsys):
+        nbrshow.ArpShow(None, 'Vlan2').display()
+        output = capsys.readouterr().out
+        assert '192.168.0.2' in output
+        assert '10.0.0.57' not in output
+        assert "Total number of entries 2 " in output
+
+    def test_show_arp_invalid_iface(self, capsys):
+        nbrshow.ArpShow(None, 'Vlan3').display()
+        assert capsys.readouterr().out == 'Error fetching Neighbors: Cannot find device "Vlan3" \n'
+
+    def test_show_ndp(self, capsys):
+        nbrshow.NeighShow(None, None).display()
+        assert capsys.readouterr().out == show_ndp_output
+
+    def test_show_arp_scale(self, capsys):
+        arp = nbrshow.ArpShow(None, 'Vlan2')
+
+        # 64k neighbors on Vlan2, every other one has an FDB entry
+        num_nbrs = 64 * 1024
+        neighbors = []
+        for i in range(num_nbrs):
+            mac = '00:00:00:{:02x}:{:02x}:{:02x}'.format(i >> 16, (i >> 8) & 0xff, i & 0xff)
+            neighbors.append(('10.{}.{}.{}'.format(i >> 16, (i >> 8) & 0xff, i & 0xff), mac, 1, NUD_REACHABLE))
+            if i % 2 == 0:
+                arp.fdb_ports[2, mac.upper()] = 'Ethernet4'
+
+        with mock.patch.object(nbrshow, 'get_kernel_neighbors', return_value=(LINKS, neighbors)):
+            arp.display()
+
+        lines = capsys.readouterr().out.splitlines()
+        assert lines[-1] == "Total number of entries {} ".format(num_nbrs)
+        assert lines[2].split() == ['10.0.0.0', '00:00:00:00:00:00', 'Ethernet4', '2']
+        assert lines[3].split() == ['10.0.0.1', '00:00:00:00:00:01', '-', '2']
@@ -47,6 +47,25 @@ class TestPfcwd(object):
     def test_pfcwd_show_stats_invalid_queue(self):
         self.executor(testData['pfcwd_show_stats_invalid_queue'])
 
+    def test_pfcwd_show_stats_bulk_read(self):
+        import pfcwd.main as pfcwd
+        runner = CliRunner()
+        db = Db()
+        # PFC watchdog is stopped on Ethernet8, its queues are not read
+        db.cfgdb.set_entry('PFC_WD', 'Ethernet8', None)
+        with patch('pfcwd.main.bulk_get_entries', wraps=pfcwd.bulk_get_entries) as mock_bulk_get_entries:
+            result = runner.invoke(pfcwd.cli.commands['show'].commands['stats'], obj=db)
+        print(result.output)
+        assert result.exit_code == 0
+        assert result.output == '\n'.join(
+            line for line in pfcwd_show_stats_output.split('\n') if 'Ethernet8:' not in line
+        )
+        # The watchdog counters of the queues are read in one call
+        mock_bulk_get_entries.assert_called_once()
+        args = mock_bulk_get_entries.call_args[0]
+        assert len(args[2]) == 60
+        assert args[3] == pfcwd.STATS_FIELDS
+
     def executor(self, testcase):
         import pfcwd.main as pfcwd
         runner = CliRunner()
@@ -0,0 +1,95 @@
+from unittest import mock
+
+import click
+from click.testing import CliRunner
+
+from utilities_common.db import Db
+from utilities_common import port_index as port_index_util
+from utilities_common.port_index import PortIndex
+
+import config.main as config
+
+NUM_PORTS = 1024
+
+
+class TestPortIndex(object):
+    def setup_method(self):
+        port_index_util.invalidate_port_index()
+
+    def test_port_index(self):
+        port_index = PortIndex({
+            'Ethernet0': {'alias': 'etp1', 'index': '0'},
+            'Ethernet2': {'alias': 'etp1', 'index': '0'},
+            'Ethernet4': {'index': '1'}
+        })
+        assert len(port_index) == 3
+        assert port_index.get_alias('Ethernet0') == 'etp1'
+        assert port_index.get_alias('Ethernet4') is None
+        assert port_index.get_alias('Ethernet8') is None
+        # The first port with the alias is returned
+        assert port_index.get_name('etp1') == 'Ethernet0'
+        assert port_index.get_name('etp2') is None
+        assert port_index.get_names_by_index(0) == ['Ethernet0', 'Ethernet2']
+        assert port_index.get_names_by_index(2) == []
+
+    def test_port_index_cached(self):
+        db = Db()
+        with mock.patch.object(db.cfgdb, 'get_table', wraps=db.cfgdb.get_table) as mock_get_table, \
+                mock.patch.object(db.cfgdb, 'get_keys', wraps=db.cfgdb.get_keys) as mock_get_keys:
+            port_index = port_index_util.get_port_index(db.cfgdb)
+            assert port_index_util.get_port_index(db.cfgdb) is port_index
+            assert mock_get_table.call_count == 1
+            # A cached index is returned without reading CONFIG_DB
+            assert mock_get_keys.call_count == 0
+
+            # The index is rebuilt once it is invalidated after a port change
+            db.cfgdb.set_entry('PORT', 'Ethernet1000', {'alias': 'etp1000', 'index': '1000'})
+            port_index_util.invalidate_port_index()
+            port_index = port_index_util.get_port_index(db.cfgdb)
+            assert mock_get_table.call_count == 2
+            assert port_index.get_name('etp1000') == 'Ethernet1000'
+
+            # An index built from another connector is not reused
+            assert port_index_util.get_port_index(Db().cfgdb) is not port_index
+
+    def test_port_index_per_command(self):
+        db = Db()
+
+        @click.command()
+        def lookup():
+            for _ in range(3):
+                click.echo(str(port_index_util.get_port_index(db.cfgdb).get_name('etp1')))
+
+        runner = CliRunner()
+        with mock.patch.object(db.cfgdb, 'get_table', wraps=db.cfgdb.get_table) as mock_get_table:
+            assert runner.invoke(lookup).output == 'Ethernet0\n' * 3
+            assert mock_get_table.call_count == 1
+
+            # The next command builds its own index
+            db.cfgdb.mod_entry('PORT', 'Ethernet0', {'alias': 'etp100'})
+            assert runner.invoke(lookup).output == 'None\n' * 3
+            assert mock_get_table.call_count == 2
+
+    def test_interface_alias_to_name(self):
+        db = Db()
+        assert config.interface_alias_to_name(db.cfgdb, 'etp1') == 'Ethernet0'
+        assert config.interface_alias_to_name(db.cfgdb, 'etp1.10') == 'Ethernet0.10'
+        assert config.interface_alias_to_name(db.cfgdb, 'PortChannel0001') == 'PortChannel0001'
+        assert config.interface_name_to_alias(db.cfgdb, 'Ethernet0') == 'etp1'
+        assert config.interface_name_to_alias(db.cfgdb, 'PortChannel0001') is None
+        assert config.interface_name_is_valid(db.cfgdb, 'Ethernet0')
+        assert not config.interface_name_is_valid(db.cfgdb, 'Ethernet1')
+
+    def test_interface_alias_to_name_scale(self):
+        db = Db()
+        for i in range(NUM_PORTS):
+            db.cfgdb.set_entry('PORT', 'Ethernet{}'.format(1000 + i), {'alias': 'etp{}'.format(1000 + i)})
+
+        with mock.patch.object(db.cfgdb, 'get_table', wraps=db.cfgdb.get_table) as mock_get_table:
+            for i in range(NUM_PORTS):
+                name = 'Ethernet{}'.format(1000 + i)
+                assert config.interface_alias_to_name(db.cfgdb, 'etp{}'.format(1000 + i)) == name
+                assert config.interface_name_to_alias(db.cfgdb, name) == 'etp{}'.format(1000 + i)
+
+        # The PORT table is read once for all the lookups
+        assert mock_get_table.call_count == 1
@@ -3,6 +3,7 @@ import os
 from click.testing import CliRunner
 from .mock_tables import dbconnector
 from unittest.mock import patch, MagicMock
+from utilities_common.general import load_module_from_source
 
 from utilities_common.platform_sfputil_helper import (
     load_platform_sfputil, logical_port_to_physical_port_index,
@@ -1018,6 +1019,34 @@ Ethernet36  Present
         expected = "Ethernet200: Transceiver status info not applicable"
         assert result_lines == expected
 
+    def test_sfpshow_db_snapshot(self, capsys):
+        # The mock DB is already in place, skip the mock setup of the script
+        with patch.dict(os.environ, {"UTILITIES_UNIT_TESTING": "1"}):
+            sfpshow = load_module_from_source('sfpshow', os.path.join(scripts_path, 'sfpshow'))
+
+        def run(view, port=None, dump_dom=False):
+            sfp = sfpshow.SFPShow(port, None, dump_dom)
+            getattr(sfp, 'get_' + view)()
+            getattr(sfp, 'display_' + view)()
+            return capsys.readouterr().out, sfp.round_trips
+
+        with patch.object(sfpshow.platform_sfputil_helper, 'get_first_subport', side_effect=lambda port: port), \
+                patch.object(sfpshow, 'is_rj45_port', MagicMock(return_value=False)):
+            output, round_trips = run('status', 'Ethernet44')
+            assert "\n".join([line.rstrip() for line in output.split('\n')]) == test_qsfp_dd_status_output
+            assert round_trips == 1
+
+            for view, dump_dom in [('presence', False), ('eeprom', True), ('pm', False), ('status', False)]:
+                output, round_trips = run(view, dump_dom=dump_dom)
+                # KEYS of the PORT_TABLE, one bulk read of APPL_DB and one of STATE_DB
+                assert round_trips == 3
+
+                # Without the snapshot every entry is read with its own get_all()
+                with patch.object(sfpshow.TransceiverDbSnapshot, 'load'):
+                    expected_output, expected_round_trips = run(view, dump_dom=dump_dom)
+                assert output == expected_output
+                assert expected_round_trips > round_trips
+
     @classmethod
     def teardown_class(cls):
         print("TEARDOWN")
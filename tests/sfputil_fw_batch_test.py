@@ -0,0 +1,277 @@
+import json
+import os
+import sys
+import threading
+import time
+from unittest import mock
+from unittest.mock import MagicMock, patch
+
+from click.testing import CliRunner
+
+test_path = os.path.dirname(os.path.abspath(__file__))
+modules_path = os.path.dirname(test_path)
+sys.path.insert(0, modules_path)
+
+sys.modules['sonic_platform'] = mock.MagicMock()
+import sfputil.main as sfputil
+from sfputil import fw_batch
+
+EXIT_FAIL = -1
+NUM_PORTS = 8
+IMAGE_SIZE = 4096
+START_LPL_SIZE = 112
+BLOCK_SIZE = 128
+
+
+class MockCdbApi(object):
+    """CMIS CDB firmware management of a module which keeps the downloaded image"""
+
+    active = 0
+    max_active = 0
+    lock = threading.Lock()
+
+    def __init__(self, lpl_only=False, block_latency=0.001, fail_address=None):
+        self.lpl_only = lpl_only
+        self.block_latency = block_latency
+        self.fail_address = fail_address
+        self.image = bytearray()
+        self.image_size = 0
+        self.running = 'A'
+        self.committed = 'A'
+        self.calls = []
+
+    def get_module_fw_mgmt_feature(self):
+        return {'status': True, 'feature': (START_LPL_SIZE, BLOCK_SIZE, self.lpl_only, False, 8)}
+
+    def cdb_start_firmware_download(self, start_lpl_size, start_data, image_size):
+        self.calls.append('start')
+        self.image = bytearray(start_data)
+        self.image_size = image_size
+        return 1
+
+    def _block_write(self, address, data):
+        with MockCdbApi.lock:
+            MockCdbApi.active += 1
+            MockCdbApi.max_active = max(MockCdbApi.max_active, MockCdbApi.active)
+        try:
+            time.sleep(self.block_latency)
+            if address == self.fail_address:
+                return 0
+            assert address == len(self.image) - START_LPL_SIZE
+            self.image += data
+            return 1
+        finally:
+            with MockCdbApi.lock:
+                MockCdbApi.active -= 1
+
+    def cdb_lpl_block_write(self, address, data):
+        assert len(data) <= sfputil.MAX_LPL_FIRMWARE_BLOCK_SIZE
+        return self._block_write(address, data)
+
+    def cdb_epl_block_write(self, address, data, autopaging_flag, write_length):
+        assert len(data) <= BLOCK_SIZE
+        return self._block_write(address, data)
+
+    def cdb_firmware_download_complete(self):
+        self.calls.append('complete')
+        return 1 if len(self.image) == self.image_size else 0
+
+    def cdb_run_firmware(self, mode):
+        self.calls.append('run')
+        self.running = 'B'
+        return 1
+
+    def get_module_fw_info(self):
+        return {'status': True, 'result': ('1.0.0', int(self.running == 'A'), int(self.committed == 'A'), 0,
+                                           '1.1.0', int(self.running == 'B'), int(self.committed == 'B'), 0,
+                                           '1.0.0', '1.1.0')}
+
+    def cdb_commit_firmware(self):
+        self.calls.append('commit')
+        self.committed = self.running
+        return 1
+
+
+def make_sfp(api, serial):
+    sfp = MagicMock()
+    sfp.get_presence.return_value = True
+    sfp.get_transceiver_info.return_value = {'model': 'QDD-400G-DR4', 'serial': serial}
+    sfp.get_xcvr_api.return_value = api
+    sfp.set_optoe_write_max = MagicMock(side_effect=NotImplementedError)
+    return sfp
+
+
+def make_chassis(apis, serials={}):
+    sfps = {index: make_sfp(api, serials.get(index, 'SN{}'.format(index))) for index, api in apis.items()}
+    chassis = MagicMock()
+    chassis.get_sfp = MagicMock(side_effect=lambda index: sfps[index])
+    chassis.get_port_or_cage_type = MagicMock(side_effect=NotImplementedError)
+    return chassis
+
+
+def make_sfputil_helper(num_ports):
+    helper = MagicMock()
+    # Two breakout subports per module
+    helper.logical = ['Ethernet{}'.format(i * 4) for i in range(num_ports * 2)]
+    helper.is_logical_port = MagicMock(return_value=1)
+    helper.get_logical_to_physical = MagicMock(side_effect=lambda name: [int(name[len('Ethernet'):]) // 8 + 1])
+    return helper
+
+
+@patch('sfputil.main.platform_sfputil', make_sfputil_helper(NUM_PORTS))
+@patch('sfputil.main.update_firmware_info_to_state_db', MagicMock())
+@patch('sfputil.main.FW_SWITCH_POLL_INTERVAL', 0)
+class TestFirmwareUpgradeBatch(object):
+    def setup_method(self):
+        MockCdbApi.active = MockCdbApi.max_active = 0
+
+    def write_image(self, tmp_path):
+        image_path = os.path.join(str(tmp_path), 'firmware.bin')
+        with open(image_path, 'wb') as f:
+            f.write(bytes(i % 251 for i in range(IMAGE_SIZE)))
+        return image_path
+
+    def invoke(self, apis, args, serials={}):
+        with patch('sfputil.main.platform_chassis', make_chassis(apis, serials)):
+            runner = CliRunner()
+            return runner.invoke(sfputil.cli.commands['firmware'].commands['upgrade-batch'], args)
+
+    def test_upgrade_batch(self, tmp_path):
+        image_path = self.write_image(tmp_path)
+        state_path = os.path.join(str(tmp_path), 'state.json')
+        apis = {i + 1: MockCdbApi(lpl_only=(i % 2 == 1), block_latency=0.005) for i in range(NUM_PORTS)}
+
+        result = self.invoke(apis, [image_path, '--workers', '4', '--state-file', state_path])
+
+        assert result.exit_code == 0, result.output
+        with open(image_path, 'rb') as f:
+            image = f.read()
+        for api in apis.values():
+            assert bytes(api.image) == image
+            assert api.calls == ['start', 'complete', 'run', 'commit']
+            assert api.committed == 'B'
+        assert MockCdbApi.max_active == 4
+
+        lines = result.output.splitlines()
+        assert 'Ethernet0: Downloading ... 100%' in lines
+        assert 'Ethernet56: Firmware commit successful' in lines
+        assert lines[-1] == 'Upgraded {} of {} transceivers, upgrade state is saved to {}'.format(
+            NUM_PORTS, NUM_PORTS, state_path)
+        # One row per module, the second subport is skipped
+        assert [line.split() for line in lines[-NUM_PORTS - 1:-1]] == \
+            [['Ethernet{}'.format(i * 8), 'committed', 'Upgraded'] for i in range(NUM_PORTS)]
+
+        with open(state_path) as f:
+            state = json.load(f)
+        assert state['ports'] == {
+            'Ethernet{}'.format(i * 8): {
+                'stage': 'committed',
+                'module': {
+                    'vendor_pn': 'QDD-400G-DR4', 'vendor_sn': 'SN{}'.format(i + 1), 'bank': 'B', 'version': '1.1.0'
+                }
+            } for i in range(NUM_PORTS)
+        }
+
+    def test_upgrade_batch_failure_and_resume(self, tmp_path):
+        image_path = self.write_image(tmp_path)
+        state_path = os.path.join(str(tmp_path), 'state.json')
+        apis = {i + 1: MockCdbApi() for i in range(NUM_PORTS)}
+        apis[3].fail_address = BLOCK_SIZE * 2
+
+        result = self.invoke(apis, [image_path, '--state-file', state_path])
+
+        assert result.exit_code == EXIT_FAIL
+        assert 'Ethernet16  pending    Failed: CDB: firmware download failed! - status 0' in result.output
+        assert 'Upgraded {} of {} transceivers'.format(NUM_PORTS - 1, NUM_PORTS) in result.output
+        assert all(api.committed == 'B' for index, api in apis.items() if index != 3)
+        # The transceivers are upgraded one at a time by default
+        assert MockCdbApi.max_active == 1
+
+        # The module of the failed port is fixed, only it is upgraded on resume
+        apis = {i + 1: MockCdbApi() for i in range(NUM_PORTS)}
+        for index, api in apis.items():
+            if index != 3:
+                api.running = api.committed = 'B'
+        result = self.invoke(apis, [image_path, '--state-file', state_path])
+
+        assert result.exit_code == 0, result.output
+        assert apis[3].calls == ['start', 'complete', 'run', 'commit']
+        assert all(api.calls == [] for index, api in apis.items() if index != 3)
+        assert 'Ethernet0   committed  Already upgraded' in result.output
+        assert 'Ethernet16  committed  Upgraded\n' in result.output
+
+        # --restart ignores the saved state
+        apis[1] = MockCdbApi()
+        result = self.invoke(apis, [image_path, '--state-file', state_path, '--restart', '-p', 'Ethernet0'])
+        assert result.exit_code == 0, result.output
+        assert apis[1].calls == ['start', 'complete', 'run', 'commit']
+
+    def test_upgrade_batch_resume_from_run(self, tmp_path):
+        image_path = self.write_image(tmp_path)
+        state_path = os.path.join(str(tmp_path), 'state.json')
+        image = fw_batch.FirmwareImage(image_path)
+        state = fw_batch.UpgradeState(state_path, image)
+        for port, index, stage in [('Ethernet0', 1, fw_batch.STAGE_RUN), ('Ethernet8', 2, fw_batch.STAGE_DOWNLOADED)]:
+            module = {'vendor_pn': 'QDD-400G-DR4', 'vendor_sn': 'SN{}'.format(index), 'bank': 'B', 'version': '1.1.0'}
+            state.set_stage(port, fw_batch.STAGE_DOWNLOADED, module=module)
+            state.set_stage(port, stage)
+
+        apis = {i + 1: MockCdbApi() for i in range(2)}
+        apis[1].running = 'B'
+        result = self.invoke(apis, [image_path, '-p', 'Ethernet0,Ethernet8', '--state-file', state_path])
+
+        assert result.exit_code == 0, result.output
+        assert apis[1].calls == ['commit']
+        assert apis[2].calls == ['run', 'commit']
+
+    def test_upgrade_batch_resume_module_changed(self, tmp_path):
+        image_path = self.write_image(tmp_path)
+        state_path = os.path.join(str(tmp_path), 'state.json')
+        image = fw_batch.FirmwareImage(image_path)
+        state = fw_batch.UpgradeState(state_path, image)
+        module = {'vendor_pn': 'QDD-400G-DR4', 'vendor_sn': 'SN1', 'bank': 'B', 'version': '1.1.0'}
+        state.set_stage('Ethernet0', fw_batch.STAGE_DOWNLOADED, module=module)
+        state.set_stage('Ethernet8', fw_batch.STAGE_RUN, module=dict(module, vendor_sn='SN2', version='1.0.9'))
+        state.set_stage('Ethernet16', fw_batch.STAGE_COMMITTED)
+
+        # Ethernet0 module is swapped, Ethernet8 bank B holds another image, Ethernet16 state has no module
+        apis = {i + 1: MockCdbApi() for i in range(3)}
+        result = self.invoke(apis, [image_path, '-p', 'Ethernet0,Ethernet8,Ethernet16', '--state-file', state_path],
+                             serials={1: 'SN9'})
+
+        assert result.exit_code == 0, result.output
+        assert all(api.calls == ['start', 'complete', 'run', 'commit'] for api in apis.values())
+        assert "Ethernet0: Module or its firmware changed since the saved 'downloaded' stage, " \
+            "restarting from download" in result.output
+        with open(state_path) as f:
+            state = json.load(f)
+        assert state['ports']['Ethernet0']['module']['vendor_sn'] == 'SN9'
+        assert state['ports']['Ethernet8']['module']['version'] == '1.1.0'
+
+    def test_upgrade_batch_image_changed(self, tmp_path):
+        image_path = self.write_image(tmp_path)
+        state_path = os.path.join(str(tmp_path), 'state.json')
+        with open(state_path, 'w') as f:
+            json.dump({'image_sha256': 'other', 'ports': {'Ethernet0': {'stage': 'committed'}}}, f)
+
+        apis = {1: MockCdbApi()}
+        result = self.invoke(apis, [image_path, '-p', 'Ethernet0', '--state-file', state_path])
+
+        assert result.exit_code == 0, result.output
+        assert apis[1].calls == ['start', 'complete', 'run', 'commit']
+
+    def test_upgrade_batch_file_not_found(self, tmp_path):
+        result = self.invoke({}, [os.path.join(str(tmp_path), 'no_such_file.bin')])
+        assert result.exit_code == EXIT_FAIL
+        assert result.output.endswith('no_such_file.bin NOT found\n')
+
+    def test_upgrade_batch_not_supported(self, tmp_path):
+        image_path = self.write_image(tmp_path)
+        state_path = os.path.join(str(tmp_path), 'state.json')
+        api = MockCdbApi()
+        api.get_module_fw_mgmt_feature = MagicMock(side_effect=NotImplementedError)
+
+        result = self.invoke({1: api}, [image_path, '-p', 'Ethernet0', '--state-file', state_path])
+
+        assert result.exit_code == EXIT_FAIL
+        assert 'Failed: This functionality is NOT applicable for this transceiver' in result.output
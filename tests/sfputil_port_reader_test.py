@@ -0,0 +1,298 @@
+import sys
+import os
+import threading
+import time
+from unittest import mock
+from unittest.mock import MagicMock, patch
+
+from click.testing import CliRunner
+
+test_path = os.path.dirname(os.path.abspath(__file__))
+modules_path = os.path.dirname(test_path)
+sys.path.insert(0, modules_path)
+
+sys.modules['sonic_platform'] = mock.MagicMock()
+import sfputil.main as sfputil
+from sfputil.port_reader import PortReader, PortReadTimeout, PortSlotTimeout, get_sfp_bus
+
+NUM_PORTS = 32
+READ_LATENCY = 0.1
+
+
+class MockSfp(object):
+    """Transceiver which reads take the given time, tracks the number of concurrent reads"""
+
+    active = 0
+    max_active = 0
+    lock = threading.Lock()
+
+    def __init__(self, index, latency=READ_LATENCY, error=None):
+        self.index = index
+        self.latency = latency
+        self.error = error
+
+    def _read(self, value):
+        with MockSfp.lock:
+            MockSfp.active += 1
+            MockSfp.max_active = max(MockSfp.max_active, MockSfp.active)
+        try:
+            time.sleep(self.latency)
+            if self.error:
+                raise self.error
+            return value
+        finally:
+            with MockSfp.lock:
+                MockSfp.active -= 1
+
+    def get_presence(self):
+        return self._read(self.index % 2 == 0)
+
+    def get_lpmode(self):
+        return self._read(self.index % 4 == 0)
+
+    def get_transceiver_info(self):
+        return self._read({'type': 'QSFP-DD Double Density 8X Pluggable Transceiver'})
+
+    def get_eeprom_path(self):
+        return '/sys/bus/i2c/devices/i2c-{}/{}-0050/eeprom'.format(self.index % 2, self.index)
+
+
+def make_chassis(sfps):
+    chassis = MagicMock()
+    chassis.get_sfp = MagicMock(side_effect=lambda index: sfps[index])
+    chassis.get_port_or_cage_type = MagicMock(side_effect=NotImplementedError)
+    return chassis
+
+
+def make_sfputil_helper(num_ports):
+    helper = MagicMock()
+    helper.logical = ['Ethernet{}'.format(i * 8) for i in range(num_ports)]
+    helper.is_logical_port = MagicMock(return_value=1)
+    helper.get_logical_to_physical = MagicMock(side_effect=lambda name: [int(name[len('Ethernet'):]) // 8 + 1])
+    return helper
+
+
+class TestPortReader(object):
+    def setup_method(self):
+        MockSfp.active = MockSfp.max_active = 0
+
+    def test_read_in_order(self):
+        sfps = {i: MockSfp(i, latency=0.01 * (NUM_PORTS - i)) for i in range(NUM_PORTS)}
+        reader = PortReader(max_workers=8)
+
+        results = list(reader.read(range(NUM_PORTS), lambda i: sfps[i].get_presence()))
+
+        assert [port for port, _, _ in results] == list(range(NUM_PORTS))
+        assert [result for _, result, _ in results] == [i % 2 == 0 for i in range(NUM_PORTS)]
+        assert all(error is None for _, _, error in results)
+        assert MockSfp.max_active == 8
+
+    def test_read_bus_limit(self):
+        sfps = {i: MockSfp(i, latency=0.02) for i in range(NUM_PORTS)}
+        bus_active = {}
+        bus_max_active = {}
+        lock = threading.Lock()
+
+        def read(i):
+            bus = get_sfp_bus(sfps[i])
+            with lock:
+                bus_active[bus] = bus_active.get(bus, 0) + 1
+                bus_max_active[bus] = max(bus_max_active.get(bus, 0), bus_active[bus])
+            try:
+                return sfps[i].get_presence()
+            finally:
+                with lock:
+                    bus_active[bus] -= 1
+
+        reader = PortReader(max_workers=8, bus_limit=2, get_bus=lambda i: get_sfp_bus(sfps[i]))
+        results = list(reader.read(range(NUM_PORTS), read))
+
+        assert len(results) == NUM_PORTS
+        assert bus_max_active == {'i2c-0': 2, 'i2c-1': 2}
+
+    def test_read_timeout_and_errors(self):
+        sfps = {i: MockSfp(i, latency=0.01) for i in range(8)}
+        sfps[2] = MockSfp(2, latency=5)
+        sfps[5] = MockSfp(5, error=RuntimeError('I2C read failed'))
+        reader = PortReader(max_workers=2, timeout=1)
+
+        results = {}
+        for port, result, error in reader.read(range(8), lambda i: sfps[i].get_presence()):
+            results[port] = (result, error)
+
+        assert isinstance(results[2][1], PortReadTimeout)
+        assert str(results[5][1]) == 'I2C read failed'
+        assert all(results[i] == (i % 2 == 0, None) for i in [0, 1, 3, 4, 6, 7])
+        # The hung port keeps its worker, the other ports are read on the remaining one
+        assert MockSfp.max_active == 2
+
+    def test_read_timeout_keeps_bus(self):
+        sfps = {i: MockSfp(i, latency=0) for i in range(6)}
+        hung = threading.Event()
+        released = threading.Event()
+        read_ports = []
+        bus_active = {}
+        bus_max_active = {}
+        lock = threading.Lock()
+
+        def read(i):
+            bus = get_sfp_bus(sfps[i])
+            with lock:
+                read_ports.append(i)
+                bus_active[bus] = bus_active.get(bus, 0) + 1
+                bus_max_active[bus] = max(bus_max_active.get(bus, 0), bus_active[bus])
+            try:
+                if i == 0:
+                    hung.set()
+                    released.wait(30)
+                return sfps[i].get_presence()
+            finally:
+                with lock:
+                    bus_active[bus] -= 1
+
+        reader = PortReader(max_workers=4, bus_limit=1, timeout=0.1, get_bus=lambda i: get_sfp_bus(sfps[i]))
+        try:
+            results = {port: (result, error) for port, result, error in reader.read(range(6), read)}
+        finally:
+            released.set()
+
+        assert hung.is_set()
+        # Port 0 hangs on i2c-0, the other ports of i2c-0 never get the bus and aren't read
+        assert isinstance(results[0][1], PortReadTimeout)
+        assert all(isinstance(results[i][1], PortSlotTimeout) for i in [2, 4])
+        assert all(results[i] == (False, None) for i in [1, 3, 5])
+        assert sorted(read_ports) == [0, 1, 3, 5]
+        assert bus_max_active == {'i2c-0': 1, 'i2c-1': 1}
+
+    def test_read_timeout_single_worker(self):
+        sfps = {i: MockSfp(i, latency=0) for i in range(4)}
+        released = threading.Event()
+
+        def read(i):
+            if i == 1:
+                released.wait(30)
+            return sfps[i].get_presence()
+
+        reader = PortReader(max_workers=1, timeout=0.5)
+        start = time.monotonic()
+        try:
+            results = {port: (result, error) for port, result, error in reader.read(range(4), read)}
+        finally:
+            released.set()
+
+        # The ports after the hung one don't wait for the timeout again, they are reported as not read
+        assert time.monotonic() - start < 2
+        assert results[0] == (True, None)
+        assert isinstance(results[1][1], PortReadTimeout)
+        assert all(isinstance(results[i][1], PortSlotTimeout) for i in [2, 3])
+        assert str(results[2][1]) == 'not read, its slot is held by a read which timed out after 0.5 seconds'
+
+    def test_read_fatal_error(self):
+        def read(i):
+            if i == 3:
+                raise NotImplementedError
+            return i
+
+        reader = PortReader(max_workers=4, fatal_errors=(NotImplementedError,))
+        results = []
+        try:
+            for port, result, error in reader.read(range(8), read):
+                results.append(result)
+        except NotImplementedError:
+            pass
+        else:
+            assert False, 'NotImplementedError is not raised'
+        assert results == [0, 1, 2]
+
+    def test_get_sfp_bus(self):
+        assert get_sfp_bus(MockSfp(3)) == 'i2c-1'
+        assert get_sfp_bus(MagicMock(get_eeprom_path=MagicMock(side_effect=NotImplementedError))) is None
+        assert get_sfp_bus(object()) is None
+
+
+class TestSfputilConcurrentRead(object):
+    def setup_method(self):
+        MockSfp.active = MockSfp.max_active = 0
+
+    @patch('sfputil.main.platform_sfputil', make_sfputil_helper(NUM_PORTS))
+    def test_show_presence_concurrent(self):
+        with patch('sfputil.main.platform_chassis', make_chassis({i + 1: MockSfp(i) for i in range(NUM_PORTS)})):
+            runner = CliRunner()
+            result = runner.invoke(sfputil.cli.commands['show'].commands['presence'], ['--workers', '16'])
+
+        assert result.exit_code == 0
+        lines = result.output.splitlines()
+        assert len(lines) == NUM_PORTS + 2
+        assert lines[2].split() == ['Ethernet0', 'Present']
+        assert lines[3].split() == ['Ethernet8', 'Not', 'present']
+        assert lines[-1].split() == ['Ethernet{}'.format((NUM_PORTS - 1) * 8), 'Not', 'present']
+        assert MockSfp.max_active == 16
+
+    @patch('sfputil.main.platform_sfputil', make_sfputil_helper(4))
+    def test_show_presence_serial_by_default(self):
+        sfps = {i + 1: MockSfp(i, latency=0.01) for i in range(4)}
+        with patch('sfputil.main.platform_chassis', make_chassis(sfps)), \
+                patch('sfputil.main.PortReader', wraps=PortReader) as mock_reader:
+            runner = CliRunner()
+            result = runner.invoke(sfputil.cli.commands['show'].commands['presence'])
+
+        assert result.exit_code == 0
+        assert MockSfp.max_active == 1
+        # The reads don't time out by default
+        assert mock_reader.call_args[1]['timeout'] == 0
+
+    @patch('sfputil.main.platform_sfputil', make_sfputil_helper(4))
+    def test_show_lpmode_errors(self):
+        sfps = {1: MockSfp(0), 2: MockSfp(1, latency=5), 3: MockSfp(2, error=RuntimeError('I2C read failed')),
+                4: MockSfp(3)}
+        with patch('sfputil.main.platform_chassis', make_chassis(sfps)):
+            runner = CliRunner()
+            result = runner.invoke(sfputil.cli.commands['show'].commands['lpmode'],
+                                   ['--workers', '4', '--timeout', '1'])
+
+        assert result.exit_code == 0
+        assert result.output == """\
+Port        Low-power Mode
+----------  --------------------------------
+Ethernet0   On
+Ethernet8   Error: timed out after 1 seconds
+Ethernet16  Error: I2C read failed
+Ethernet24  Off
+"""
+
+    @patch('sfputil.main.platform_sfputil', make_sfputil_helper(4))
+    @patch('sfputil.main.convert_sfp_info_to_output_string', MagicMock(return_value='        Identifier: QSFP-DD\n'))
+    def test_show_eeprom_port_order(self):
+        sfps = {i + 1: MockSfp(i, latency=0.05 * (4 - i)) for i in range(4)}
+        with patch('sfputil.main.platform_chassis', make_chassis(sfps)):
+            runner = CliRunner()
+            result = runner.invoke(sfputil.cli.commands['show'].commands['eeprom'],
+                                   ['--workers', '4', '--bus-limit', '1'])
+
+        assert result.exit_code == 0
+        assert result.output == """\
+Ethernet0: SFP EEPROM detected
+        Identifier: QSFP-DD
+
+Ethernet8: SFP EEPROM not detected
+
+Ethernet16: SFP EEPROM detected
+        Identifier: QSFP-DD
+
+Ethernet24: SFP EEPROM not detected
+
+
+"""
+        # Ports 0 and 2 are on i2c-0, ports 1 and 3 are on i2c-1
+        assert MockSfp.max_active == 2
+
+    @patch('sfputil.main.platform_sfputil', make_sfputil_helper(4))
+    def test_show_presence_not_implemented(self):
+        sfps = {i + 1: MockSfp(i) for i in range(4)}
+        sfps[3] = MockSfp(2, error=NotImplementedError)
+        with patch('sfputil.main.platform_chassis', make_chassis(sfps)):
+            runner = CliRunner()
+            result = runner.invoke(sfputil.cli.commands['show'].commands['presence'])
+
+        assert result.exit_code == sfputil.ERROR_NOT_IMPLEMENTED
+        assert result.output == "This functionality is currently not implemented for this platform\n"
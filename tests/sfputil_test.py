@@ -1204,7 +1204,7 @@ EEPROM hexdump for port Ethernet4
     @patch('sfputil.main.logical_port_to_physical_port_index', MagicMock(return_value=1))
     @patch('sfputil.main.update_firmware_info_to_state_db', MagicMock())
     def test_download_firmware(self, mock_chassis, mock_file):
-        mock_file.return_value.tell.return_value = 0
+        mock_file.return_value.__enter__.return_value.read.return_value = b''
         mock_sfp = MagicMock()
         mock_api = MagicMock()
         mock_sfp.get_xcvr_api = MagicMock(return_value=mock_api)
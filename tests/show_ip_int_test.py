@@ -154,3 +154,52 @@ class TestMultiAsicShowIpInt(object):
         return_code, result = get_result_and_return_code(['ipintutil', '-a', 'ipv5'])
         assert return_code == 1
         assert result == show_error_invalid_af
+
+
+@pytest.mark.skipif(os.geteuid() != 0, reason="creating network namespaces requires root")
+class TestIpIntLinkStates(object):
+    namespace = "ipintutil_bench"
+    num_intfs = 500
+
+    @pytest.fixture(scope="class", autouse=True)
+    def netns(self):
+        import pyroute2
+        from pyroute2.netlink.exceptions import NetlinkError
+
+        pyroute2.netns.create(self.namespace)
+        try:
+            with pyroute2.NetNS(self.namespace) as ipr:
+                try:
+                    ipr.link('add', ifname='dummy0', kind='dummy')
+                except NetlinkError as e:
+                    pytest.skip("dummy interfaces are not supported: {}".format(e))
+                ipr.link('add', ifname='br0', kind='bridge')
+                br_index = ipr.link_lookup(ifname='br0')[0]
+                for i in range(1, self.num_intfs):
+                    ipr.link('add', ifname='dummy{}'.format(i), kind='dummy')
+                for i in range(self.num_intfs):
+                    index = ipr.link_lookup(ifname='dummy{}'.format(i))[0]
+                    if i % 10 == 0:
+                        ipr.link('set', index=index, master=br_index)
+                    if i % 2 == 0:
+                        ipr.link('set', index=index, state='up')
+            yield
+        finally:
+            pyroute2.netns.remove(self.namespace)
+
+    def test_link_states(self):
+        from utilities_common import multi_asic as multi_asic_util
+
+        link_states = multi_asic_util.multi_asic_get_link_states_from_ns(self.namespace)
+
+        for i in range(self.num_intfs):
+            state = link_states['dummy{}'.format(i)]
+            assert bool(state['flags'] & 0x1) == (i % 2 == 0)
+            if i % 2 == 0:
+                assert state['carrier'] == 1
+            assert state['master'] == ('br0' if i % 10 == 0 else '')
+
+    def test_link_states_no_namespace(self):
+        from utilities_common import multi_asic as multi_asic_util
+
+        assert multi_asic_util.multi_asic_get_link_states_from_ns("no_such_ns") == {}
@@ -80,3 +80,41 @@ class TestValidatedConfigDBConnector(TestCase):
                     validated_config_db_connector.ValidatedConfigDBConnector.apply_patch(mock.Mock(), SAMPLE_PATCH, SAMPLE_TABLE)
                 except Exception as ex:
                     assert False, "Exception {} thrown unexpectedly".format(ex)
+
+    def test_set_entries(self):
+        mock_generic_updater = mock.Mock()
+        entries = {
+            ('Vlan1000', 'Ethernet0'): {'tagging_mode': 'tagged'},
+            ('Vlan1000', 'Ethernet4'): None
+        }
+        with mock.patch('validated_config_db_connector.device_info.is_yang_config_validation_enabled',
+                        return_value=True), \
+                mock.patch('validated_config_db_connector.GenericUpdater', return_value=mock_generic_updater):
+            connector = ValidatedConfigDBConnector(mock.Mock())
+            connector.get_table = mock.Mock(return_value={})
+            connector.set_entries('VLAN_MEMBER', entries)
+
+        # All the entries are validated and applied as one patch
+        expected_gcu_patch = jsonpatch.JsonPatch([
+            {"op": "add", "path": "/VLAN_MEMBER", "value": {}},
+            {"op": "add", "path": "/VLAN_MEMBER/Vlan1000|Ethernet0", "value": {"tagging_mode": "tagged"}},
+            {"op": "remove", "path": "/VLAN_MEMBER/Vlan1000|Ethernet4"}
+        ])
+        mock_generic_updater.apply_patch.assert_called_once()
+        assert mock_generic_updater.apply_patch.call_args[1]['patch'] == expected_gcu_patch
+
+    def test_set_entries_yang_disabled(self):
+        mock_connector = mock.Mock()
+        mock_connector.get_table.return_value = {('Vlan1000', 'Ethernet4'): {'tagging_mode': 'untagged'}}
+        entries = {
+            ('Vlan1000', 'Ethernet0'): {'tagging_mode': 'tagged'},
+            ('Vlan1000', 'Ethernet4'): {'tagging_mode': 'tagged'}
+        }
+        with mock.patch('validated_config_db_connector.device_info.is_yang_config_validation_enabled',
+                        return_value=False), \
+                mock.patch('validated_config_db_connector.bulk_set_entries') as mock_bulk_set_entries:
+            ValidatedConfigDBConnector(mock_connector).set_entries('VLAN_MEMBER', entries)
+
+        mock_bulk_set_entries.assert_called_once_with(
+            mock_connector, 'VLAN_MEMBER', entries,
+            current={('Vlan1000', 'Ethernet4'): {'tagging_mode': 'untagged'}})
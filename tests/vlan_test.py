@@ -5,6 +5,7 @@ from unittest import mock
 from click.testing import CliRunner
 
 import config.main as config
+import config.validated_config_db_connector as validated_config_db_connector
 
 import show.main as show
 from utilities_common.db import Db
@@ -1046,6 +1047,58 @@ class TestVlan(object):
         assert result.exit_code == 0
         assert result.output == show_vlan_brief_output
 
+    def test_config_add_del_vlan_member_range_multiple_ports(self, mock_restart_dhcp_relay_service):
+        runner = CliRunner()
+        db = Db()
+        vlan_members = [('Vlan{}'.format(vid), port)
+                        for vid in range(1001, 1011) for port in ['Ethernet20', 'Ethernet24']]
+
+        result = runner.invoke(config.config.commands["vlan"].commands["add"], ["1001-1010", "--multiple"], obj=db)
+        print(result.exit_code)
+        print(result.output)
+        assert result.exit_code == 0
+
+        # The whole range is validated before anything is written
+        result = runner.invoke(config.config.commands["vlan"].commands["member"].commands["add"],
+                               ["1001-1011", "Ethernet20,Ethernet24", "--multiple"], obj=db)
+        print(result.exit_code)
+        print(result.output)
+        assert result.exit_code != 0
+        assert "Error: Vlan1011 does not exist" in result.output
+        assert not set(vlan_members) & set(db.cfgdb.get_table('VLAN_MEMBER'))
+
+        # All the members of all the ports are written at once
+        with mock.patch('config.validated_config_db_connector.bulk_set_entries',
+                        wraps=validated_config_db_connector.bulk_set_entries) as mock_bulk_set_entries:
+            result = runner.invoke(config.config.commands["vlan"].commands["member"].commands["add"],
+                                   ["1001-1010", "Ethernet20,Ethernet24", "--multiple"], obj=db)
+        print(result.exit_code)
+        print(result.output)
+        assert result.exit_code == 0
+        mock_bulk_set_entries.assert_called_once()
+        vlan_member_table = db.cfgdb.get_table('VLAN_MEMBER')
+        for vlan_member in vlan_members:
+            assert vlan_member_table[vlan_member] == {'tagging_mode': 'tagged'}
+
+        result = runner.invoke(config.config.commands["vlan"].commands["member"].commands["add"],
+                               ["1005", "Ethernet24"], obj=db)
+        print(result.exit_code)
+        print(result.output)
+        assert result.exit_code != 0
+        assert "Error: Ethernet24 is already a member of Vlan1005" in result.output
+
+        result = runner.invoke(config.config.commands["vlan"].commands["member"].commands["del"],
+                               ["1001-1010", "Ethernet20,Ethernet24", "--multiple"], obj=db)
+        print(result.exit_code)
+        print(result.output)
+        assert result.exit_code == 0
+        assert not set(vlan_members) & set(db.cfgdb.get_table('VLAN_MEMBER'))
+
+        result = runner.invoke(config.config.commands["vlan"].commands["del"], ["1001-1010", "--multiple"], obj=db)
+        print(result.exit_code)
+        print(result.output)
+        assert result.exit_code == 0
+
     def test_config_add_del_add_vlans_and_add_vlans_member_except_vlan(self, mock_restart_dhcp_relay_service):
         runner = CliRunner()
         db = Db()
@@ -1,4 +1,5 @@
 import copy
+import fnmatch
 import json
 import os
 import sys
@@ -8,6 +9,7 @@ import pytest
 
 sys.path.append("scripts")
 import vnet_route_check
+from utilities_common.bulk_db import BULK_CHUNK_SIZE
 
 DESCR = "Description"
 ARGS = "args"
@@ -36,8 +38,6 @@ current_test_name = None
 current_test_no = None
 current_test_data = None
 
-tables_returned = {}
-
 test_data = {
     "0": {
         DESCR: "All VNET routes are configured in both APP and ASIC DBs",
@@ -647,70 +647,125 @@ test_data = {
 
 def do_start_test(tname, tno, ctdata):
     global current_test_name, current_test_no, current_test_data
-    global tables_returned
+    global clients_returned
 
     current_test_name = tname
     current_test_no = tno
     current_test_data = ctdata
-    tables_returned = {}
+    clients_returned = []
 
     print("Starting test case {} number={}".format(tname, tno))
 
 
-class Table:
-    def __init__(self, db, tbl):
-        self.db = db
-        self.tbl = tbl
-        self.data = copy.deepcopy(self.get_val(current_test_data[PRE], [db, tbl]))
+class MockRedisPipeline:
+    def __init__(self, client):
+        self.client = client
+        self.commands = []
+
+    def hgetall(self, key):
+        self.commands.append(lambda: self.client.get_entry(key))
 
-    def get_val(self, d, keys):
-        for k in keys:
-            d = d[k] if k in d else {}
-        return d
+    def hmget(self, key, fields):
+        self.commands.append(lambda: [self.client.get_entry(key).get(field) for field in fields])
 
-    def getKeys(self):
-        return list(self.data.keys())
+    def execute(self):
+        self.client.round_trips += 1
+        return [command() for command in self.commands]
 
-    def get(self, key):
-        result = self.data.get(key)
-        if result:
-            ret = copy.deepcopy(result)
-            return (True, ret)
-        else:
-            ret = copy.deepcopy(self.data)
-            return (False, ret)
+
+class MockRedisClient:
+    def __init__(self, db, data=None):
+        self.db = db
+        self.round_trips = 0
+        self.data = {}
+        sep = '|' if db == STATE_DB else ':'
+        pre = data if data is not None else current_test_data[PRE]
+        for tbl, entries in pre.get(db, {}).items():
+            if db == CNTR_DB:
+                # COUNTERS_DB name maps are plain hashes
+                self.data[tbl] = dict(entries)
+                continue
+            for key, fvs in entries.items():
+                # Redis can't hold empty hashes, SONiC stores them as NULL:NULL
+                self.data[tbl + sep + key] = dict(fvs) or {"NULL": "NULL"}
+
+    def get_entry(self, key):
+        return copy.deepcopy(self.data.get(key, {}))
+
+    def keys(self, pattern):
+        self.round_trips += 1
+        return [key for key in self.data if fnmatch.fnmatchcase(key, pattern)]
+
+    def hgetall(self, key):
+        self.round_trips += 1
+        return self.get_entry(key)
+
+    def pipeline(self, transaction=True):
+        return MockRedisPipeline(self)
 
 
 db_conns = {"APPL_DB": APPL_DB, "ASIC_DB": ASIC_DB, "COUNTERS_DB": CNTR_DB, "STATE_DB": STATE_DB}
+clients_returned = []
 
 
-def conn_side_effect(arg, _, __):
-    return db_conns[arg]
+class MockSonicV2Connector:
+    APPL_DB = "APPL_DB"
+    ASIC_DB = "ASIC_DB"
+    COUNTERS_DB = "COUNTERS_DB"
+    STATE_DB = "STATE_DB"
 
+    def __init__(self, **kwargs):
+        self.clients = {}
 
-def table_side_effect(db, tbl):
-    if not db in tables_returned:
-        tables_returned[db] = {}
-    if not tbl in tables_returned[db]:
-        tables_returned[db][tbl] = Table(db, tbl)
-    return tables_returned[db][tbl]
+    def connect(self, db_name):
+        client = MockRedisClient(db_conns[db_name])
+        clients_returned.append(client)
+        self.clients[db_name] = client
 
+    def get_redis_client(self, db_name):
+        return self.clients[db_name]
 
-class mock_db_conn:
-    def __init__(self, db):
-        self.db_name = None
-        for (k, v) in db_conns.items():
-            if v == db:
-                self.db_name = k
-        assert self.db_name != None
 
-    def getDbName(self):
-        return self.db_name
+def set_mock(mock_db, mock_run, sdk_res=None):
+    mock_db.side_effect = MockSonicV2Connector
+    mock_run.return_value = MagicMock(returncode=0, stdout=json.dumps(sdk_res or {}))
 
 
-def set_mock(mock_table, mock_conn):
-    mock_conn.side_effect = conn_side_effect
-    mock_table.side_effect = table_side_effect
+def gen_scale_test_data(num_routes):
+    app_routes = {}
+    asic_routes = {}
+    route_states = {}
+    for i in range(num_routes):
+        prefix = "{}.{}.{}.0/24".format(10 + i // 65536, (i // 256) % 256, i % 256)
+        app_routes["Vnet1:" + prefix] = {"ifname": "Vlan3001"}
+        asic_routes[RT_ENTRY_KEY_PREFIX + prefix + RT_ENTRY_KEY_SUFFIX] = {}
+        route_states["Vnet1|" + prefix] = {"active_endpoints": "", "state": "active"}
+
+    return {
+        APPL_DB: {
+            VNET_TABLE: {
+                "Vnet1": {"vxlan_tunnel": "tunnel_v4", "vni": "10001"}
+            },
+            INTF_TABLE: {
+                "Vlan3001": {"vnet_name": "Vnet1"},
+                "Vlan3001:30.1.10.1/24": {}
+            },
+            VNET_ROUTE_TABLE: app_routes
+        },
+        ASIC_DB: {
+            ASIC_STATE: dict(asic_routes, **{
+                "SAI_OBJECT_TYPE_ROUTER_INTERFACE:oid:0x6000000000d76": {
+                    "SAI_ROUTER_INTERFACE_ATTR_VIRTUAL_ROUTER_ID": "oid:0x3000000000d4b"
+                }
+            })
+        },
+        CNTR_DB: {
+            "COUNTERS_RIF_NAME_MAP": {"Vlan3001": "oid:0x6000000000d76"}
+        },
+        STATE_DB: {
+            VNET_ROUTE_TUNNEL_TABLE: route_states
+        }
+    }
 
 
 class TestVnetRouteCheck(object):
@@ -720,13 +775,13 @@ class TestVnetRouteCheck(object):
     def init(self):
         vnet_route_check.UNIT_TESTING = 1
 
-    @patch("vnet_route_check.swsscommon.DBConnector")
-    @patch("vnet_route_check.swsscommon.Table")
-    def test_vnet_route_check(self, mock_table, mock_conn):
+    @patch("vnet_route_check.subprocess.run")
+    @patch("vnet_route_check.SonicV2Connector")
+    def test_vnet_route_check(self, mock_db, mock_run):
         self.init()
         ret = 0
 
-        set_mock(mock_table, mock_conn)
+        set_mock(mock_db, mock_run)
         for (i, ct_data) in test_data.items():
             do_start_test("route_test", i, ct_data)
 
@@ -746,3 +801,41 @@ class TestVnetRouteCheck(object):
                     print("expect_res={}".format(json.dumps(expect_res, indent=4)))
                 assert ret == expect_ret
                 assert res == expect_res
+
+    @patch("vnet_route_check.subprocess.run")
+    @patch("vnet_route_check.SonicV2Connector")
+    def test_vnet_route_check_scale(self, mock_db, mock_run):
+        self.init()
+        num_routes = 20000
+
+        do_start_test("route_scale_test", 0, {PRE: gen_scale_test_data(num_routes)})
+        set_mock(mock_db, mock_run)
+
+        with patch('sys.argv', ["vnet_route_check"]):
+            ret = vnet_route_check.main()
+
+        assert ret == 0
+        # All tables are read in bulk, round trips don't grow per route
+        round_trips = sum(client.round_trips for client in clients_returned)
+        assert round_trips <= 2 * (num_routes // BULK_CHUNK_SIZE) + 20
+
+    @patch("vnet_route_check.subprocess.run")
+    @patch("vnet_route_check.SonicV2Connector")
+    def test_vnet_route_check_sdk(self, mock_db, mock_run):
+        self.init()
+        do_start_test("route_sdk_test", 0, test_data["0"])
+        set_mock(mock_db, mock_run, sdk_res={"Vnet1": 1})
+
+        with patch('sys.argv', ["vnet_route_check"]):
+            ret, res = vnet_route_check.main()
+
+        assert ret == -1
+        assert res == {"results": {"missed_in_sdk_routes": {"Vnet1": {"routes": 1}}}}
+        # syncd is entered once for all VNETs
+        mock_run.assert_called_once()
+        args, kwargs = mock_run.call_args
+        assert args[0][:5] == ['docker', 'exec', '-i', 'syncd', 'python3']
+        assert args[0][-1] == vnet_route_check.SDK_CHECK_SCRIPT
+        request = json.loads(kwargs["input"])
+        assert list(request) == ["Vnet1"]
+        assert request["Vnet1"][0] == "oid:0x3000000000d4b"
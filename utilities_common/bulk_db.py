@@ -0,0 +1,333 @@
+"""
+Bulk readers and writers for redis hash tables.
+
+Most of the CLI tools read a table by KEYS followed by one HGETALL per key,
+which costs one redis round trip per entry. The helpers below read all the
+matched entries with a server side Lua script executed by EVALSHA, one call
+per chunk of keys, and fall back to pipelined HGETALL/HMGET when scripting
+is not available (e.g. the unit test mock DB).
+
+Usage:
+    db = SonicV2Connector(use_unix_socket_path=True)
+    db.connect(db.ASIC_DB)
+    fdb_entries = bulk_get_all(db, db.ASIC_DB, 'ASIC_STATE:SAI_OBJECT_TYPE_FDB_ENTRY:*',
+                               fields=['SAI_FDB_ENTRY_ATTR_BRIDGE_PORT_ID'])
+
+bulk_set_entries() writes CONFIG_DB entries with pipelines, one call per
+chunk of entries instead of one set_entry() per entry, bulk_delete_tables()
+deletes whole tables with one DEL per chunk of keys.
+
+TableSnapshot wraps a connector for the tools which read a few fields of
+every entry of a table one HGET at a time, see its docstring.
+"""
+
+import fnmatch
+
+import redis
+from swsscommon.swsscommon import SonicDBConfig
+
+# Number of keys read by one EVALSHA or one pipeline execution.
+# Bounds the time redis is blocked by the script on huge tables.
+BULK_CHUNK_SIZE = 1000
+
+BULK_READ_SCRIPT = """
+-- this script reads hash entries of the given keys in one call
+--
+-- KEYS - keys to read
+-- ARGV - fields to read, all the fields are read if no field is given
+--
+-- Returns a list of {field_1, value_1, field_2, value_2, ...} in KEYS order,
+-- missing keys and keys of non-hash type are returned as empty lists
+
+local result = {}
+
+for i, key in ipairs(KEYS) do
+    local fvs = {}
+    if redis.call('TYPE', key)['ok'] == 'hash' then
+        if #ARGV == 0 then
+            fvs = redis.call('HGETALL', key)
+        else
+            local values = redis.call('HMGET', key, unpack(ARGV))
+            for j, value in ipairs(values) do
+                if value then
+                    fvs[#fvs + 1] = ARGV[j]
+                    fvs[#fvs + 1] = value
+                end
+            end
+        end
+    end
+    result[i] = fvs
+end
+
+return result
+"""
+
+# Caches redis-py clients by (namespace, db name) and registered scripts by client
+_redis_clients = {}
+_read_scripts = {}
+
+
+def _get_namespace(db):
+    namespace = getattr(db, 'namespace', None)
+    if namespace is None and hasattr(db, 'getNamespace'):
+        namespace = db.getNamespace()
+    return namespace or ''
+
+
+def get_redis_client(db, db_name):
+    """
+    Returns redis-py compatible client for the given DB of a SonicV2Connector
+
+    Args:
+        db: connected SonicV2Connector
+        db_name: DB name, e.g. 'ASIC_DB'
+
+    Returns:
+        client which supports pipeline(), keys(), hgetall() and hmget()
+    """
+    client = db.get_redis_client(db_name)
+    if hasattr(client, 'pipeline'):
+        return client
+
+    # swsscommon DBConnector doesn't support pipelines and scripts,
+    # open a redis-py connection to the same DB instead.
+    namespace = _get_namespace(db)
+    if (namespace, db_name) not in _redis_clients:
+        _redis_clients[namespace, db_name] = redis.Redis(
+            unix_socket_path=SonicDBConfig.getDbSock(db_name, namespace),
+            db=SonicDBConfig.getDbId(db_name, namespace),
+            decode_responses=True)
+    return _redis_clients[namespace, db_name]
+
+
+def _get_read_script(client):
+    if id(client) not in _read_scripts:
+        # register_script() computes the SHA1 locally, the script is sent to
+        # redis with SCRIPT LOAD only when EVALSHA reports it is not cached yet.
+        _read_scripts[id(client)] = (client, client.register_script(BULK_READ_SCRIPT))
+    return _read_scripts[id(client)][1]
+
+
+def _chunks(keys, chunk_size):
+    for i in range(0, len(keys), chunk_size):
+        yield keys[i:i + chunk_size]
+
+
+def _to_dict(fvs):
+    return dict(zip(fvs[0::2], fvs[1::2]))
+
+
+def _read_chunk_scripted(client, keys, fields):
+    script = _get_read_script(client)
+    return [_to_dict(fvs) for fvs in script(keys=keys, args=fields, client=client)]
+
+
+def _read_chunk_pipelined(client, keys, fields):
+    pipe = client.pipeline(transaction=False)
+    for key in keys:
+        if fields:
+            pipe.hmget(key, fields)
+        else:
+            pipe.hgetall(key)
+
+    entries = []
+    for values in pipe.execute():
+        if fields:
+            entries.append({field: value for field, value in zip(fields, values) if value is not None})
+        else:
+            entries.append(dict(values or {}))
+    return entries
+
+
+def bulk_get_entries(db, db_name, keys, fields=None, chunk_size=BULK_CHUNK_SIZE):
+    """
+    Read hash entries of the given keys in bulk
+
+    Args:
+        db: connected SonicV2Connector
+        db_name: DB name, e.g. 'ASIC_DB'
+        keys: list of redis keys to read
+        fields: optional list of fields to read, all the fields are read if not given
+        chunk_size: number of keys read by one redis call
+
+    Returns:
+        dict: {key: {field: value}}, missing keys are not included
+    """
+    keys = list(keys)
+    fields = list(fields) if fields else []
+    if not keys:
+        return {}
+
+    client = get_redis_client(db, db_name)
+    scripted = isinstance(client, redis.Redis)
+
+    entries = {}
+    for chunk in _chunks(keys, chunk_size):
+        values = None
+        if scripted:
+            try:
+                values = _read_chunk_scripted(client, chunk, fields)
+            except redis.exceptions.ResponseError:
+                # Scripting is disabled or not supported, use pipelines from now on
+                scripted = False
+        if values is None:
+            values = _read_chunk_pipelined(client, chunk, fields)
+
+        for key, fvs in zip(chunk, values):
+            if fvs:
+                entries[key] = fvs
+
+    return entries
+
+
+def bulk_get_all(db, db_name, pattern, fields=None, chunk_size=BULK_CHUNK_SIZE):
+    """
+    Read all the hash entries which keys match the pattern in bulk
+
+    Args:
+        db: connected SonicV2Connector
+        db_name: DB name, e.g. 'ASIC_DB'
+        pattern: glob-style key pattern, e.g. 'ASIC_STATE:SAI_OBJECT_TYPE_FDB_ENTRY:*'
+        fields: optional list of fields to read, all the fields are read if not given
+        chunk_size: number of keys read by one redis call
+
+    Returns:
+        dict: {key: {field: value}}
+    """
+    client = get_redis_client(db, db_name)
+    keys = client.keys(pattern) or []
+    return bulk_get_entries(db, db_name, keys, fields, chunk_size)
+
+
+def bulk_set_entries(configdb, table, entries, current=None, chunk_size=BULK_CHUNK_SIZE):
+    """
+    Write entries of a CONFIG_DB table in bulk, as ConfigDBConnector.set_entry() does
+
+    Args:
+        configdb: connected ConfigDBConnector
+        table: table name
+        entries: {key: data} in the set_entry() format, the entry is deleted if data is None
+        current: optional {key: data} of the entries in the DB, the fields of an entry
+                 which are not in its new data are deleted
+        chunk_size: number of entries written by one redis call
+
+    Returns:
+        int: number of redis calls made
+    """
+    client = get_redis_client(configdb, configdb.CONFIG_DB)
+    current = current or {}
+    calls = 0
+    for chunk in _chunks(list(entries), chunk_size):
+        pipe = client.pipeline(transaction=False)
+        for key in chunk:
+            redis_key = '{}{}{}'.format(table, configdb.TABLE_NAME_SEPARATOR, configdb.serialize_key(key))
+            data = entries[key]
+            if data is None:
+                pipe.delete(redis_key)
+                continue
+            raw_data = configdb.typed_to_raw(data)
+            pipe.hset(redis_key, mapping=raw_data)
+            if current.get(key):
+                stale_fields = [field for field in configdb.typed_to_raw(current[key]) if field not in raw_data]
+                if stale_fields:
+                    pipe.hdel(redis_key, *stale_fields)
+        pipe.execute()
+        calls += 1
+    return calls
+
+
+def bulk_delete_tables(configdb, tables, chunk_size=BULK_CHUNK_SIZE):
+    """
+    Delete all the entries of CONFIG_DB tables in bulk, as ConfigDBConnector.delete_table() does
+
+    The keys of all the tables are listed by one pipeline and deleted by
+    one DEL per chunk of keys.
+
+    Args:
+        configdb: connected ConfigDBConnector
+        tables: list of table names
+        chunk_size: number of keys deleted by one redis call
+
+    Returns:
+        int: number of redis calls made
+    """
+    client = get_redis_client(configdb, configdb.CONFIG_DB)
+    pipe = client.pipeline(transaction=False)
+    for table in tables:
+        pipe.keys('{}{}*'.format(table, configdb.TABLE_NAME_SEPARATOR))
+    keys = [key for table_keys in pipe.execute() for key in table_keys or []]
+
+    calls = 1
+    for chunk in _chunks(keys, chunk_size):
+        client.delete(*chunk)
+        calls += 1
+    return calls
+
+
+class TableSnapshot(object):
+    """
+    Read-only SonicV2Connector view of tables read in bulk
+
+    A table is read whole with one KEYS and bulk reads the first time one of
+    its keys is accessed by get(), get_all() or keys(), later accesses are
+    served from memory. The other connector attributes (DB names, get_table()
+    of a ConfigDBConnector, etc.) are passed through to the wrapped connector.
+    round_trips counts the redis calls made.
+
+    Usage:
+        db = TableSnapshot(db)
+        oper_status = db.get(db.APPL_DB, 'PORT_TABLE:Ethernet0', 'oper_status')
+    """
+
+    def __init__(self, db):
+        self.db = db
+        self.tables = {}
+        self.round_trips = 0
+
+    def __getattr__(self, name):
+        if name == 'db':
+            raise AttributeError(name)
+        return getattr(self.db, name)
+
+    def _get_table(self, db_name, key):
+        """Return the entries of the table of the key, None if the key has no table name"""
+        separator = self.db.get_db_separator(db_name)
+        table, found, _ = key.partition(separator)
+        if not found or any(c in table for c in '*?['):
+            return None
+
+        if (db_name, table) not in self.tables:
+            keys = self.db.keys(db_name, table + separator + '*') or []
+            self.round_trips += 1 + (len(keys) + BULK_CHUNK_SIZE - 1) // BULK_CHUNK_SIZE
+            self.tables[db_name, table] = bulk_get_entries(self.db, db_name, keys)
+        return self.tables[db_name, table]
+
+    def get_all(self, db_name, key):
+        entries = self._get_table(db_name, key)
+        if entries is None:
+            self.round_trips += 1
+            return self.db.get_all(db_name, key)
+        return dict(entries.get(key, {}))
+
+    def get(self, db_name, key, field):
+        entries = self._get_table(db_name, key)
+        if entries is None:
+            self.round_trips += 1
+            return self.db.get(db_name, key, field)
+        return entries.get(key, {}).get(field)
+
+    def get_table(self, table):
+        """ConfigDBConnector.get_table() of the wrapped ConfigDBConnector"""
+        separator = self.db.get_db_separator(self.db.CONFIG_DB)
+        entries = self._get_table(self.db.CONFIG_DB, table + separator)
+        data = {}
+        for key, entry in entries.items():
+            data[self.db.deserialize_key(key.partition(separator)[2])] = self.db.raw_to_typed(entry)
+        return data
+
+    def keys(self, db_name, pattern='*'):
+        entries = self._get_table(db_name, pattern)
+        if entries is None:
+            self.round_trips += 1
+            return self.db.keys(db_name, pattern)
+        return [key for key in entries if fnmatch.fnmatchcase(key, pattern)]
@@ -15,6 +15,7 @@ from natsort import natsorted
 from sonic_py_common import multi_asic
 from utilities_common.db import Db
 from utilities_common.general import load_db_config
+from utilities_common.port_index import PortIndex
 VLAN_SUB_INTERFACE_SEPARATOR = '.'
 
 pass_db = click.make_pass_decorator(Db, ensure=True)
@@ -135,6 +136,7 @@ class InterfaceAliasConverter(object):
 
         if not self.port_dict:
             self.port_dict = {}
+        self.port_index = PortIndex(self.port_dict)
 
         for port_name in self.port_dict:
             try:
@@ -158,10 +160,9 @@ class InterfaceAliasConverter(object):
                 # interface_name holds the parent port name
                 interface_name = interface_name[:sub_intf_sep_idx]
 
-            for port_name in self.port_dict:
-                if interface_name == port_name:
-                    return self.port_dict[port_name]['alias'] if sub_intf_sep_idx == -1 \
-                            else self.port_dict[port_name]['alias'] + VLAN_SUB_INTERFACE_SEPARATOR + vlan_id
+            if self.port_index.has_name(interface_name):
+                alias = self.port_index.get_alias(interface_name)
+                return alias if sub_intf_sep_idx == -1 else alias + VLAN_SUB_INTERFACE_SEPARATOR + vlan_id
 
         # interface_name not in port_dict. Just return interface_name
         return interface_name if sub_intf_sep_idx == -1 else interface_name + VLAN_SUB_INTERFACE_SEPARATOR + vlan_id
@@ -179,9 +180,9 @@ class InterfaceAliasConverter(object):
                 # interface_alias holds the parent port alias
                 interface_alias = interface_alias[:sub_intf_sep_idx]
 
-            for port_name in self.port_dict:
-                if interface_alias == self.port_dict[port_name]['alias']:
-                    return port_name if sub_intf_sep_idx == -1 else port_name + VLAN_SUB_INTERFACE_SEPARATOR + vlan_id
+            port_name = self.port_index.get_name(interface_alias)
+            if port_name is not None:
+                return port_name if sub_intf_sep_idx == -1 else port_name + VLAN_SUB_INTERFACE_SEPARATOR + vlan_id
 
         # interface_alias not in port_dict. Just return interface_alias
         return interface_alias if sub_intf_sep_idx == -1 else interface_alias + VLAN_SUB_INTERFACE_SEPARATOR + vlan_id
@@ -576,7 +577,39 @@ def interface_has_mirror_config(mirror_table, interface_name):
     return False
 
 
-def print_output_in_alias_mode(output, index):
+class InterfaceNameTranslator(object):
+    """Translates SONiC interface names in a text to vendor-specific
+       interface aliases with one compiled regex.
+    """
+
+    def __init__(self, converter):
+        self.name_to_alias = {port_name: converter.name_to_alias(port_name)
+                              for port_name in converter.port_dict}
+        self.regex = None
+
+    def compile(self):
+        # Longer names first, so that the longest port name is matched at once.
+        # Port names are matched either at the start of a line or preceded immediately
+        # by whitespace and followed immediately by either the end of a line or whitespace
+        # or a comma followed by whitespace
+        port_names = sorted(self.name_to_alias, key=len, reverse=True)
+        return re.compile(r"(?<!\S)({})(?=$|,?\s)".format(
+            '|'.join(re.escape(port_name) for port_name in port_names)))
+
+    def get_alias(self, interface_name):
+        """Return vendor interface alias of the port or None"""
+        return self.name_to_alias.get(interface_name)
+
+    def translate(self, text):
+        """Replace all SONiC port names in the text with vendor aliases"""
+        if not self.name_to_alias:
+            return text
+        if self.regex is None:
+            self.regex = self.compile()
+        return self.regex.sub(lambda match: self.name_to_alias[match.group(1)], text)
+
+
+def print_output_in_alias_mode(output, index, translator=None):
     """Convert and print all instances of SONiC interface
        name to vendor-sepecific interface aliases.
     """
@@ -584,6 +617,9 @@ def print_output_in_alias_mode(output, index):
     alias_name = ""
     interface_name = ""
 
+    if translator is None:
+        translator = InterfaceNameTranslator(iface_alias_converter)
+
     # Adjust tabulation width to length of alias name
     if output.startswith("---"):
         word = output.split()
@@ -600,9 +636,7 @@ def print_output_in_alias_mode(output, index):
     if word:
         interface_name = word[index]
         interface_name = interface_name.replace(':', '')
-    for port_name in natsorted(list(iface_alias_converter.port_dict.keys())):
-        if interface_name == port_name:
-            alias_name = iface_alias_converter.port_dict[port_name]['alias']
+        alias_name = translator.get_alias(interface_name)
     if alias_name:
         if len(alias_name) < iface_alias_converter.alias_max_length:
             alias_name = alias_name.rjust(
@@ -621,6 +655,8 @@ def run_command_in_alias_mode(command, shell=False):
     else:
         command_str = command
     process = subprocess.Popen(command, text=True, shell=shell, stdout=subprocess.PIPE)
+    # Compile port name to alias translation once for all the output lines
+    translator = InterfaceNameTranslator(iface_alias_converter)
 
     while True:
         output = process.stdout.readline()
@@ -638,7 +674,7 @@ def run_command_in_alias_mode(command, shell=False):
                 if output.startswith("IFACE"):
                     output = output.replace("IFACE", "IFACE".rjust(
                                iface_alias_converter.alias_max_length))
-                print_output_in_alias_mode(output, index)
+                print_output_in_alias_mode(output, index, translator)
 
             elif command_str.startswith("intfstat"):
                 """Show RIF counters"""
@@ -646,7 +682,7 @@ def run_command_in_alias_mode(command, shell=False):
                 if output.startswith("IFACE"):
                     output = output.replace("IFACE", "IFACE".rjust(
                                iface_alias_converter.alias_max_length))
-                print_output_in_alias_mode(output, index)
+                print_output_in_alias_mode(output, index, translator)
 
             elif command_str == "pfcstat":
                 """Show pfc counters"""
@@ -658,12 +694,12 @@ def run_command_in_alias_mode(command, shell=False):
                 elif output.startswith("Port Rx"):
                     output = output.replace("Port Rx", "Port Rx".rjust(
                                 iface_alias_converter.alias_max_length))
-                print_output_in_alias_mode(output, index)
+                print_output_in_alias_mode(output, index, translator)
 
             elif (command_str.startswith("sudo sfputil show eeprom")):
                 """Show interface transceiver eeprom"""
                 index = 0
-                print_output_in_alias_mode(raw_output, index)
+                print_output_in_alias_mode(raw_output, index, translator)
 
             elif (command_str.startswith("sudo sfputil show")):
                 """Show interface transceiver lpmode,
@@ -673,7 +709,7 @@ def run_command_in_alias_mode(command, shell=False):
                 if output.startswith("Port"):
                     output = output.replace("Port", "Port".rjust(
                                iface_alias_converter.alias_max_length))
-                print_output_in_alias_mode(output, index)
+                print_output_in_alias_mode(output, index, translator)
 
             elif command_str == "sudo lldpshow":
                 """Show lldp table"""
@@ -681,7 +717,7 @@ def run_command_in_alias_mode(command, shell=False):
                 if output.startswith("LocalPort"):
                     output = output.replace("LocalPort", "LocalPort".rjust(
                                iface_alias_converter.alias_max_length))
-                print_output_in_alias_mode(output, index)
+                print_output_in_alias_mode(output, index, translator)
 
             elif command_str.startswith("queuestat"):
                 """Show queue counters"""
@@ -689,7 +725,7 @@ def run_command_in_alias_mode(command, shell=False):
                 if output.startswith("Port"):
                     output = output.replace("Port", "Port".rjust(
                                iface_alias_converter.alias_max_length))
-                print_output_in_alias_mode(output, index)
+                print_output_in_alias_mode(output, index, translator)
 
             elif command_str == "fdbshow":
                 """Show mac"""
@@ -700,21 +736,21 @@ def run_command_in_alias_mode(command, shell=False):
                                 'Type', '      Type', output)
                 elif output[0].isdigit():
                     output = "    " + output
-                print_output_in_alias_mode(output, index)
+                print_output_in_alias_mode(output, index, translator)
 
             elif command_str.startswith("nbrshow"):
                 """Show arp"""
                 index = 2
                 if "Vlan" in output:
                     output = output.replace('Vlan', '  Vlan')
-                print_output_in_alias_mode(output, index)
+                print_output_in_alias_mode(output, index, translator)
             elif command_str.startswith("sudo ipintutil"):
                 """Show ip(v6) int"""
                 index = 0
                 if output.startswith("Interface"):
                     output = output.replace("Interface", "Interface".rjust(
                         iface_alias_converter.alias_max_length))
-                print_output_in_alias_mode(output, index)
+                print_output_in_alias_mode(output, index, translator)
 
             else:
                 """
@@ -723,11 +759,7 @@ def run_command_in_alias_mode(command, shell=False):
                 whitespace and followed immediately by either the end of a line or whitespace
                 or a comma followed by whitespace
                 """
-                converted_output = raw_output
-                for port_name in iface_alias_converter.port_dict:
-                    converted_output = re.sub(r"(^|\s){}($|,{{0,1}}\s)".format(port_name),
-                                              r"\1{}\2".format(iface_alias_converter.name_to_alias(port_name)),
-                                              converted_output)
+                converted_output = translator.translate(raw_output)
                 click.echo(converted_output.rstrip('\n'))
 
     rc = process.poll()
@@ -187,3 +187,33 @@ def multi_asic_get_ip_intf_addr_from_ns(namespace, iface):
         pyroute2.netns.popns()
 
     return ipaddresses
+
+
+def multi_asic_get_link_states_from_ns(namespace):
+    """
+    Dump all the links of the namespace with one netlink request.
+    Returns {ifname: {'flags': flags, 'carrier': carrier, 'master': master ifname or ''}},
+    empty dict if the namespace doesn't exist
+    """
+    import pyroute2
+    if namespace != constants.DEFAULT_NAMESPACE:
+        if namespace not in pyroute2.netns.listnetns():
+            return {}
+        pyroute2.netns.pushns(namespace)
+
+    try:
+        # netlink socket is bound to the namespace it was created in
+        with pyroute2.IPRoute() as ipr:
+            links = ipr.get_links()
+    finally:
+        if namespace != constants.DEFAULT_NAMESPACE:
+            pyroute2.netns.popns()
+
+    names = {link['index']: link.get_attr('IFLA_IFNAME') for link in links}
+    return {
+        names[link['index']]: {
+            'flags': link['flags'],
+            'carrier': link.get_attr('IFLA_CARRIER'),
+            'master': names.get(link.get_attr('IFLA_MASTER'), '')
+        } for link in links
+    }
@@ -0,0 +1,149 @@
+"""
+Per-process index of the CONFIG_DB PORT table.
+
+Interface name/alias conversion used to read the whole PORT table and scan it
+on every call, which is quadratic for commands that convert a list or a range
+of ports. The index maps port name <-> alias <-> port index and is built once
+per CLI command and ASIC namespace: the cache lives in the root click context
+of the command, or in the process outside of a command. A cached index is
+reused as long as it was built from the same ConfigDBConnector, commands which
+add, delete or rename ports (e.g. dynamic port breakout) drop it with
+invalidate_port_index().
+
+Usage:
+    port_index = get_port_index(config_db)
+    name = port_index.get_name('etp1')
+"""
+
+import click
+from sonic_py_common import multi_asic
+from swsscommon.swsscommon import ConfigDBConnector
+
+from utilities_common.constants import DEFAULT_NAMESPACE
+
+PORT_TABLE = 'PORT'
+
+# Caches (config_db, PortIndex) and connectors by namespace, used outside of a CLI command
+_process_cache = {'port_indices': {}, 'config_dbs': {}}
+
+
+class PortIndex(object):
+    """Bidirectional port name/alias/index lookup built from a PORT table"""
+
+    def __init__(self, port_dict, namespace=DEFAULT_NAMESPACE):
+        self.namespace = namespace
+        self.port_dict = port_dict or {}
+        self.name_to_alias = {}
+        self.alias_to_name = {}
+        self.index_to_names = {}
+
+        for port_name, port in self.port_dict.items():
+            alias = port.get('alias')
+            self.name_to_alias[port_name] = alias
+            # The first port wins if an alias is duplicated, like the linear scan did
+            if alias is not None and alias not in self.alias_to_name:
+                self.alias_to_name[alias] = port_name
+            if 'index' in port:
+                self.index_to_names.setdefault(port['index'], []).append(port_name)
+
+    def __len__(self):
+        return len(self.port_dict)
+
+    def has_name(self, name):
+        return name in self.port_dict
+
+    def has_alias(self, alias):
+        return alias in self.alias_to_name
+
+    def get_alias(self, name):
+        """Return the alias of the port or None if the port or its alias doesn't exist"""
+        return self.name_to_alias.get(name)
+
+    def get_name(self, alias):
+        """Return the name of the port which has the alias or None"""
+        return self.alias_to_name.get(alias)
+
+    def get_names_by_index(self, index):
+        """Return the names of the ports which have the port index"""
+        return self.index_to_names.get(str(index), [])
+
+
+def _get_namespace(config_db):
+    namespace = getattr(config_db, 'namespace', None)
+    if namespace is None and hasattr(config_db, 'getNamespace'):
+        namespace = config_db.getNamespace()
+    return namespace or DEFAULT_NAMESPACE
+
+
+def _get_cache():
+    """Return the cache of the running CLI command, or the process cache outside of a command"""
+    ctx = click.get_current_context(silent=True)
+    if ctx is None:
+        return _process_cache
+    return ctx.find_root().meta.setdefault(__name__, {'port_indices': {}, 'config_dbs': {}})
+
+
+def get_config_db(namespace=DEFAULT_NAMESPACE):
+    """Return a connected ConfigDBConnector of the namespace shared by the lookups"""
+    config_dbs = _get_cache()['config_dbs']
+    if namespace not in config_dbs:
+        config_db = ConfigDBConnector(use_unix_socket_path=True, namespace=namespace)
+        config_db.connect()
+        config_dbs[namespace] = config_db
+    return config_dbs[namespace]
+
+
+def get_port_index(config_db=None, namespace=DEFAULT_NAMESPACE):
+    """
+    Return the PortIndex of CONFIG_DB PORT table
+
+    Args:
+        config_db: connected ConfigDBConnector, the shared connector of the namespace is used if None
+        namespace: namespace of the shared connector, ignored if config_db is given
+
+    Returns:
+        PortIndex, built on the first call of the command or after invalidate_port_index()
+    """
+    if config_db is None:
+        config_db = get_config_db(namespace)
+    else:
+        namespace = _get_namespace(config_db)
+
+    port_indices = _get_cache()['port_indices']
+    cached = port_indices.get(namespace)
+    if cached is None or cached[0] is not config_db:
+        cached = (config_db, PortIndex(config_db.get_table(PORT_TABLE), namespace))
+        port_indices[namespace] = cached
+
+    return cached[1]
+
+
+def invalidate_port_index(namespace=None):
+    """
+    Drop the cached index of the namespace, or of all the namespaces if None.
+    Must be called after the ports or their aliases are changed in CONFIG_DB.
+    """
+    port_indices = _get_cache()['port_indices']
+    if namespace is None:
+        port_indices.clear()
+    else:
+        port_indices.pop(namespace, None)
+
+
+def get_port_namespace(port, alias=False):
+    """
+    Return the ASIC namespace of the port or None if no namespace has it
+
+    Args:
+        port: port name, or port alias if alias is True
+    """
+    if not multi_asic.is_multi_asic():
+        return DEFAULT_NAMESPACE
+
+    ns_list = multi_asic.get_all_namespaces()
+    for namespace in ns_list['front_ns'] + ns_list['back_ns']:
+        port_index = get_port_index(namespace=namespace)
+        if port_index.has_alias(port) if alias else port_index.has_name(port):
+            return namespace
+
+    return None